@@ -7,9 +7,21 @@ from medperf.exceptions import (
     InvalidCertificateError,
     InvalidCertificateAuthorityError,
 )
+import base64
+import hashlib
 import logging
+import os
+from typing import List
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.x509.oid import NameOID
+from cryptography.x509.verification import PolicyBuilder, Store, VerificationError
 from medperf.enums import CryptoKeyType
 
+# Certificates verified during this process, keyed by
+# (certificate fingerprint, expected common name, CA fingerprint)
+_verified_certificates = set()
+
 
 def get_client_cert(ca: CA, email: str, output_path: str, key_type: CryptoKeyType):
     """Responsible for getting a user cert"""
@@ -93,6 +105,109 @@ def verify_certificate(
         raise InvalidCertificateError(f"Failed to verify the certificate: {str(e)}")
 
 
+def _certificate_fingerprint(certificate: Certificate) -> str:
+    certificate_bytes = base64.b64decode(certificate.certificate_content_base64)
+    return hashlib.sha256(certificate_bytes).hexdigest()
+
+
+def _load_ca_store(ca: CA, expected_fingerprint: str):
+    """Loads the CA root certificate written by the CA's `trust` task, i.e. the one
+    whose SHA-256 fingerprint is the expected one. Other certificates found in the CA
+    assets are not trusted. Returns None if the root wasn't found."""
+    expected_fingerprint = expected_fingerprint.replace(":", "").lower()
+    if not os.path.isdir(ca.pki_assets):
+        return
+    for filename in sorted(os.listdir(ca.pki_assets)):
+        path = os.path.join(ca.pki_assets, filename)
+        if not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            contents = f.read()
+        try:
+            certificates = x509.load_pem_x509_certificates(contents)
+        except ValueError:
+            logging.debug(f"Skipping non-certificate file {path}")
+            continue
+        for root in certificates:
+            if root.fingerprint(hashes.SHA256()).hex() == expected_fingerprint:
+                return Store([root])
+    logging.debug(f"The root certificate of CA {ca.id} was not found")
+
+
+def _verify_certificate_in_process(
+    store: Store, certificate: Certificate, expected_cn: str
+) -> bool:
+    """Verifies the certificate chain against the CA roots and checks its common name.
+    Returns False if the certificate couldn't be verified this way."""
+    certificate_bytes = base64.b64decode(certificate.certificate_content_base64)
+    try:
+        leaf, *intermediates = x509.load_pem_x509_certificates(certificate_bytes)
+        verifier = PolicyBuilder().store(store).build_client_verifier()
+        verifier.verify(leaf, intermediates)
+    except (ValueError, VerificationError) as e:
+        logging.debug(f"In-process verification of {certificate.id} failed: {e}")
+        return False
+    common_names = leaf.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
+    return expected_cn in [attribute.value for attribute in common_names]
+
+
+def verify_certificates(
+    certificates: List[Certificate], expected_cns: List[str], verify_ca: bool = True
+) -> List[bool]:
+    """Verifies many certificates, loading the root of each CA only once.
+    Certificates are first verified in-process against the configured CA root, as
+    fetched by the CA's `trust` task. Those that can't be verified this way (e.g. due
+    to a stricter verification profile, or a chain that doesn't lead to that root)
+    are verified by the CA container. Successful verifications
+    are remembered by certificate fingerprint for the rest of the process.
+
+    Args:
+        certificates (List[Certificate]): certificates to verify
+        expected_cns (List[str]): the expected common name of each certificate
+        verify_ca (bool): whether to verify the certificate authorities first
+
+    Returns:
+        List[bool]: whether each certificate is valid
+    """
+    cas = {}
+    stores = {}
+    results = []
+    for certificate, expected_cn in zip(certificates, expected_cns):
+        if certificate.ca not in cas:
+            ca = CA.get(certificate.ca)
+            if verify_ca:
+                verify_certificate_authority(
+                    ca, expected_fingerprint=config.certificate_authority_fingerprint
+                )
+            cas[certificate.ca] = ca
+            stores[certificate.ca] = _load_ca_store(
+                ca, config.certificate_authority_fingerprint
+            )
+        ca = cas[certificate.ca]
+        store = stores[certificate.ca]
+
+        key = (_certificate_fingerprint(certificate), expected_cn, ca.fingerprint)
+        if key in _verified_certificates:
+            logging.debug(f"Certificate {certificate.id} was already verified")
+            results.append(True)
+            continue
+
+        valid = store is not None and _verify_certificate_in_process(
+            store, certificate, expected_cn
+        )
+        if not valid:
+            try:
+                verify_certificate(certificate, expected_cn, verify_ca=False)
+                valid = True
+            except InvalidCertificateError:
+                logging.debug(f"Invalid Certificate: {certificate.id}")
+
+        if valid:
+            _verified_certificates.add(key)
+        results.append(valid)
+    return results
+
+
 def verify_certificate_authority_by_id(ca_id: int, expected_fingerprint: str):
     ca = CA.get(ca_id)
     verify_certificate_authority(ca, expected_fingerprint)
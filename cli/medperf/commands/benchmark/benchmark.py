@@ -161,6 +161,14 @@ def run(
         "--rerun-finalized",
         help="Execute even if results have been already uploaded (this will create new records)",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="""Number of models to execute concurrently.\n
+        If specific GPUs are given through --gpus (e.g. --gpus="device=0,1"),
+        they are split between the concurrent executions""",
+    ),
 ):
     """Runs the benchmark execution step for a given benchmark, prepared dataset and model"""
     BenchmarkExecution.run(
@@ -173,6 +181,7 @@ def run(
         show_summary=True,
         ignore_failed_experiments=True,
         rerun_finalized_executions=rerun_finalized,
+        jobs=jobs,
     )
     config.ui.print("✅ Done!")
 
@@ -0,0 +1,305 @@
+"""Streaming dataset archives.
+
+Archives are tar streams compressed by a multi-threaded external compressor when
+available (zstd, or pigz for gzip), so that compression runs in parallel with
+reading the files. The archive config is the first member, so that an archive can
+be extracted directly into its final destination while it is being read. Each file
+carries its sha256 hash in its PAX header, and a manifest of all the file hashes is
+the last member, so that extracted files can be verified, and files that already
+exist with the same content can be skipped.
+"""
+
+import gzip
+import hashlib
+import io
+import logging
+import os
+import shutil
+import subprocess
+import tarfile
+from contextlib import contextmanager
+from typing import Dict, List
+
+import yaml
+
+from medperf import config
+from medperf.exceptions import ExecutionError, InvalidArgumentError
+from medperf.utils import get_file_hash
+
+HASH_HEADER = "MEDPERF.sha256"
+COMPRESSIONS = ["gz", "zst"]
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _threads() -> int:
+    return config.dataset_archive_threads or os.cpu_count() or 1
+
+
+def _compress_command(compression: str):
+    if compression == "zst":
+        if shutil.which("zstd") is None:
+            raise ExecutionError("zstd must be installed to create .zst archives")
+        # zstd uses all cores with -T0
+        return ["zstd", "-q", "-c", f"-T{config.dataset_archive_threads}"]
+    if shutil.which("pigz") is not None:
+        return ["pigz", "-c", "-p", str(_threads())]
+    return None
+
+
+def _decompress_command(archive_path: str):
+    with open(archive_path, "rb") as f:
+        magic = f.read(len(ZSTD_MAGIC))
+    if magic == ZSTD_MAGIC:
+        if shutil.which("zstd") is None:
+            raise ExecutionError("zstd must be installed to extract .zst archives")
+        return ["zstd", "-q", "-d", "-c", archive_path]
+    if magic[:2] == b"\x1f\x8b" and shutil.which("pigz") is not None:
+        return ["pigz", "-q", "-d", "-c", archive_path]
+    return None
+
+
+@contextmanager
+def _through_process(command: List[str], partial: bool = False, **kwargs):
+    """Runs a (de)compression process, making sure it's stopped if reading or
+    writing its stream fails or if only part of its output is read, and checking
+    its exit code otherwise"""
+    process = subprocess.Popen(command, stderr=subprocess.PIPE, **kwargs)
+    try:
+        yield process
+    except BaseException:
+        process.kill()
+        process.communicate()
+        raise
+    if partial:
+        process.kill()
+        process.communicate()
+        return
+    _, errors = process.communicate()
+    if process.returncode != 0:
+        errors = errors.decode(errors="replace").strip()
+        raise ExecutionError(f"{command[0]} failed: {errors}")
+
+
+@contextmanager
+def _compressed_writer(archive_path: str, compression: str):
+    command = _compress_command(compression)
+    if command is None:
+        logging.debug("pigz is not installed. Compressing with a single thread")
+        with gzip.open(archive_path, "wb") as stream:
+            yield stream
+        return
+
+    logging.debug(f"Compressing with {command}")
+    with open(archive_path, "wb") as output:
+        with _through_process(command, stdin=subprocess.PIPE, stdout=output) as proc:
+            # The process input is closed once the archive is complete
+            yield proc.stdin
+
+
+@contextmanager
+def _decompressed_reader(archive_path: str, partial: bool):
+    command = _decompress_command(archive_path)
+    if command is None:
+        with open(archive_path, "rb") as stream:
+            yield stream
+        return
+
+    logging.debug(f"Decompressing with {command}")
+    with _through_process(command, partial, stdout=subprocess.PIPE) as proc:
+        yield proc.stdout
+
+
+@contextmanager
+def open_writer(archive_path: str, compression: str = "gz"):
+    """Opens a tar stream that is compressed into archive_path
+
+    Args:
+        archive_path (str): path of the archive to create
+        compression (str): "gz" or "zst"
+
+    Yields:
+        tarfile.TarFile: the tar stream
+    """
+    if compression not in COMPRESSIONS:
+        raise InvalidArgumentError(f"Compression should be one of {COMPRESSIONS}")
+    if os.path.exists(archive_path):
+        raise InvalidArgumentError(f"{archive_path} already exists.")
+
+    with _compressed_writer(archive_path, compression) as stream:
+        with tarfile.open(fileobj=stream, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+            yield tar
+
+
+@contextmanager
+def open_reader(archive_path: str, partial: bool = False):
+    """Opens the tar stream of a (possibly compressed) archive. Members can only be
+    read in order.
+
+    Args:
+        archive_path (str): path of the archive
+        partial (bool): whether only the first members will be read, in which case
+            decompression stops when the stream is closed
+
+    Yields:
+        tarfile.TarFile: the tar stream
+    """
+    with _decompressed_reader(archive_path, partial) as stream:
+        try:
+            with tarfile.open(fileobj=stream, mode="r|*") as tar:
+                yield tar
+        except tarfile.TarError as e:
+            raise ExecutionError(f"Cannot extract archive, {e}")
+
+
+def add_bytes(tar: tarfile.TarFile, name: str, content: bytes):
+    info = tarfile.TarInfo(name)
+    info.size = len(content)
+    tar.addfile(info, io.BytesIO(content))
+
+
+def add_path(tar: tarfile.TarFile, path: str, arcname: str, manifest: Dict[str, str]):
+    """Adds a file or folder to the archive, recording the hash of each file in its
+    header and in the manifest"""
+
+    def add_hash(info: tarfile.TarInfo):
+        # Hard links carry the hash of the file they link to
+        if info.isfile() or info.islnk():
+            source = path
+            if info.name != arcname:
+                source = os.path.join(path, os.path.relpath(info.name, arcname))
+            file_hash = get_file_hash(source)
+            info.pax_headers = {HASH_HEADER: file_hash}
+            manifest[info.name] = file_hash
+        return info
+
+    tar.add(path, arcname=arcname, filter=add_hash)
+
+
+def add_manifest(tar: tarfile.TarFile, manifest: Dict[str, str]):
+    content = yaml.safe_dump(manifest).encode()
+    add_bytes(tar, config.dataset_archive_manifest_filename, content)
+
+
+def read_yaml_member(tar: tarfile.TarFile, member: tarfile.TarInfo):
+    return yaml.safe_load(tar.extractfile(member).read())
+
+
+def _member_destination(member: tarfile.TarInfo, destinations: Dict[str, str]):
+    parts = member.name.split("/")
+    if os.path.isabs(member.name) or ".." in parts or parts[0] not in destinations:
+        raise ExecutionError(f"Unexpected path in archive: {member.name}")
+    return os.path.join(destinations[parts[0]], *parts[1:])
+
+
+def _check_link_target(member: tarfile.TarInfo, path: str, destinations: Dict[str, str]):
+    """Makes sure a symlink member points inside the destination of its folder"""
+    root = os.path.realpath(destinations[member.name.split("/")[0]])
+    target = os.path.realpath(os.path.join(os.path.dirname(path), member.linkname))
+    if os.path.commonpath([root, target]) != root:
+        raise ExecutionError(
+            f"Unexpected link in archive: {member.name} -> {member.linkname}"
+        )
+
+
+def _extract_symlink(member: tarfile.TarInfo, path: str, destinations: Dict[str, str]):
+    if os.path.lexists(path):
+        return
+    _check_link_target(member, path, destinations)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.symlink(member.linkname, path)
+
+
+def _extract_hard_link(
+    member: tarfile.TarInfo, path: str, destinations: Dict[str, str], hashes: Dict[str, str]
+) -> str:
+    """Recreates a hard link member from the file it links to, which is extracted
+    before it, and returns the hash of that file"""
+    file_hash = hashes.get(member.linkname)
+    if file_hash is None:
+        raise ExecutionError(
+            f"Unexpected link in archive: {member.name} -> {member.linkname}"
+        )
+    expected_hash = member.pax_headers.get(HASH_HEADER)
+    if expected_hash is not None and file_hash != expected_hash:
+        raise ExecutionError(f"Hash mismatch for {member.name} in archive")
+    if os.path.isfile(path) and get_file_hash(path) == file_hash:
+        logging.debug(f"{path} is unchanged. Skipping")
+        return file_hash
+
+    target = _member_destination(tarfile.TarInfo(member.linkname), destinations)
+    if os.path.lexists(path):
+        os.remove(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        os.link(target, path)
+    except OSError:
+        # Top-level folders may be extracted to different file systems
+        shutil.copy2(target, path)
+    return file_hash
+
+
+def _extract_file(tar: tarfile.TarFile, member: tarfile.TarInfo, path: str) -> str:
+    """Writes a file member to path, and returns its hash. Files that already exist
+    with the expected content are kept as they are"""
+    expected_hash = member.pax_headers.get(HASH_HEADER)
+    if (
+        expected_hash is not None
+        and os.path.isfile(path)
+        and os.path.getsize(path) == member.size
+        and get_file_hash(path) == expected_hash
+    ):
+        logging.debug(f"{path} is unchanged. Skipping")
+        return expected_hash
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    sha = hashlib.sha256()
+    source = tar.extractfile(member)
+    with open(path, "wb") as f:
+        while True:
+            data = source.read(config.hash_chunk_size)
+            if not data:
+                break
+            sha.update(data)
+            f.write(data)
+    os.chmod(path, member.mode)
+    file_hash = sha.hexdigest()
+    if expected_hash is not None and file_hash != expected_hash:
+        raise ExecutionError(f"Hash mismatch for {member.name} in archive")
+    return file_hash
+
+
+def extract_members(tar: tarfile.TarFile, destinations: Dict[str, str]):
+    """Extracts the remaining members of the archive. Each top-level folder of the
+    archive is extracted to its destination, and files are verified against the
+    archive manifest. Only folders, files and links are supported.
+
+    Args:
+        tar (tarfile.TarFile): an archive opened with open_reader
+        destinations (Dict[str, str]): destination of each top-level folder
+    """
+    hashes = {}
+    manifest = None
+    for member in tar:
+        if member.name == config.archive_config_filename:
+            continue
+        if member.name == config.dataset_archive_manifest_filename:
+            manifest = read_yaml_member(tar, member)
+            continue
+        path = _member_destination(member, destinations)
+        if member.isdir():
+            os.makedirs(path, exist_ok=True)
+        elif member.isfile():
+            hashes[member.name] = _extract_file(tar, member, path)
+        elif member.islnk():
+            hashes[member.name] = _extract_hard_link(member, path, destinations, hashes)
+        elif member.issym():
+            _extract_symlink(member, path, destinations)
+        else:
+            raise ExecutionError(f"Unsupported member in archive: {member.name}")
+
+    if manifest is None:
+        raise ExecutionError("Dataset archive is invalid, manifest not found")
+    # The archive config is read before the other members
+    manifest.pop(config.archive_config_filename, None)
+    if hashes != manifest:
+        raise ExecutionError("Extracted files don't match the archive manifest")
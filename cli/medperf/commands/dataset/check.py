@@ -6,12 +6,12 @@ from medperf import config
 
 class DataCheck:
     @staticmethod
-    def run(dataset_uid: int):
+    def run(dataset_uid: int, full_rehash: bool = False):
         dataset = Dataset.get(dataset_uid)
         user_id = get_medperf_user_data()["id"]
         if dataset.owner != user_id:
             raise InvalidArgumentError("Only the dataset owner can check the hash.")
-        if dataset.check_hash():
+        if dataset.check_hash(full_rehash):
             config.ui.print("✅ Data hash matches the one registered on the server.")
         else:
             config.ui.print(
@@ -133,10 +133,15 @@ def prepare(
 @clean_except
 def check(
     data_uid: str = typer.Option(..., "--data_uid", "-d", help="Dataset UID"),
+    full_rehash: bool = typer.Option(
+        False,
+        "--full-rehash",
+        help="Hash every file again instead of reusing the hashes of unchanged files",
+    ),
 ):
     """Checks if the hash of the dataset matches the one registered the server"""
     ui = config.ui
-    DataCheck.run(data_uid)
+    DataCheck.run(data_uid, full_rehash=full_rehash)
     ui.print("✅ Done!")
 
 
@@ -147,10 +152,15 @@ def set_operational(
     approval: bool = typer.Option(
         False, "-y", help="Skip confirmation and statistics submission approval step"
     ),
+    full_rehash: bool = typer.Option(
+        False,
+        "--full-rehash",
+        help="Hash every file again instead of reusing the hashes of unchanged files",
+    ),
 ):
     """Marks a dataset as Operational"""
     ui = config.ui
-    DatasetSetOperational.run(data_uid, approved=approval)
+    DatasetSetOperational.run(data_uid, approved=approval, full_rehash=full_rehash)
     ui.print("✅ Done!")
 
 
@@ -256,7 +266,7 @@ def import_dataset(
         ...,
         "--input",
         "-i",
-        help="Path of the tar.gz file (dataset backup) to be imported.",
+        help="Path of the tar.gz or tar.zst file (dataset backup) to be imported.",
     ),
     raw_path: str = typer.Option(
         None,
@@ -281,7 +291,13 @@ def export_dataset(
         "-o",
         help="Path of the folder that will contain the tar.gz dataset backup.",
     ),
+    compression: str = typer.Option(
+        "gz",
+        "--compression",
+        help="Compression of the archive: 'gz' or 'zst'. Archives are compressed"
+        " with multiple threads if zstd or pigz are installed. 'zst' requires zstd",
+    ),
 ):
     """Exports dataset files to a tar.gz file in the specified output folder."""
-    ExportDataset.run(data_uid, output)
+    ExportDataset.run(data_uid, output, compression)
     config.ui.print("✅ Done!")
@@ -1,21 +1,24 @@
 import os
 from medperf.entities.dataset import Dataset
-from medperf.utils import sanitize_path, tar, generate_tmp_path
+from medperf.commands.dataset import archive
+from medperf.utils import sanitize_path, generate_tmp_path
 import medperf.config as config
 from medperf.exceptions import ExecutionError, MedperfException
 import yaml
+import logging
 
 
 class ExportDataset:
     @classmethod
-    def run(cls, dataset_id: str, output_path: str):
-        export_dataset = cls(dataset_id, output_path)
+    def run(cls, dataset_id: str, output_path: str, compression: str = "gz"):
+        export_dataset = cls(dataset_id, output_path, compression)
         export_dataset.prepare()
         export_dataset.create_tar()
 
-    def __init__(self, dataset_id: str, output_path: str):
+    def __init__(self, dataset_id: str, output_path: str, compression: str = "gz"):
         self.dataset_id = dataset_id
-        output_path = os.path.join(output_path, str(dataset_id)) + ".gz"
+        self.compression = compression
+        output_path = os.path.join(output_path, str(dataset_id)) + f".{compression}"
         self.output_path = sanitize_path(output_path)
         self.dataset = Dataset.get(self.dataset_id)
 
@@ -69,9 +72,22 @@ class ExportDataset:
         # A sanity check for edge cases where raw paths have same basename
         # or have the same basename as the prepared data path
         basenames = [os.path.basename(path) for path in self.folders_paths]
+        basenames.append(config.dataset_archive_manifest_filename)
         if len(basenames) != len(set(basenames)):
             raise MedperfException("Some folders to be archived have same basenames.")
 
+        # The archive config goes first, so that the archive can be extracted
+        # into its destination while it is being read
+        folders_paths = sorted(
+            self.folders_paths,
+            key=lambda path: os.path.basename(path) != config.archive_config_filename,
+        )
+
         # create the archive
         os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
-        tar(self.output_path, self.folders_paths)
+        manifest = {}
+        with archive.open_writer(self.output_path, self.compression) as tar:
+            for path in folders_paths:
+                archive.add_path(tar, path, os.path.basename(path), manifest)
+                logging.info(f"Compressing {self.output_path}: {path} Added.")
+            archive.add_manifest(tar, manifest)
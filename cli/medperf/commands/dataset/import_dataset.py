@@ -1,4 +1,5 @@
 import os
+from medperf.commands.dataset import archive
 from medperf.entities.dataset import Dataset
 from medperf.utils import (
     generate_tmp_path,
@@ -17,6 +18,9 @@ class ImportDataset:
     def run(cls, dataset_id: str, input_path: str, raw_data_path: str):
         import_dataset = cls(dataset_id, input_path, raw_data_path)
         import_dataset.validate_input()
+        if import_dataset.is_streamable():
+            import_dataset.stream_files()
+            return
         import_dataset.untar_files()
         import_dataset.validate()
         import_dataset.process_tarfiles()
@@ -38,12 +42,76 @@ class ImportDataset:
         if self.dataset.state == "DEVELOPMENT" and (
             self.raw_data_path is None
             or os.path.isfile(self.raw_data_path)
-            or (os.path.exists(self.raw_data_path) and os.listdir(self.raw_data_path))
+            or (
+                os.path.exists(self.raw_data_path)
+                and os.listdir(self.raw_data_path)
+                and not self._is_resuming()
+            )
         ):
             raise InvalidArgumentError(
                 "Output raw data path must be specified and, the directory should be empty or does not exist."
             )
 
+    def _import_marker_path(self):
+        return os.path.join(self.dataset.path, config.dataset_import_marker_file)
+
+    def _is_resuming(self):
+        # An interrupted streaming import leaves its marker in the dataset folder
+        return os.path.exists(self._import_marker_path())
+
+    def is_streamable(self):
+        # Archives starting with their config can be extracted directly into the
+        # final destinations. Older archives are extracted to a temporary folder first
+        try:
+            with archive.open_reader(self.input_path, partial=True) as tar:
+                member = tar.next()
+        except ExecutionError:
+            return False
+        return member is not None and member.name == config.archive_config_filename
+
+    def _prepare_destinations(self, archive_config):
+        if not self._is_resuming():
+            if os.path.exists(self.dataset.data_path) or os.path.exists(
+                self.dataset.labels_path
+            ):
+                raise ExecutionError(
+                    f"Dataset '{self.dataset_id}' already exists locally."
+                )
+            remove_path(self.dataset.path)
+        os.makedirs(self.dataset.path, exist_ok=True)
+        with open(self._import_marker_path(), "w"):
+            pass
+
+        destinations = {str(self.dataset_id): self.dataset.path}
+        if self.dataset.state == "DEVELOPMENT":
+            for key in ["raw_data", "raw_labels"]:
+                folder_name = archive_config[key]
+                folder_path = os.path.join(self.raw_data_path, folder_name)
+                destinations[folder_name] = folder_path
+        return destinations
+
+    def stream_files(self):
+        # Extracts the archive directly into the final destinations while reading it.
+        # Files are verified against the archive hashes. If the import is interrupted,
+        # importing again skips the files that were already extracted.
+        with archive.open_reader(self.input_path) as tar:
+            archive_config = archive.read_yaml_member(tar, tar.next())
+            self._validate_archive_config(archive_config)
+            destinations = self._prepare_destinations(archive_config)
+            archive.extract_members(tar, destinations)
+
+        if not os.path.exists(self.dataset.data_path):
+            raise ExecutionError("No prepared dataset in archive")
+        remove_path(self._import_marker_path())
+
+        if self.dataset.state == "OPERATION":
+            self.dataset.set_raw_paths("", "")
+            return
+        self.dataset.set_raw_paths(
+            destinations[archive_config["raw_data"]],
+            destinations[archive_config["raw_labels"]],
+        )
+
     def untar_files(self):
         extracted_path = generate_tmp_path()
         os.makedirs(extracted_path, exist_ok=True)
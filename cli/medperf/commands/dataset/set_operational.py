@@ -8,8 +8,8 @@ import yaml
 class DatasetSetOperational:
     # TODO: this will be refactored when merging entity edit PR
     @classmethod
-    def run(cls, dataset_id: int, approved: bool = False):
-        preparation = cls(dataset_id, approved)
+    def run(cls, dataset_id: int, approved: bool = False, full_rehash: bool = False):
+        preparation = cls(dataset_id, approved, full_rehash)
         preparation.validate()
         preparation.generate_uids()
         preparation.set_statistics()
@@ -19,10 +19,11 @@ class DatasetSetOperational:
 
         return preparation.dataset.id
 
-    def __init__(self, dataset_id: int, approved: bool):
+    def __init__(self, dataset_id: int, approved: bool, full_rehash: bool = False):
         self.ui = config.ui
         self.dataset = Dataset.get(dataset_id)
         self.approved = approved
+        self.full_rehash = full_rehash
 
     def validate(self):
         if self.dataset.state == "OPERATION":
@@ -32,8 +33,8 @@ class DatasetSetOperational:
 
     def generate_uids(self):
         """Auto-generates dataset UIDs for both input and output paths"""
-        in_uid = self.dataset.calculate_raw_hash()
-        generated_uid = self.dataset.calculate_prepared_hash()
+        in_uid = self.dataset.calculate_raw_hash(self.full_rehash)
+        generated_uid = self.dataset.calculate_prepared_hash(self.full_rehash)
         self.dataset.input_data_hash = in_uid
         self.dataset.generated_uid = generated_uid
 
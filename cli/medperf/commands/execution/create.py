@@ -1,10 +1,16 @@
+import logging
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from queue import Queue
 from typing import List, Optional
 from medperf.account_management.account_management import get_medperf_user_data
 from medperf.commands.execution.execution_flow import ExecutionFlow
 from medperf.entities.execution import Execution
 from tabulate import tabulate
 from medperf.commands.execution.utils import filter_latest_executions
+from medperf.commands.execution.prefetch import ContainerPrefetcher
+from medperf.containers.runners.utils import gpus_override
+from medperf.ui.relay import RelayUI
 
 from medperf.entities.cube import Cube
 from medperf.entities.dataset import Dataset
@@ -32,6 +38,7 @@ class BenchmarkExecution:
         no_cache=False,
         show_summary=False,
         rerun_finalized_executions=False,
+        jobs: int = 1,
     ):
         """Benchmark execution flow.
         How the following variables affect whether to execute or no:
@@ -50,6 +57,7 @@ class BenchmarkExecution:
                                     if None, models_input_file will be used
             models_input_file: filename to read from
             if models_uids and models_input_file are None, use all benchmark models
+            jobs (int): maximum number of model experiments to run concurrently
         """
         if rerun_finalized_executions:
             no_cache = True
@@ -62,6 +70,7 @@ class BenchmarkExecution:
             ignore_failed_experiments,
             no_cache,
             rerun_finalized_executions,
+            jobs,
         )
         with execution_flow.ui.interactive():
             execution_flow.prepare()
@@ -84,6 +93,7 @@ class BenchmarkExecution:
         ignore_failed_experiments=False,
         no_cache=False,
         rerun_finalized_executions=False,
+        jobs: int = 1,
     ):
         self.benchmark_uid = benchmark_uid
         self.data_uid = data_uid
@@ -97,6 +107,10 @@ class BenchmarkExecution:
         self.experiments = []
         self.no_cache = no_cache
         self.rerun_finalized_executions = rerun_finalized_executions
+        if jobs < 1:
+            raise InvalidArgumentError("The number of jobs should be at least 1")
+        self.jobs = jobs
+        self.container_prefetcher = None
 
     def prepare(self):
         self.benchmark = Benchmark.get(self.benchmark_uid)
@@ -185,79 +199,193 @@ class BenchmarkExecution:
         self.ui.print(f"> {name} Container '{cube.name}' download complete")
         return cube
 
+    def __prefetch_models(self, models_uids: List[int]) -> dict:
+        # Retrieve all models with a single request. If any of them can't be retrieved,
+        # fall back to retrieving them one by one so that errors are handled per experiment
+        try:
+            models = Model.get_many(models_uids)
+        except MedperfException:
+            return {}
+        return dict(zip(models_uids, models))
+
+    def __should_run(self, execution: Execution) -> bool:
+        if self.rerun_finalized_executions:
+            return True
+        if self.no_cache:
+            return not execution.finalized
+        return not execution.is_executed()
+
+    def __gpu_slots(self) -> List[Optional[str]]:
+        """Splits the GPU devices given through config.gpus (e.g. device=0,1,2,3)
+        between the concurrent jobs, so that each experiment gets its own devices.
+        Other gpus values can't be split and are shared by all jobs."""
+        gpus = config.gpus
+        if self.jobs <= 1 or not isinstance(gpus, str) or not gpus.startswith("device="):
+            return [None] * self.jobs
+        devices = [device for device in gpus[len("device=") :].split(",") if device]  # noqa
+        n_slots = min(self.jobs, len(devices)) or self.jobs
+        groups = [devices[i::n_slots] for i in range(n_slots)]
+        return ["device=" + ",".join(group) if group else None for group in groups]
+
     def run_experiments(self) -> list[Execution]:
+        pending = {}
+        cached = {}
         for model_uid in self.models_uids:
             execution = self.existing_executions.get(model_uid, None)
-            if (
-                execution is None
-                or execution.finalized
-                and self.rerun_finalized_executions
-            ):
-                execution = self.__create_execution(model_uid)
-
-            if self.rerun_finalized_executions:
-                should_run = True
+            if execution is not None and execution.finalized:
+                if self.rerun_finalized_executions:
+                    execution = None
+            if execution is None or self.__should_run(execution):
+                # New executions are created on the server right before they run
+                pending[model_uid] = execution
             else:
-                if self.no_cache:
-                    should_run = not execution.finalized
+                cached[model_uid] = self.__cached_experiment(model_uid, execution)
+
+        experiments = {}
+        if pending:
+            models = self.__prefetch_models(list(pending))
+            with ContainerPrefetcher() as prefetcher:
+                # download containers in the background while earlier models execute
+                prefetcher.prefetch([models[uid] for uid in pending if uid in models])
+                self.container_prefetcher = prefetcher
+                if self.jobs <= 1:
+                    for model_uid, execution in pending.items():
+                        experiments[model_uid] = self.__run_experiment(
+                            model_uid, execution, models.get(model_uid)
+                        )
                 else:
-                    should_run = not execution.is_executed()
+                    experiments = self.__run_experiments_concurrently(pending, models)
 
-            if should_run:
-                execution.unmark_as_executed()
-            else:
-                self.experiments.append(
-                    {
-                        "model_uid": model_uid,
-                        "execution": execution,
-                        "cached": True,
-                        "error": "",
-                        "partial": execution.is_partial(),
-                        "confidential": "N/A",
-                    }
-                )
-                continue
+        experiments.update(cached)
+        self.experiments = [experiments[model_uid] for model_uid in self.models_uids]
+        return [experiment["execution"] for experiment in self.experiments]
 
+    def __run_experiments_concurrently(self, executions: dict, models: dict):
+        """Runs the given experiments (model UIDs mapped to their executions, or to None
+        if the execution is yet to be created) using up to self.jobs concurrent workers.
+        The status of each model is reported as soon as it finishes.
+        If an experiment fails and failures are not ignored, experiments that didn't
+        start yet are cancelled and the error is raised."""
+        gpu_slots = Queue()
+        for slot in self.__gpu_slots():
+            gpu_slots.put(slot)
+
+        def run_job(model_uid):
+            slot = gpu_slots.get()
             try:
-                model = Model.get(model_uid)
-                execution_summary = ExecutionFlow.run(
-                    benchmark_id=self.benchmark_uid,
-                    dataset=self.dataset,
-                    model=model,
-                    evaluator=self.evaluator,
-                    execution=execution,
-                    ignore_model_errors=self.ignore_model_errors,
-                )
-            except MedperfException as e:
-                self.__handle_experiment_error(model_uid, e)
-                self.experiments.append(
-                    {
-                        "model_uid": model_uid,
-                        "execution": None,
-                        "cached": False,
-                        "error": str(e),
-                        "partial": "N/A",
-                        "confidential": model.requires_cc(),
-                    }
-                )
-                continue
-
-            execution.mark_as_executed()
-            execution.save_results(
-                execution_summary["results"], execution_summary["partial"]
-            )
+                with gpus_override(slot):
+                    return self.__run_experiment(
+                        model_uid, executions[model_uid], models.get(model_uid)
+                    )
+            finally:
+                gpu_slots.put(slot)
+
+        experiments = {}
+        n_workers = min(gpu_slots.qsize(), len(executions))
+        self.ui.print(f"Running {len(executions)} experiments with {n_workers} jobs")
+        # The jobs' output is displayed from this thread
+        relay = RelayUI(config.ui)
+        config.ui = relay
+        pool = ThreadPoolExecutor(n_workers, thread_name_prefix="medperf-execution")
+        futures = {}
+        try:
+            futures = {pool.submit(run_job, uid): uid for uid in executions}
+            for future in self.__as_completed(futures, relay):
+                model_uid = futures[future]
+                experiment = future.result()
+                experiments[model_uid] = experiment
+                status = "failed" if experiment["error"] else "finished"
+                self.ui.print(f"> Model {model_uid} {status}")
+        except KeyboardInterrupt:
+            # Containers run in their own sessions, so they don't receive the interrupt
+            self.__stop_running_containers()
+            raise
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            for _ in self.__as_completed(futures, relay):
+                pass
+            config.ui = relay.ui
+        return experiments
+
+    @staticmethod
+    def __as_completed(futures, relay: RelayUI):
+        """Yields the futures as they complete, displaying the output of the jobs
+        meanwhile"""
+        pending = set(futures)
+        while pending:
+            wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            relay.process_pending()
+            # wait doesn't report futures cancelled by the pool shutdown
+            done = {future for future in pending if future.done()}
+            pending -= done
+            yield from done
+        relay.process_pending()
+
+    @staticmethod
+    def __stop_running_containers():
+        for task, container in list(config.running_containers.items()):
+            try:
+                container.killpg()
+            except OSError as e:
+                logging.debug(f"Could not stop {task}: {e}")
+
+    @staticmethod
+    def __cached_experiment(model_uid: int, execution: Execution) -> dict:
+        return {
+            "model_uid": model_uid,
+            "execution": execution,
+            "cached": True,
+            "error": "",
+            "partial": execution.is_partial(),
+            "confidential": "N/A",
+        }
 
-            self.experiments.append(
-                {
-                    "model_uid": model_uid,
-                    "execution": execution,
-                    "cached": False,
-                    "error": "",
-                    "partial": execution_summary["partial"],
-                    "confidential": model.requires_cc(),
-                }
+    def __run_experiment(
+        self,
+        model_uid: int,
+        execution: Optional[Execution],
+        model: Optional[Model] = None,
+    ) -> dict:
+        if execution is None:
+            execution = self.__create_execution(model_uid)
+            if not self.__should_run(execution):
+                return self.__cached_experiment(model_uid, execution)
+        execution.unmark_as_executed()
+        try:
+            if model is None:
+                model = Model.get(model_uid)
+            execution_summary = ExecutionFlow.run(
+                benchmark_id=self.benchmark_uid,
+                dataset=self.dataset,
+                model=model,
+                evaluator=self.evaluator,
+                execution=execution,
+                ignore_model_errors=self.ignore_model_errors,
+                container_prefetcher=self.container_prefetcher,
             )
-        return [experiment["execution"] for experiment in self.experiments]
+        except MedperfException as e:
+            self.__handle_experiment_error(model_uid, e)
+            return {
+                "model_uid": model_uid,
+                "execution": None,
+                "cached": False,
+                "error": str(e),
+                "partial": "N/A",
+                "confidential": model.requires_cc() if model is not None else "N/A",
+            }
+
+        execution.mark_as_executed()
+        execution.save_results(
+            execution_summary["results"], execution_summary["partial"]
+        )
+        return {
+            "model_uid": model_uid,
+            "execution": execution,
+            "cached": False,
+            "error": "",
+            "partial": execution_summary["partial"],
+            "confidential": model.requires_cc(),
+        }
 
     def __handle_experiment_error(self, model_uid, exception):
         if isinstance(exception, InvalidEntityError):
@@ -7,6 +7,7 @@ from medperf.entities.benchmark import Benchmark
 from medperf.enums import ModelType
 from medperf.commands.execution.container_execution import ContainerExecution
 from medperf.commands.execution.script_execution import ScriptExecution
+from medperf.commands.execution.prefetch import ContainerPrefetcher
 from medperf.commands.execution.confidential_execution import ConfidentialExecution
 from medperf.commands.execution.confidential_model_container_execution import (
     ConfidentialModelContainerExecution,
@@ -25,6 +26,7 @@ class ExecutionFlow:
         evaluator: Cube,
         execution: Execution = None,
         ignore_model_errors=False,
+        container_prefetcher: ContainerPrefetcher = None,
     ):
         user_is_model_owner = (
             is_user_logged_in() and model.owner == get_medperf_user_data()["id"]
@@ -67,9 +69,12 @@ class ExecutionFlow:
                 dataset, asset, evaluator, execution, ignore_model_errors
             )
         else:
-            container = model.container_obj
             with config.ui.interactive():
-                container.download_run_files()
+                if container_prefetcher is not None:
+                    container = container_prefetcher.get(model)
+                else:
+                    container = model.container_obj
+                    container.download_run_files()
             return ContainerExecution.run(
                 dataset, container, evaluator, execution, ignore_model_errors
             )
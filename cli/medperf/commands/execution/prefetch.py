@@ -0,0 +1,98 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+import medperf.config as config
+from medperf.entities.cube import Cube
+from medperf.entities.model import Model
+from medperf.ui.relay import RelayUI
+
+
+class ContainerPrefetcher:
+    """Downloads and verifies the images and additional files of model containers
+    in a background pool, so that downloads overlap with the execution of other models.
+
+    Containers are downloaded in the order they were submitted. Retrieving a container
+    that wasn't prefetched downloads it on the calling thread. While the prefetcher is
+    open, the messages of the background downloads are displayed by the thread that
+    opened it, when it waits for a container or closes the prefetcher, so that they
+    don't mix with the output of the running model.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = config.container_prefetch_workers
+        self.pool = None
+        if max_workers > 0:
+            self.pool = ThreadPoolExecutor(
+                max_workers, thread_name_prefix="medperf-prefetch"
+            )
+        self.futures: Dict[int, Future] = {}
+        self.relay = None
+
+    def __enter__(self):
+        if self.pool is not None:
+            self.relay = RelayUI(config.ui)
+            config.ui = self.relay
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    @staticmethod
+    def __download(container: Cube) -> Cube:
+        logging.debug(f"Prefetching container {container.id}")
+        container.download_run_files()
+        return container
+
+    def prefetch(self, models: List[Model]):
+        """Starts downloading the containers of the given models in the background.
+        Asset models and already submitted containers are skipped.
+
+        Args:
+            models (List[Model]): models whose containers will be needed, in execution order
+        """
+        if self.pool is None:
+            return
+        for model in models:
+            if not model.is_container() or model.container.id in self.futures:
+                continue
+            future = self.pool.submit(self.__download, model.container_obj)
+            self.futures[model.container.id] = future
+
+    def get(self, model: Model) -> Cube:
+        """Returns the model's container with its run files downloaded. Waits for the
+        prefetch to finish if it is in progress, and raises any error it encountered.
+
+        Args:
+            model (Model): a container model
+
+        Returns:
+            Cube: the downloaded container
+        """
+        future = self.futures.get(model.container.id)
+        if future is None or future.cancelled():
+            return self.__download(model.container_obj)
+        self.__wait(future)
+        return future.result()
+
+    def __wait(self, future: Future):
+        """Waits for a download, displaying the messages of the background downloads
+        meanwhile if called from the thread that opened the prefetcher"""
+        while not future.done():
+            wait([future], timeout=0.1)
+            if self.relay is not None:
+                self.relay.process_pending()
+        if self.relay is not None:
+            self.relay.process_pending()
+
+    def shutdown(self):
+        """Cancels pending downloads and waits for the running ones to finish"""
+        if self.pool is None:
+            return
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        for future in self.futures.values():
+            self.__wait(future)
+        if self.relay is not None:
+            config.ui = self.relay.ui
+            self.relay = None
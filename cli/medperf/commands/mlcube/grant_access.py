@@ -8,10 +8,10 @@ from medperf.utils import (
     validate_and_normalize_emails,
 )
 from medperf import config
-from medperf.exceptions import CleanExit, InvalidCertificateError
+from medperf.exceptions import CleanExit
 from medperf.entities.encrypted_key import EncryptedKey
 from medperf.encryption import AsymmetricEncryption
-from medperf.certificates import verify_certificate_authority, verify_certificate
+from medperf.certificates import verify_certificate_authority, verify_certificates
 import logging
 
 
@@ -125,15 +125,22 @@ class GrantAccess:
         error_certs = []
         valid_certs = []
 
-        for certificate in self.certificates:
-            expected_email = self.cert_user_info[certificate.id]["email"]
-            try:
-                verify_certificate(
-                    certificate, expected_cn=expected_email, verify_ca=False
-                )
+        expected_emails = [
+            self.cert_user_info[certificate.id]["email"]
+            for certificate in self.certificates
+        ]
+        with config.ui.interactive():
+            config.ui.text = "Verifying Data Owner Certificates"
+            results = verify_certificates(
+                self.certificates, expected_emails, verify_ca=False
+            )
+
+        for certificate, expected_email, valid in zip(
+            self.certificates, expected_emails, results
+        ):
+            if valid:
                 valid_certs.append(certificate)
-            except InvalidCertificateError:
-                logging.debug(f"Invalid Certificate: {certificate.id}")
+            else:
                 error_certs.append((certificate, expected_email))
 
         if error_certs:
@@ -152,19 +159,30 @@ class GrantAccess:
         self.certificates = valid_certs
 
     def generate_encrypted_keys_list(self):
-        encryptor = AsymmetricEncryption()
-        keys_objects = []
         container_key_file = get_decryption_key_path(self.model_id)
         with open(container_key_file, "rb") as f:
             container_key_bytes = f.read()
 
+        # Decode each certificate once, even if it appears more than once
+        certificates_bytes = {}
         for certificate in self.certificates:
-            certificate_content_bytes = base64.b64decode(
-                certificate.certificate_content_base64
-            )
-            encrypted_key_bytes = encryptor.encrypt(
-                certificate_content_bytes, container_key_bytes
-            )
+            if certificate.id not in certificates_bytes:
+                certificates_bytes[certificate.id] = base64.b64decode(
+                    certificate.certificate_content_base64
+                )
+
+        encryptor = AsymmetricEncryption()
+        encrypted_keys = {}
+        with config.ui.interactive():
+            config.ui.text = "Encrypting the container key for each certificate"
+            for cert_id, certificate_bytes in certificates_bytes.items():
+                encrypted_keys[cert_id] = encryptor.encrypt(
+                    certificate_bytes, container_key_bytes
+                )
+
+        keys_objects = []
+        for certificate in self.certificates:
+            encrypted_key_bytes = encrypted_keys[certificate.id]
             key_name = f"M{self.model_id}C{certificate.id}_" + uuid.uuid4().hex
             key_obj = EncryptedKey(
                 encrypted_key_base64=base64.b64encode(encrypted_key_bytes).decode(),
@@ -9,7 +9,8 @@ of the downloaded file, which can be the original specified hash or the
 calculated hash of the freshly downloaded file if no hash was specified.
 
 Additionally, to avoid unnecessary downloads, an existing file
-will not be re-downloaded.
+will not be re-downloaded. Downloaded files carry a sidecar record of their
+verified hash, so that they are not re-hashed every time they are used.
 """
 
 import shutil
@@ -21,9 +22,48 @@ from medperf.utils import generate_tmp_path, remove_path, untar, get_file_hash
 from .utils import download_resource
 
 
+def _verified_hash_file(path):
+    return path + config.verified_hash_suffix
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+
+def _get_verified_hash(path):
+    """Returns the hash recorded when the file was last verified, or None if
+    there is no record or the file changed since then."""
+    record_file = _verified_hash_file(path)
+    if not os.path.exists(record_file):
+        return
+    try:
+        with open(record_file) as f:
+            record = yaml.safe_load(f)
+        if record["signature"] == _file_signature(path):
+            return record["hash"]
+    except (OSError, yaml.YAMLError, KeyError, TypeError):
+        logging.debug(f"Ignoring invalid verification record {record_file}")
+
+
+def _store_verified_hash(path, hash_value):
+    """Records the verified hash of a file alongside its size, modification time
+    and inode, which are used to detect later changes to the file."""
+    record_file = _verified_hash_file(path)
+    tmp_record_file = record_file + ".tmp"
+    contents = {"hash": hash_value, "signature": _file_signature(path)}
+    with open(tmp_record_file, "w") as f:
+        yaml.dump(contents, f)
+    os.replace(tmp_record_file, record_file)
+
+
 def _should_get_regular_file(output_path, expected_hash):
     if os.path.exists(output_path) and expected_hash:
-        calculated_hash = get_file_hash(output_path)
+        calculated_hash = _get_verified_hash(output_path)
+        if calculated_hash is None:
+            calculated_hash = get_file_hash(output_path)
+            if expected_hash == calculated_hash:
+                _store_verified_hash(output_path, calculated_hash)
         logging.debug(
             f"{output_path}: Expected {expected_hash}, found {calculated_hash}."
         )
@@ -74,6 +114,7 @@ def _get_regular_file(url: str, output_path: str, expected_hash: str = None) ->
     if os.path.exists(output_path):
         remove_path(output_path)
     hash_value = download_resource(url, output_path, expected_hash)
+    _store_verified_hash(output_path, hash_value)
     return output_path, hash_value
 
 
@@ -98,6 +139,7 @@ def get_hashed_file(url: str, hash_value: str = None) -> str:
     hash_value = download_resource(url, tmp_output_path)
     file_path = os.path.join(config.hashed_files_folder, hash_value)
     shutil.move(tmp_output_path, file_path)
+    _store_verified_hash(file_path, hash_value)
     return file_path, hash_value
 
 
@@ -1,12 +1,84 @@
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Optional
 import requests
 from medperf.exceptions import CommunicationRetrievalError
 from medperf import config
-from medperf.utils import remove_path, log_response_error
+from medperf.utils import get_file_hash, remove_path, log_response_error
 from .source import BaseSource
 import validators
 import os
 
 
+class _DownloadProgress:
+    """Reports the progress and speed of a download through config.ui, at most once
+    every config.ddl_progress_interval seconds. Downloads running in background
+    threads are not reported, so that they don't overwrite the messages of the
+    command being run."""
+
+    def __init__(self, url: str):
+        self.name = url.rstrip("/").split("/")[-1]
+        self.enabled = threading.current_thread() is threading.main_thread()
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self, done: int = 0, total: Optional[int] = None):
+        self.done = done
+        self.total = total
+        self.start_done = done
+        self.start_time = time.monotonic()
+        self.last_report = self.start_time
+
+    def update(self, num_bytes: int):
+        with self.lock:
+            self.done += num_bytes
+            now = time.monotonic()
+            interval = now - self.last_report
+            if not self.enabled or interval < config.ddl_progress_interval:
+                return
+            self.last_report = now
+            speed = (self.done - self.start_done) / (now - self.start_time)
+            msg = f"Downloading {self.name}: {self.done / 1024**2:.0f}MB"
+            if self.total:
+                msg += f" of {self.total / 1024**2:.0f}MB"
+                msg += f" ({100 * self.done // self.total}%)"
+            msg += f" at {speed / 1024**2:.1f}MB/s"
+        config.ui.text = msg
+
+    @contextmanager
+    def reporting(self):
+        if not self.enabled:
+            yield
+            return
+        with config.ui.interactive():
+            yield
+
+
+def _file_size(path: str) -> int:
+    if not os.path.exists(path):
+        return 0
+    return os.path.getsize(path)
+
+
+def _timeout() -> tuple:
+    return (config.ddl_connect_timeout, config.ddl_read_timeout)
+
+
+def _content_range_start(res) -> Optional[int]:
+    """Returns the first byte of a partial response, from its Content-Range header
+    (e.g. `bytes 100-199/1000`)"""
+    content_range = res.headers.get("Content-Range", "")
+    unit, _, byte_range = content_range.partition(" ")
+    start = byte_range.split("-", 1)[0]
+    if unit != "bytes" or not start.isdigit():
+        return None
+    return int(start)
+
+
 class DirectLinkSource(BaseSource):
     prefix = "direct:"
 
@@ -34,38 +106,223 @@ class DirectLinkSource(BaseSource):
     def authenticate(self):
         pass
 
-    def __download_once(self, resource_identifier: str, output_path: str):
+    def __download_once(
+        self, resource_identifier: str, output_path: str, progress: _DownloadProgress
+    ) -> str:
         """Downloads a direct-download-link file by streaming its contents. source:
         https://stackoverflow.com/questions/16694907/download-large-file-in-python-with-requests
+        If a previous attempt left a partial file, only the rest of the file is
+        requested, if the server supports it. The sha256 hash of the file is computed
+        as chunks arrive and returned.
         """
-        with requests.get(resource_identifier, stream=True) as res:
-            if res.status_code != 200:
-                log_response_error(res)
-                msg = (
-                    "There was a problem retrieving the specified file at "
-                    + resource_identifier
-                )
-                raise CommunicationRetrievalError(msg)
+        offset = _file_size(output_path)
+        kwargs = {}
+        if offset:
+            kwargs["headers"] = {"Range": f"bytes={offset}-"}
+        try:
+            with requests.get(
+                resource_identifier, stream=True, timeout=_timeout(), **kwargs
+            ) as res:
+                if res.status_code == 200:
+                    # Either a new download, or the server doesn't support ranges
+                    offset = 0
+                elif not (offset and res.status_code == 206):
+                    log_response_error(res)
+                    if res.status_code == 416:
+                        # The partial file can't be resumed
+                        remove_path(output_path)
+                    msg = (
+                        "There was a problem retrieving the specified file at "
+                        + resource_identifier
+                    )
+                    raise CommunicationRetrievalError(msg)
+                resumed = res.status_code == 206
+                if not resumed or _content_range_start(res) == offset:
+                    return self.__write_stream(res, output_path, offset, progress)
+        except requests.exceptions.RequestException as e:
+            raise CommunicationRetrievalError(
+                f"Download of {resource_identifier} was interrupted: {e}"
+            )
 
-            with open(output_path, "wb") as f:
-                for chunk in res.iter_content(chunk_size=config.ddl_stream_chunk_size):
-                    # NOTE: if the response is chunk-encoded, this may not work
-                    # check whether this is common.
-                    f.write(chunk)
+        logging.debug("The server didn't resume the download where it stopped")
+        remove_path(output_path)
+        return self.__download_once(resource_identifier, output_path, progress)
 
-    def download(self, resource_identifier: str, output_path: str):
-        """Downloads a direct-download-link file with multiple attempts. This is
-        done due to facing transient network failure from some direct download
-        link servers."""
+    def __write_stream(
+        self, res, output_path: str, offset: int, progress: _DownloadProgress
+    ) -> str:
+        sha = hashlib.sha256()
+        if offset:
+            logging.debug(f"Resuming download at byte {offset}")
+            with open(output_path, "rb") as f:
+                for chunk in iter(lambda: f.read(config.hash_chunk_size), b""):
+                    sha.update(chunk)
+
+        expected_size = None
+        # The length of encoded responses doesn't match the decoded content
+        if "Content-Length" in res.headers and "Content-Encoding" not in res.headers:
+            expected_size = offset + int(res.headers["Content-Length"])
+        progress.reset(offset, expected_size)
+
+        with open(output_path, "ab" if offset else "wb") as f:
+            for chunk in res.iter_content(chunk_size=config.ddl_stream_chunk_size):
+                # NOTE: if the response is chunk-encoded, this may not work
+                # check whether this is common.
+                f.write(chunk)
+                sha.update(chunk)
+                progress.update(len(chunk))
 
+        if expected_size is not None and _file_size(output_path) != expected_size:
+            raise CommunicationRetrievalError("Download ended before the whole file")
+        return sha.hexdigest()
+
+    def __get_ranged_size(self, resource_identifier: str) -> Optional[int]:
+        """Returns the size of the file if the server supports range requests"""
+        try:
+            res = requests.head(
+                resource_identifier, allow_redirects=True, timeout=_timeout()
+            )
+        except requests.exceptions.RequestException:
+            return None
+        headers = res.headers
+        if res.status_code != 200 or headers.get("Accept-Ranges") != "bytes":
+            return None
+        if "Content-Encoding" in headers or "Content-Length" not in headers:
+            return None
+        return int(headers["Content-Length"])
+
+    def __download_range(
+        self,
+        resource_identifier: str,
+        output_path: str,
+        start: int,
+        end: int,
+        progress: _DownloadProgress,
+    ) -> int:
+        """Downloads the bytes [start, end) of a file into their place in the output
+        file, and returns the position reached, which is end unless it failed"""
+        position = start
+        headers = {"Range": f"bytes={start}-{end - 1}"}
+        try:
+            with requests.get(
+                resource_identifier, stream=True, headers=headers, timeout=_timeout()
+            ) as res:
+                if res.status_code != 206:
+                    log_response_error(res)
+                    return position
+                if _content_range_start(res) != start:
+                    logging.debug(f"The server didn't return bytes {start}-{end}")
+                    return position
+                with open(output_path, "r+b") as f:
+                    f.seek(start)
+                    for chunk in res.iter_content(
+                        chunk_size=config.ddl_stream_chunk_size
+                    ):
+                        chunk = chunk[: end - position]
+                        f.write(chunk)
+                        position += len(chunk)
+                        progress.update(len(chunk))
+        except requests.exceptions.RequestException as e:
+            logging.debug(f"Download of bytes {start}-{end} was interrupted: {e}")
+        return position
+
+    def __download_part(
+        self,
+        resource_identifier: str,
+        output_path: str,
+        start: int,
+        end: int,
+        progress: _DownloadProgress,
+    ):
+        # Interrupted parts are resumed. Attempts are only counted when they fail
+        # without downloading anything
         attempt = 0
-        while attempt < config.ddl_max_redownload_attempts:
+        while start < end:
+            position = self.__download_range(
+                resource_identifier, output_path, start, end, progress
+            )
+            if position == start:
+                attempt += 1
+                if attempt >= config.ddl_max_redownload_attempts:
+                    raise CommunicationRetrievalError(
+                        f"Could not download {resource_identifier}"
+                    )
+            else:
+                attempt = 0
+            start = position
+
+    def __download_parallel(
+        self, resource_identifier: str, output_path: str, size: int
+    ) -> None:
+        """Downloads parts of a file concurrently through several connections"""
+        part_size = config.ddl_parallel_part_size
+        parts = [
+            (start, min(start + part_size, size))
+            for start in range(0, size, part_size)
+        ]
+        progress = _DownloadProgress(resource_identifier)
+        progress.reset(0, size)
+        with open(output_path, "wb") as f:
+            f.truncate(size)
+
+        with progress.reporting(), ThreadPoolExecutor(
+            config.ddl_parallel_connections, thread_name_prefix="medperf-download"
+        ) as pool:
+            futures = [
+                pool.submit(
+                    self.__download_part,
+                    resource_identifier,
+                    output_path,
+                    start,
+                    end,
+                    progress,
+                )
+                for start, end in parts
+            ]
             try:
-                self.__download_once(resource_identifier, output_path)
-                return
+                for future in as_completed(futures):
+                    future.result()
             except CommunicationRetrievalError:
-                if os.path.exists(output_path):
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def download(self, resource_identifier: str, output_path: str) -> Optional[str]:
+        """Downloads a direct-download-link file with multiple attempts. This is
+        done due to facing transient network failure from some direct download
+        link servers. Interrupted downloads are resumed where they stopped if the
+        server supports range requests, and large files are downloaded through
+        config.ddl_parallel_connections connections.
+
+        Returns:
+            str: the sha256 hash of the downloaded file
+        """
+        if config.ddl_parallel_connections > 1:
+            size = self.__get_ranged_size(resource_identifier)
+            if size is not None and size > config.ddl_parallel_part_size:
+                try:
+                    self.__download_parallel(resource_identifier, output_path, size)
+                except CommunicationRetrievalError:
                     remove_path(output_path)
-                attempt += 1
+                    raise
+                return get_file_hash(output_path)
+
+        progress = _DownloadProgress(resource_identifier)
+        attempt = 0
+        with progress.reporting():
+            while attempt < config.ddl_max_redownload_attempts:
+                downloaded = _file_size(output_path)
+                try:
+                    return self.__download_once(
+                        resource_identifier, output_path, progress
+                    )
+                except CommunicationRetrievalError as e:
+                    logging.debug(str(e))
+                    # Attempts are only counted when they fail without downloading anything
+                    if _file_size(output_path) <= downloaded:
+                        attempt += 1
+                    else:
+                        attempt = 0
 
+        remove_path(output_path)
         raise CommunicationRetrievalError(f"Could not download {resource_identifier}")
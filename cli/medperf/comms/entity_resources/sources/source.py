@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class BaseSource(ABC):
@@ -16,11 +17,15 @@ class BaseSource(ABC):
         """Authenticates with the source server, if needed."""
 
     @abstractmethod
-    def download(self, resource_identifier: str, output_path: str):
+    def download(self, resource_identifier: str, output_path: str) -> Optional[str]:
         """Downloads the requested resource to the specified location
         Args:
             resource_identifier (str): The identifier that is used to download
             the resource (e.g. URL, asset ID, ...) It is the parsed output
             by `validate_resource`
             output_path (str): The path to download the resource to
+
+        Returns:
+            Optional[str]: The sha256 hash of the downloaded file, if the source
+            computed it while downloading. None otherwise.
         """
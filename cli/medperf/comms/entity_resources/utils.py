@@ -42,14 +42,16 @@ def tmp_download_resource(resource):
 
     Returns:
         tmp_output_path (str): The location where the resource was downloaded
+        downloaded_hash (str|None): The hash of the file if the source computed it
+        while downloading, else None
     """
 
     tmp_output_path = generate_tmp_path()
     source_class, resource_identifier = __parse_resource(resource)
     source = source_class()
     source.authenticate()
-    source.download(resource_identifier, tmp_output_path)
-    return tmp_output_path
+    downloaded_hash = source.download(resource_identifier, tmp_output_path)
+    return tmp_output_path, downloaded_hash
 
 
 def to_permanent_path(tmp_output_path, output_path):
@@ -81,9 +83,11 @@ def download_resource(
     logging.debug(
         f"Downloading {resource} to {output_path} and the expected hash is {expected_hash}"
     )
-    tmp_output_path = tmp_download_resource(resource)
+    tmp_output_path, calculated_hash = tmp_download_resource(resource)
 
-    calculated_hash = get_file_hash(tmp_output_path)
+    if calculated_hash is None:
+        # The source didn't hash the file while downloading it
+        calculated_hash = get_file_hash(tmp_output_path)
 
     if expected_hash and calculated_hash != expected_hash:
         logging.debug(f"{resource}: Expected {expected_hash}, found {calculated_hash}.")
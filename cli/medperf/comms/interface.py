@@ -1,4 +1,4 @@
-# from typing import List
+from typing import Callable, List
 from abc import ABC, abstractmethod
 
 
@@ -12,3 +12,38 @@ class Comms(ABC):
             ui (UI): Implementation of the UI interface.
             token (str, Optional): authentication token to be used throughout communication. Defaults to None.
         """
+
+    @abstractmethod
+    def get_many(self, retriever: Callable[[int], dict], uids: List[int]) -> List[dict]:
+        """Retrieves several objects of the same type by calling the retriever for each
+        uid. Implementations may issue these requests concurrently.
+
+        Args:
+            retriever (Callable[[int], dict]): comms method retrieving a single object (e.g. get_model)
+            uids (List[int]): UIDs of the objects to retrieve
+
+        Returns:
+            List[dict]: Objects information, in the same order as the given uids
+        """
+
+    @abstractmethod
+    def get_many_cubes(self, cube_uids: List[int]) -> List[dict]:
+        """Retrieves the metadata of several MLCubes with as few requests as possible.
+
+        Args:
+            cube_uids (List[int]): UIDs of the MLCubes
+
+        Returns:
+            List[dict]: metadata of the MLCubes found. Missing MLCubes are omitted
+        """
+
+    @abstractmethod
+    def get_many_models(self, model_uids: List[int]) -> List[dict]:
+        """Retrieves the metadata of several models with as few requests as possible.
+
+        Args:
+            model_uids (List[int]): UIDs of the models
+
+        Returns:
+            List[dict]: metadata of the models found. Missing models are omitted
+        """
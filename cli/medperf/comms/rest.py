@@ -1,5 +1,9 @@
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 
 from medperf.enums import Status
@@ -8,8 +12,10 @@ from medperf.comms.interface import Comms
 from medperf.utils import sanitize_json, log_response_error, format_errors_dict
 from medperf.exceptions import (
     CommunicationError,
+    CommunicationConnectionError,
     CommunicationRetrievalError,
     CommunicationRequestError,
+    CommunicationServerError,
 )
 
 
@@ -20,6 +26,33 @@ class REST(Comms):
         if self.cert is None:
             # No certificate provided, default to normal verification
             self.cert = True
+        self.session = self.__create_session()
+
+    @staticmethod
+    def __create_session() -> requests.Session:
+        """Creates a session that keeps connections to the server alive and
+        reuses them across requests. Idempotent requests are retried with
+        exponential backoff on connection errors and gateway failures.
+
+        Returns:
+            requests.Session: the configured session
+        """
+        retries = Retry(
+            total=config.comms_max_retries,
+            backoff_factor=config.comms_retry_backoff_factor,
+            status_forcelist=config.comms_retry_status_codes,
+            allowed_methods=["GET", "PUT", "HEAD", "OPTIONS"],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=config.comms_pool_size,
+            pool_maxsize=config.comms_pool_size,
+            max_retries=retries,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     @classmethod
     def parse_url(cls, url: str) -> str:
@@ -41,25 +74,27 @@ class REST(Comms):
         return f"https://{url}{api_path}"
 
     def __auth_get(self, url, **kwargs):
-        return self.__auth_req(url, requests.get, **kwargs)
+        return self.__auth_req(url, self.session.get, **kwargs)
 
     def __auth_post(self, url, **kwargs):
-        return self.__auth_req(url, requests.post, **kwargs)
+        return self.__auth_req(url, self.session.post, **kwargs)
 
     def __auth_put(self, url, **kwargs):
-        return self.__auth_req(url, requests.put, **kwargs)
+        return self.__auth_req(url, self.session.put, **kwargs)
 
     def __auth_req(self, url, req_func, **kwargs):
         token = config.auth.access_token
-        return self.__req(
-            url, req_func, headers={"Authorization": f"Bearer {token}"}, **kwargs
-        )
+        headers = {**kwargs.pop("headers", {}), "Authorization": f"Bearer {token}"}
+        return self.__req(url, req_func, headers=headers, **kwargs)
 
     def __req(self, url, req_func, **kwargs):
         logging.debug(f"Calling {req_func}: {url}")
         if "json" in kwargs:
             logging.debug(f"Passing JSON contents: {kwargs['json']}")
             kwargs["json"] = sanitize_json(kwargs["json"])
+        kwargs.setdefault(
+            "timeout", (config.comms_connect_timeout, config.comms_read_timeout)
+        )
         try:
             return req_func(url, verify=self.cert, **kwargs)
         except requests.exceptions.SSLError as e:
@@ -68,10 +103,15 @@ class REST(Comms):
                 "Couldn't connect to server through HTTPS. If running locally, "
                 "remember to provide the server certificate through --certificate"
             )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            logging.error(f"Couldn't connect to {self.server_url}: {e}")
+            raise CommunicationConnectionError(
+                f"Couldn't connect to {self.server_url}: {e}"
+            )
 
     def __get_count(self, url, filters={}, error_msg="") -> int:
-        filters = dict(filters)
-        filters.update({"is_valid": True, "limit": 1, "offset": 0})
+        filters = self.__valid_only_by_default(filters)
+        filters.update({"limit": 1, "offset": 0})
 
         query_str = "&".join([f"{k}={v}" for k, v in filters.items()])
         paginated_url = f"{url}?{query_str}"
@@ -99,6 +139,11 @@ class REST(Comms):
         If binary_reduction is enabled, errors are assumed to be related to response size. In that case,
         the page_size is reduced by half until a successful response is obtained or until page_size can't be
         reduced anymore.
+        Full retrievals use keyset pagination if enabled in the config, so that each page is retrieved in
+        constant time and concurrent changes don't make elements be skipped. Elements modified during the
+        retrieval are returned once, with their latest contents. Servers that don't support keyset
+        pagination are iterated by offset.
+        Only valid elements are retrieved, unless the filters explicitly ask for invalid ones.
 
         Args:
             url (str): The url to retrieve elements from
@@ -120,29 +165,25 @@ class REST(Comms):
             offset = filters["offset"]
 
         el_list = []
-        filters.update({"is_valid": True})
+        filters = self.__valid_only_by_default(filters)
+        keyset = (
+            config.comms_keyset_pagination and num_elements is None and offset == 0
+        )
+        deduplicate = keyset
+        cursor = None
         if num_elements is None:
             num_elements = float("inf")
 
         while len(el_list) < num_elements:
-            filters.update({"limit": page_size, "offset": offset})
-            query_str = "&".join([f"{k}={v}" for k, v in filters.items()])
+            page_params = self.__page_params(page_size, offset, keyset, cursor)
+            page_filters = {**filters, **page_params}
+            query_str = "&".join([f"{k}={v}" for k, v in page_filters.items()])
             paginated_url = f"{url}?{query_str}"
             res = self.__auth_get(paginated_url)
             if res.status_code != 200:
-                if not binary_reduction:
-                    log_response_error(res)
-                    details = format_errors_dict(res.json())
-                    raise CommunicationRetrievalError(f"{error_msg}: {details}")
-
-                log_response_error(res, warn=True)
-                details = format_errors_dict(res.json())
-                if page_size <= 1:
-                    logging.debug(
-                        "Could not retrieve list. Minimum page size achieved without success"
-                    )
-                    raise CommunicationRetrievalError(f"{error_msg}: {details}")
-                page_size = page_size // 2
+                page_size = self.__reduce_page_size(
+                    res, page_size, binary_reduction, error_msg
+                )
                 continue
             else:
                 data = res.json()
@@ -150,11 +191,93 @@ class REST(Comms):
                 offset += len(data["results"])
                 if data["next"] is None:
                     break
+                if keyset:
+                    cursor = self.__get_cursor(data["next"])
+                    # Servers without keyset pagination ignore it and paginate by offset
+                    keyset = cursor is not None
 
+        if deduplicate:
+            el_list = self.__deduplicate(el_list)
         if isinstance(num_elements, int):
             return el_list[:num_elements]
         return el_list
 
+    @staticmethod
+    def __valid_only_by_default(filters: dict) -> dict:
+        filters = dict(filters)
+        if filters.get("is_valid") is None:
+            filters["is_valid"] = True
+        return filters
+
+    @staticmethod
+    def __page_params(
+        page_size: int, offset: int, keyset: bool, cursor: Optional[str]
+    ) -> dict:
+        if not keyset:
+            return {"limit": page_size, "offset": offset}
+        params = {"limit": page_size, "pagination": "keyset"}
+        if cursor is not None:
+            params["cursor"] = quote(cursor)
+        return params
+
+    @staticmethod
+    def __get_cursor(next_url: str) -> Optional[str]:
+        cursors = parse_qs(urlparse(next_url).query).get("cursor")
+        return cursors[0] if cursors else None
+
+    @staticmethod
+    def __deduplicate(el_list: List[dict]) -> List[dict]:
+        """Keeps the last retrieved version of each element, at the position of the
+        first one. Elements without an id are kept as is."""
+        latest = {el["id"]: el for el in el_list if "id" in el}
+        deduplicated = []
+        for el in el_list:
+            if "id" not in el:
+                deduplicated.append(el)
+            elif el["id"] in latest:
+                deduplicated.append(latest.pop(el["id"]))
+        return deduplicated
+
+    @staticmethod
+    def __reduce_page_size(
+        res, page_size: int, binary_reduction: bool, error_msg: str
+    ) -> int:
+        """Handles a failed page request. If binary_reduction is enabled, returns the
+        page size to retry with. Otherwise, or if the page size can't be reduced,
+        raises an error."""
+        if not binary_reduction:
+            log_response_error(res)
+            details = format_errors_dict(res.json())
+            raise CommunicationRetrievalError(f"{error_msg}: {details}")
+
+        log_response_error(res, warn=True)
+        details = format_errors_dict(res.json())
+        if page_size <= 1:
+            logging.debug(
+                "Could not retrieve list. Minimum page size achieved without success"
+            )
+            raise CommunicationRetrievalError(f"{error_msg}: {details}")
+        return page_size // 2
+
+    def __get_by_ids(self, url: str, uids: List[int], error_msg: str) -> List[dict]:
+        """Retrieves the objects with the given ids from a list URL using the id__in filter.
+        Ids are sent in chunks of config.comms_max_ids_per_request to keep URLs short.
+        Objects that don't exist or are filtered out by the server are not returned.
+        """
+        el_list = []
+        chunk_size = config.comms_max_ids_per_request
+        for i in range(0, len(uids), chunk_size):
+            chunk = uids[i : i + chunk_size]  # noqa: E203
+            filters = {"id__in": ",".join(str(uid) for uid in chunk)}
+            el_list += self.__get_list(
+                url,
+                num_elements=len(chunk),
+                page_size=len(chunk),
+                filters=filters,
+                error_msg=error_msg,
+            )
+        return el_list
+
     def __get(self, url: str, error_msg: str) -> dict:
         """self.__auth_get with error handling"""
         res = self.__auth_get(url)
@@ -164,9 +287,31 @@ class REST(Comms):
             raise CommunicationRetrievalError(f"{error_msg}: {details}")
         return res.json()
 
+    def __get_if_modified(
+        self, url: str, etag: Optional[str], error_msg: str
+    ) -> Tuple[Optional[dict], Optional[str]]:
+        """self.__get, conditioned on the object having changed since the given ETag.
+
+        Returns:
+            dict: the object, or None if it didn't change
+            str: the ETag of the current version of the object
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        res = self.__auth_get(url, headers=headers)
+        if res.status_code == 304:
+            return None, etag
+        if res.status_code != 200:
+            log_response_error(res)
+            details = format_errors_dict(res.json())
+            raise CommunicationRetrievalError(f"{error_msg}: {details}")
+        return res.json(), res.headers.get("ETag")
+
     def __post(self, url: str, json: dict, error_msg: str) -> int:
         """self.__auth_post with error handling"""
         res = self.__auth_post(url, json=json)
+        if res.status_code >= 500:
+            log_response_error(res)
+            raise CommunicationServerError(f"{error_msg}: server error")
         if res.status_code != 201:
             log_response_error(res)
             details = format_errors_dict(res.json())
@@ -344,6 +489,58 @@ class REST(Comms):
         error_msg = "Could not retrieve model"
         return self.__get(url, error_msg)
 
+    # conditional get object
+    def get_benchmark_if_modified(
+        self, benchmark_uid: int, etag: Optional[str] = None
+    ) -> Tuple[Optional[dict], Optional[str]]:
+        """Retrieves the benchmark specification if it changed since the given ETag
+
+        Args:
+            benchmark_uid (int): uid for the desired benchmark
+            etag (str, optional): ETag of the locally available version. Defaults to None.
+
+        Returns:
+            dict: benchmark specification, or None if not modified
+            str: ETag of the current version
+        """
+        url = f"{self.server_url}/benchmarks/{benchmark_uid}"
+        error_msg = "Could not retrieve benchmark"
+        return self.__get_if_modified(url, etag, error_msg)
+
+    def get_cube_metadata_if_modified(
+        self, cube_uid: int, etag: Optional[str] = None
+    ) -> Tuple[Optional[dict], Optional[str]]:
+        """Retrieves metadata about the specified cube if it changed since the given ETag
+
+        Args:
+            cube_uid (int): UID of the desired cube.
+            etag (str, optional): ETag of the locally available version. Defaults to None.
+
+        Returns:
+            dict: cube metadata, or None if not modified
+            str: ETag of the current version
+        """
+        url = f"{self.server_url}/mlcubes/{cube_uid}/"
+        error_msg = "Could not retrieve mlcube"
+        return self.__get_if_modified(url, etag, error_msg)
+
+    def get_model_if_modified(
+        self, model_uid: int, etag: Optional[str] = None
+    ) -> Tuple[Optional[dict], Optional[str]]:
+        """Retrieves a specific model if it changed since the given ETag
+
+        Args:
+            model_uid (int): Model UID
+            etag (str, optional): ETag of the locally available version. Defaults to None.
+
+        Returns:
+            dict: model metadata, or None if not modified
+            str: ETag of the current version
+        """
+        url = f"{self.server_url}/models/{model_uid}/"
+        error_msg = "Could not retrieve model"
+        return self.__get_if_modified(url, etag, error_msg)
+
     # get object of an object
     def get_experiment_event(self, training_exp_id: int) -> dict:
         """Retrieves the training experiment's event object from the server
@@ -397,6 +594,50 @@ class REST(Comms):
         error_msg = f"Could not retrieve model for asset {asset_id}"
         return self.__get(url, error_msg)
 
+    # batch retrieval
+    def get_many(self, retriever: Callable[[int], dict], uids: List[int]) -> List[dict]:
+        """Retrieves several objects of the same type, one request per object. Up to
+        config.comms_max_request_workers requests are issued concurrently.
+
+        Args:
+            retriever (Callable[[int], dict]): comms method retrieving a single object (e.g. get_model)
+            uids (List[int]): UIDs of the objects to retrieve
+
+        Returns:
+            List[dict]: Objects information, in the same order as the given uids
+        """
+        max_workers = min(config.comms_max_request_workers, len(uids))
+        if max_workers <= 1:
+            return [retriever(uid) for uid in uids]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(retriever, uids))
+
+    def get_many_cubes(self, cube_uids: List[int]) -> List[dict]:
+        """Retrieves the metadata of several MLCubes with as few requests as possible.
+
+        Args:
+            cube_uids (List[int]): UIDs of the MLCubes
+
+        Returns:
+            List[dict]: metadata of the MLCubes found. Missing MLCubes are omitted
+        """
+        url = f"{self.server_url}/mlcubes/"
+        error_msg = f"Could not retrieve mlcubes {cube_uids}"
+        return self.__get_by_ids(url, cube_uids, error_msg)
+
+    def get_many_models(self, model_uids: List[int]) -> List[dict]:
+        """Retrieves the metadata of several models with as few requests as possible.
+
+        Args:
+            model_uids (List[int]): UIDs of the models
+
+        Returns:
+            List[dict]: metadata of the models found. Missing models are omitted
+        """
+        url = f"{self.server_url}/models/"
+        error_msg = f"Could not retrieve models {model_uids}"
+        return self.__get_by_ids(url, model_uids, error_msg)
+
     # get list
     def get_benchmarks(self, filters=dict()) -> List[dict]:
         """Retrieves all benchmarks in the platform.
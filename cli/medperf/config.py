@@ -240,6 +240,11 @@ log_package_file = "medperf_logs.tar.gz"
 tarball_filename = "tmp.tar.gz"
 demo_dset_paths_file = "paths.yaml"
 mlcube_cache_file = ".cache_metadata.yaml"
+verified_hash_suffix = ".verified.yaml"  # Sidecar recording the verified hash of a cached file
+entity_cache_info_file = ".entity_cache_info.yaml"
+entity_sync_index_file = ".sync_index.json"
+docker_images_registry_file = "docker_images.yaml"
+sif_images_registry_file = "sif_images.yaml"
 training_exps_filename = "training-info.yaml"
 participants_list_filename = "cols.yaml"
 training_exp_plan_filename = "plan.yaml"
@@ -257,6 +262,8 @@ metadata_folder = "metadata"
 statistics_filename = "statistics.yaml"
 dataset_raw_paths_file = "raw.yaml"
 ready_flag_file = ".ready"
+dataset_hash_index_file = ".hash_index.json"
+dataset_raw_hash_index_file = ".raw_hash_index.json"
 asset_local_archive_info_file = "archive_info.yaml"
 partial_flag = ".partial"
 executed_flag = ".executed"
@@ -274,8 +281,31 @@ container_key_file = "container.key"
 
 # requests
 default_page_size = 32  # This number was chosen arbitrarily
+comms_pool_size = 10  # Max number of kept-alive connections to the server
+comms_max_retries = 3  # Retries for idempotent requests (GET/PUT) on connection errors
+comms_retry_backoff_factor = 0.5  # Sleep between retries: {backoff factor} * (2 ** retry)
+comms_retry_status_codes = [502, 503, 504]
+comms_connect_timeout = 10  # In seconds
+comms_read_timeout = 120  # In seconds
+comms_max_request_workers = 4  # Max number of requests issued concurrently when retrieving objects one by one
+comms_max_ids_per_request = 100  # Max number of ids sent in a single batch retrieval request
+comms_keyset_pagination = True  # Retrieve full lists by (modified_at, id) cursors instead of offsets
+encrypted_keys_upload_chunk_size = 100  # Max number of encrypted keys uploaded per request
+encrypted_keys_upload_attempts = 3  # Attempts per chunk of encrypted keys before giving up
+entity_cache_ttl = 0  # In seconds. Cached entities younger than this are not revalidated
+entity_list_sync = True  # Retrieve only the entities changed since the last listing
+entity_list_sync_max_age = 24 * 60 * 60  # In seconds. Older synced lists are retrieved in full
+entity_list_sync_overlap = 60  # In seconds. Changes this close to the watermark are retrieved again
+entity_list_sync_max_lists = 20  # Max number of lists kept in the sync index of each entity type
+hash_chunk_size = 4 * 1024 * 1024  # 4MB. Read size when hashing files
+hash_workers = 4  # Max number of files hashed concurrently
 ddl_stream_chunk_size = 10 * 1024 * 1024  # 10MB. This number was chosen arbitrarily
-ddl_max_redownload_attempts = 3
+ddl_max_redownload_attempts = 3  # Consecutive failed attempts. Attempts that resume the download don't count
+ddl_parallel_connections = 1  # Connections used to download large files from servers supporting range requests
+ddl_parallel_part_size = 64 * 1024**2  # 64MB. Size of the parts downloaded by each connection
+ddl_progress_interval = 1  # Seconds between download progress updates
+ddl_connect_timeout = 10  # In seconds
+ddl_read_timeout = 60  # In seconds. Max wait for the next bytes of a download
 wait_before_sending_reports = 30  # In seconds
 
 # Container config
@@ -290,6 +320,12 @@ evaluate_timeout = None
 container_loglevel = None
 mlcube_configure_timeout = None
 mlcube_inspect_timeout = None
+container_prefetch_workers = 2  # Containers downloaded in the background during benchmark executions. 0 disables
+container_decryption_streaming = True  # Pipe decrypted docker archives into `docker load` instead of writing them to disk
+decrypted_files_tmpfs = None  # e.g. /dev/shm/medperf. Memory-backed folder for decrypted containers that must be files
+docker_image_cache_size = 50 * 1024**3  # 50GB. Least recently used images loaded from docker archives are removed beyond this
+sif_image_cache_size = 50 * 1024**3  # 50GB. Least recently used SIF images built by singularity are removed beyond this
+singularity_encrypted_sif_cache = False  # Cache the SIF images of encrypted docker archives, encrypted with the container key
 
 # Other
 loglevel = "debug"
@@ -344,6 +380,9 @@ configurable_parameters = [
     "auth_audience",
     "certificate_authority_id",
     "certificate_authority_fingerprint",
+    "decrypted_files_tmpfs",
+    "singularity_encrypted_sif_cache",
+    "ddl_parallel_connections",
 ]
 
 templates = {
@@ -359,6 +398,9 @@ sensitive_tmp_paths = []
 
 # Data Import/Export config
 archive_config_filename = "config.yaml"
+dataset_archive_manifest_filename = "manifest.yaml"
+dataset_import_marker_file = ".import_in_progress"
+dataset_archive_threads = 0  # Threads used by zstd/pigz to compress dataset archives. 0 uses all cores
 
 # Running containers processes
 running_containers = {}
@@ -0,0 +1,213 @@
+"""Keeps track of the images loaded from unencrypted Docker archives, so that each
+archive is only loaded once instead of on every run. Loaded images are recorded
+by archive hash in a registry file. A recorded image is reused only if an image
+with the recorded ID still exists locally. The least recently used images are
+removed when their total size exceeds config.docker_image_cache_size.
+
+Runs in other processes are coordinated with file locks in config.images_folder:
+the registry is locked while it is updated, only one process loads each archive,
+and images are locked (shared) while in use, so that they are only evicted when
+no process uses them."""
+
+import fcntl
+import logging
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+import yaml
+
+from medperf import config
+from .docker_utils import (
+    delete_image,
+    get_local_image_props,
+    get_repo_tags_from_archive,
+    load_image,
+)
+
+DOCKER_LOCKS_FOLDER = ".locks"
+
+_registry_lock = threading.Lock()
+_archive_locks = defaultdict(threading.Lock)
+_in_use = Counter()
+
+
+def _registry_path() -> str:
+    return os.path.join(config.images_folder, config.docker_images_registry_file)
+
+
+@contextmanager
+def _lock_file(name: str):
+    """Opens the lock file of an archive or of the registry. Locks are released
+    when the file is closed"""
+    lock_path = os.path.join(config.images_folder, DOCKER_LOCKS_FOLDER, f"{name}.lock")
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    with open(lock_path, "a") as f:
+        yield f
+
+
+@contextmanager
+def _locked_registry():
+    with _registry_lock, _lock_file(config.docker_images_registry_file) as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
+
+def _read_registry() -> dict:
+    registry_path = _registry_path()
+    if not os.path.exists(registry_path):
+        return {}
+    with open(registry_path) as f:
+        registry = yaml.safe_load(f)
+    if not isinstance(registry, dict):
+        return {}
+    return registry
+
+
+def _write_registry(registry: dict):
+    registry_path = _registry_path()
+    os.makedirs(os.path.dirname(registry_path), exist_ok=True)
+    tmp_path = f"{registry_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        yaml.safe_dump(registry, f)
+    os.replace(tmp_path, registry_path)
+
+
+def _update_entry(archive_hash: str, entry: dict = None):
+    """Records (or forgets, if entry is None) the image loaded from an archive"""
+    with _locked_registry():
+        registry = _read_registry()
+        if entry is None:
+            registry.pop(archive_hash, None)
+        else:
+            registry[archive_hash] = entry
+        _write_registry(registry)
+
+
+def _get_cached_image(archive_hash: str):
+    with _locked_registry():
+        entry = _read_registry().get(archive_hash)
+    if entry is None:
+        return None
+
+    props = get_local_image_props(entry["image_id"])
+    if props is None or props[0] != entry["image_id"]:
+        logging.debug(f"Image loaded from archive {archive_hash} no longer exists")
+        _update_entry(archive_hash)
+        return None
+
+    entry["last_used"] = time.time()
+    _update_entry(archive_hash, entry)
+    return entry["image_id"]
+
+
+def _load_archive(archive_path: str, archive_hash: str) -> str:
+    repo_tags_list = get_repo_tags_from_archive(archive_path)
+    load_image(archive_path)
+    image = repo_tags_list[0]
+    props = get_local_image_props(image)
+    if props is None:
+        # Shouldn't happen after a successful load. Run by tag without caching
+        return image
+
+    image_id, size = props
+    entry = {
+        "image_id": image_id,
+        "repo_tags": repo_tags_list,
+        "size": size,
+        "last_used": time.time(),
+    }
+    _update_entry(archive_hash, entry)
+    return image_id
+
+
+def _hold_image(lock_file, archive_path: str, archive_hash: str) -> str:
+    """Loads the archive if its image isn't in the cache, and leaves the image locked
+    in shared mode, so that other processes don't evict it while it is in use"""
+    fcntl.flock(lock_file, fcntl.LOCK_SH)
+    # Only one process loads the archive, the others wait for it
+    with _lock_file(f"{archive_hash}.load") as load_lock:
+        fcntl.flock(load_lock, fcntl.LOCK_EX)
+        image = _get_cached_image(archive_hash)
+        if image is not None:
+            logging.debug(f"Reusing image loaded from archive {archive_hash}")
+            return image
+        logging.debug(f"Loading archive {archive_hash}")
+        return _load_archive(archive_path, archive_hash)
+
+
+def _next_eviction(skipped: set):
+    """Removes the least recently used image that isn't in use by this process from
+    the registry, if the images exceed the budget, and returns its entry"""
+    with _locked_registry():
+        registry = _read_registry()
+        total_size = sum(entry["size"] for entry in registry.values())
+        if total_size <= config.docker_image_cache_size:
+            return None
+        by_last_use = sorted(registry.items(), key=lambda item: item[1]["last_used"])
+        for archive_hash, entry in by_last_use:
+            if _in_use[archive_hash] or archive_hash in skipped:
+                continue
+            del registry[archive_hash]
+            _write_registry(registry)
+            return archive_hash, entry
+    return None
+
+
+def _try_delete_image(archive_hash: str, image_id: str) -> bool:
+    """Deletes the image loaded from an archive unless another process is using it"""
+    with _lock_file(archive_hash) as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return delete_image(image_id)
+
+
+def _evict():
+    """Removes the least recently used images until their total size fits the
+    budget. Images in use by any process are never removed, and images that
+    docker can't delete without forcing (e.g. used by a container or tagged
+    again) are kept."""
+    skipped = set()
+    while True:
+        evicted = _next_eviction(skipped)
+        if evicted is None:
+            return
+        archive_hash, entry = evicted
+        logging.debug(f"Evicting image loaded from archive {archive_hash}")
+        # Sizes are reported per image, so layers shared between images are counted twice
+        if not _try_delete_image(archive_hash, entry["image_id"]):
+            skipped.add(archive_hash)
+            _update_entry(archive_hash, entry)
+
+
+@contextmanager
+def loaded_image(archive_path: str, archive_hash: str):
+    """Makes sure the image of a Docker archive is loaded, loading it only if it
+    isn't already, and yields the image to run. The image is protected from
+    eviction while in use.
+
+    Args:
+        archive_path (str): path of the Docker archive
+        archive_hash (str): hash of the archive, identifying it in the registry
+
+    Yields:
+        str: the ID (or, if it couldn't be inspected, the tag) of the loaded image
+    """
+    with _registry_lock:
+        archive_lock = _archive_locks[archive_hash]
+    with _lock_file(archive_hash) as lock_file:
+        with archive_lock:
+            image = _hold_image(lock_file, archive_path, archive_hash)
+            with _registry_lock:
+                _in_use[archive_hash] += 1
+
+        try:
+            _evict()
+            yield image
+        finally:
+            with _registry_lock:
+                _in_use[archive_hash] -= 1
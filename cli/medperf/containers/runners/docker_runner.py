@@ -1,3 +1,4 @@
+from medperf import config
 from medperf.comms.entity_resources import resources
 from medperf.exceptions import MedperfException
 from .utils import (
@@ -16,8 +17,10 @@ from .docker_utils import (
     get_docker_image_hash,
     get_repo_tags_from_archive,
     load_image,
+    load_encrypted_image,
     delete_images,
 )
+from .docker_image_cache import loaded_image
 from medperf.encryption import SymmetricEncryption
 from medperf.utils import remove_path, run_command, tmp_path_for_file_decryption
 import uuid
@@ -27,6 +30,11 @@ class DockerRunner(Runner):
     def __init__(self, container_config_parser):
         self.parser = container_config_parser
         self.image: str = None
+
+        # These two will be set during download of docker archive
+        self.image_archive_path: str = None
+        self.image_archive_hash: str = None
+
         if self.parser.is_container_encrypted():
             SymmetricEncryption().check()
 
@@ -74,6 +82,7 @@ class DockerRunner(Runner):
             file_url, expected_image_hash
         )  # Hash checking happens in resources
         self.image_archive_path = image_path
+        self.image_archive_hash = computed_image_hash
         return computed_image_hash
 
     def run(
@@ -132,15 +141,10 @@ class DockerRunner(Runner):
         if self.image_archive_path is None:
             raise MedperfException("Internal error: run was called before download.")
 
-        # load archive
-        repo_tags_list = get_repo_tags_from_archive(self.image_archive_path)
-        load_image(self.image_archive_path)
-
-        # Set Image
-        image = repo_tags_list[0]
-
-        # Run
-        self._invoke_run(image, run_args, timeout, output_logs)
+        # load archive, unless it was already loaded
+        with loaded_image(self.image_archive_path, self.image_archive_hash) as image:
+            # Run
+            self._invoke_run(image, run_args, timeout, output_logs)
 
     def _run_encrypted_archive(
         self, run_args, timeout, output_logs, container_decryption_key_file
@@ -158,6 +162,12 @@ class DockerRunner(Runner):
                 "Internal error: Container should be automatically deleted after run"
             )
 
+        if config.container_decryption_streaming:
+            self._run_encrypted_archive_streaming(
+                run_args, timeout, output_logs, container_decryption_key_file
+            )
+            return
+
         decrypted_archive_path = tmp_path_for_file_decryption()
         repo_tags_list = []
         try:
@@ -183,6 +193,26 @@ class DockerRunner(Runner):
             remove_path(decrypted_archive_path, sensitive=True)
             delete_images(repo_tags_list)
 
+    def _run_encrypted_archive_streaming(
+        self, run_args, timeout, output_logs, container_decryption_key_file
+    ):
+        logging.debug("Decrypting archive into docker load")
+        repo_tags_list = []
+        try:
+            # decrypt and load archive
+            repo_tags_list = load_encrypted_image(
+                self.image_archive_path, container_decryption_key_file
+            )
+
+            # Set Image
+            image = repo_tags_list[0]
+
+            # Run
+            self._invoke_run(image, run_args, timeout, output_logs)
+
+        finally:
+            delete_images(repo_tags_list)
+
     def _invoke_run(self, image, run_args, timeout, output_logs):
         run_args["image"] = image
         task = run_args.pop("task")
@@ -1,7 +1,9 @@
 import os
+from typing import Optional, Tuple
 
 from medperf.exceptions import ExecutionError, InvalidContainerSpec, MedperfException
 from medperf import config
+from medperf.encryption import SymmetricEncryption
 
 from medperf.utils import run_command
 import shlex
@@ -169,6 +171,46 @@ def load_image(image_archive_path):
     run_command(docker_load_cmd)
 
 
+def load_encrypted_image(
+    encrypted_archive_path: str, decryption_key_file: str
+) -> list[str]:
+    """Loads an encrypted image archive, piping the decrypted archive into
+    `docker load` so that it is never written to disk.
+
+    Returns:
+        list[str]: the repo tags of the loaded images (or their IDs if untagged)
+    """
+    logging.debug(f"Loading encrypted image {encrypted_archive_path}")
+    docker_load_cmd = ["docker", "load"]
+    output = SymmetricEncryption().decrypt_file_to_command(
+        encrypted_archive_path, decryption_key_file, docker_load_cmd
+    )
+    images = []
+    for line in output.splitlines():
+        line = line.strip()
+        for prefix in ["Loaded image:", "Loaded image ID:"]:
+            if line.startswith(prefix):
+                images.append(line[len(prefix) :].strip())  # noqa: E203
+    logging.debug(f"Loaded images: {images}")
+    if not images:
+        raise ExecutionError("Could not find the images loaded by docker")
+    return images
+
+
+def get_local_image_props(image: str) -> Optional[Tuple[str, int]]:
+    """Returns the ID and size (in bytes) of a local image, or None if the image
+    doesn't exist locally."""
+    logging.debug(f"Inspecting local image {image}")
+    inspect_cmd = ["docker", "image", "inspect", "--format", "{{.Id}} {{.Size}}", image]
+    try:
+        output = run_command(inspect_cmd)
+    except ExecutionError:
+        logging.debug(f"Image {image} not found locally")
+        return None
+    image_id, size = output.strip().split()
+    return image_id, int(size)
+
+
 def delete_images(images):
     if len(images) == 0:
         logging.debug("No images to delete")
@@ -183,6 +225,18 @@ def delete_images(images):
         config.ui.print_warning("WARNING: Failed to delete docker images.")
 
 
+def delete_image(image: str) -> bool:
+    """Deletes an image unless it is used by a container or has several tags.
+    Returns whether the image was deleted."""
+    logging.debug(f"Deleting image {image}")
+    try:
+        run_command(["docker", "rmi", image])
+    except ExecutionError:
+        logging.debug(f"Could not delete image {image}")
+        return False
+    return True
+
+
 def full_docker_image_name(image_name: str) -> str:
     """
     Returns the full docker image name with registry.
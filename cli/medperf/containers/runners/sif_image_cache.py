@@ -0,0 +1,175 @@
+"""Keeps track of the SIF images built by the singularity runner in
+config.images_folder, so that each image is only built once and the folder stays
+within config.sif_image_cache_size. Images are recorded by file name in a registry
+file, and the least recently used ones are removed when their total size exceeds
+the budget. Images are built into a temporary file and then moved into place, so
+a concurrent run never sees a partially built image.
+
+Runs in other processes are coordinated with file locks in config.images_folder:
+the registry is locked while it is updated, only one process builds each image,
+and images are locked (shared) while in use, so that they are only evicted when
+no process uses them."""
+
+import fcntl
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Callable
+
+import yaml
+
+from medperf import config
+from medperf.utils import remove_path
+
+SIF_LOCKS_FOLDER = ".locks"
+
+_registry_lock = threading.Lock()
+_image_locks = defaultdict(threading.Lock)
+_in_use = Counter()
+
+
+def _registry_path() -> str:
+    return os.path.join(config.images_folder, config.sif_images_registry_file)
+
+
+@contextmanager
+def _lock_file(name: str):
+    """Opens the lock file of an image or of the registry. Locks are released
+    when the file is closed"""
+    lock_path = os.path.join(config.images_folder, SIF_LOCKS_FOLDER, f"{name}.lock")
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    with open(lock_path, "a") as f:
+        yield f
+
+
+@contextmanager
+def _locked_registry():
+    with _registry_lock, _lock_file(config.sif_images_registry_file) as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
+
+def _read_registry() -> dict:
+    registry_path = _registry_path()
+    if not os.path.exists(registry_path):
+        return {}
+    with open(registry_path) as f:
+        registry = yaml.safe_load(f)
+    if not isinstance(registry, dict):
+        return {}
+    return registry
+
+
+def _write_registry(registry: dict):
+    registry_path = _registry_path()
+    os.makedirs(os.path.dirname(registry_path), exist_ok=True)
+    tmp_path = f"{registry_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        yaml.safe_dump(registry, f)
+    os.replace(tmp_path, registry_path)
+
+
+def _record_use(image_name: str, image_path: str):
+    """Records the size and time of last use of an image. Images built by previous
+    versions, which are not in the registry yet, are recorded on their first use"""
+    with _locked_registry():
+        registry = _read_registry()
+        registry[image_name] = {
+            "size": os.path.getsize(image_path),
+            "last_used": time.time(),
+        }
+        _write_registry(registry)
+
+
+def _build_image(image_path: str, build: Callable[[str], None]):
+    os.makedirs(os.path.dirname(image_path), exist_ok=True)
+    tmp_path = f"{image_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        build(tmp_path)
+        os.replace(tmp_path, image_path)
+    finally:
+        remove_path(tmp_path)
+
+
+def _hold_image(lock_file, image_name: str, build: Callable[[str], None]):
+    """Builds the image if it isn't in the cache, and leaves it locked in shared
+    mode, so that other processes don't evict it while it is in use"""
+    image_path = os.path.join(config.images_folder, image_name)
+    fcntl.flock(lock_file, fcntl.LOCK_SH)
+    if os.path.exists(image_path):
+        logging.debug(f"Reusing SIF image {image_name}")
+        return
+    # Only one process builds the image, the others wait for it
+    with _lock_file(f"{image_name}.build") as build_lock:
+        fcntl.flock(build_lock, fcntl.LOCK_EX)
+        if os.path.exists(image_path):
+            logging.debug(f"Reusing SIF image {image_name}")
+            return
+        logging.debug(f"Building SIF image {image_name}")
+        _build_image(image_path, build)
+
+
+def _try_remove_image(image_name: str) -> bool:
+    """Removes an image unless another process is using it"""
+    with _lock_file(image_name) as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        remove_path(os.path.join(config.images_folder, image_name))
+    return True
+
+
+def _evict():
+    """Removes the least recently used images until their total size fits the
+    budget. Images in use by any process are never removed."""
+    with _locked_registry():
+        registry = _read_registry()
+        total_size = sum(entry["size"] for entry in registry.values())
+        by_last_use = sorted(registry.items(), key=lambda item: item[1]["last_used"])
+        evicted = False
+        for image_name, entry in by_last_use:
+            if total_size <= config.sif_image_cache_size:
+                break
+            if _in_use[image_name] or not _try_remove_image(image_name):
+                continue
+            logging.debug(f"Evicted SIF image {image_name}")
+            del registry[image_name]
+            total_size -= entry["size"]
+            evicted = True
+        if evicted:
+            _write_registry(registry)
+
+
+@contextmanager
+def cached_image(image_name: str, build: Callable[[str], None]):
+    """Makes sure a SIF image is in the cache, building it only if it isn't already,
+    and yields its path. The image is protected from eviction while in use.
+
+    Args:
+        image_name (str): file name of the image in the cache
+        build (Callable[[str], None]): builds the image at the given path
+
+    Yields:
+        str: the path of the cached image
+    """
+    image_path = os.path.join(config.images_folder, image_name)
+    with _registry_lock:
+        image_lock = _image_locks[image_name]
+    with _lock_file(image_name) as lock_file:
+        with image_lock:
+            _hold_image(lock_file, image_name, build)
+            _record_use(image_name, image_path)
+            with _registry_lock:
+                _in_use[image_name] += 1
+
+        try:
+            _evict()
+            yield image_path
+        finally:
+            with _registry_lock:
+                _in_use[image_name] -= 1
@@ -17,9 +17,9 @@ from .singularity_utils import (
     craft_singularity_run_command,
     convert_docker_image_to_sif,
 )
+from .sif_image_cache import cached_image
 from medperf.encryption import SymmetricEncryption
 
-import os
 from medperf import config
 import semver
 from .runner import Runner
@@ -29,7 +29,6 @@ import logging
 class SingularityRunner(Runner):
     def __init__(self, container_config_parser):
         self.parser = container_config_parser
-        self.converted_singularity_images = config.images_folder
         executable, runtime, version = get_singularity_executable_props()
         self.executable = executable
         self.runtime = runtime
@@ -182,20 +181,17 @@ class SingularityRunner(Runner):
         if self.image_file_path is None or self.image_file_hash is None:
             raise MedperfException("Internal error: Run is called before download.")
 
-        converted_sif_image_file = os.path.join(
-            self.converted_singularity_images, f"{self.image_file_hash}.sif"
-        )
-
-        # convert
-        convert_docker_image_to_sif(
-            docker_image=self.image_file_path,
-            output_sif=converted_sif_image_file,
-            singularity_executable=self.executable,
-            protocol="docker-archive",
-        )
+        def convert(output_sif):
+            convert_docker_image_to_sif(
+                docker_image=self.image_file_path,
+                output_sif=output_sif,
+                singularity_executable=self.executable,
+                protocol="docker-archive",
+            )
 
-        # Run
-        self._invoke_run(converted_sif_image_file, run_args, timeout, output_logs)
+        # convert if not cached, and run
+        with cached_image(f"{self.image_file_hash}.sif", convert) as sif_image:
+            self._invoke_run(sif_image, run_args, timeout, output_logs)
 
     def _run_docker_image(self, run_args, timeout, output_logs):
         logging.debug("Running unencrypted docker image")
@@ -204,19 +200,16 @@ class SingularityRunner(Runner):
 
         docker_image = self.parser.get_setup_args()
 
-        converted_sif_image_file = os.path.join(
-            self.converted_singularity_images, f"{self.docker_image_hash}.sif"
-        )
-
-        # convert
-        convert_docker_image_to_sif(
-            docker_image=docker_image,
-            output_sif=converted_sif_image_file,
-            singularity_executable=self.executable,
-        )
+        def convert(output_sif):
+            convert_docker_image_to_sif(
+                docker_image=docker_image,
+                output_sif=output_sif,
+                singularity_executable=self.executable,
+            )
 
-        # Run
-        self._invoke_run(converted_sif_image_file, run_args, timeout, output_logs)
+        # convert if not cached, and run
+        with cached_image(f"{self.docker_image_hash}.sif", convert) as sif_image:
+            self._invoke_run(sif_image, run_args, timeout, output_logs)
 
     def _run_encrypted_singularity_file(
         self, run_args, timeout, output_logs, container_decryption_key_file
@@ -230,11 +223,27 @@ class SingularityRunner(Runner):
                 "Container is encrypted but decryption key is not provided"
             )
 
+        self._run_encrypted_sif(
+            self.image_file_path,
+            run_args,
+            timeout,
+            output_logs,
+            container_decryption_key_file,
+        )
+
+    def _run_encrypted_sif(
+        self,
+        encrypted_sif_file,
+        run_args,
+        timeout,
+        output_logs,
+        container_decryption_key_file,
+    ):
         decrypted_sif_file = tmp_path_for_file_decryption()
         try:
             # decrypt file
             SymmetricEncryption().decrypt_file(
-                self.image_file_path,
+                encrypted_sif_file,
                 container_decryption_key_file,
                 decrypted_sif_file,
             )
@@ -255,9 +264,47 @@ class SingularityRunner(Runner):
                 "Container is encrypted but decryption key is not provided"
             )
 
-        converted_sif_image_file = os.path.join(
-            self.converted_singularity_images, f"{self.image_file_hash}.sif"
-        )
+        if not config.singularity_encrypted_sif_cache:
+            converted_sif_image_file = tmp_path_for_file_decryption()
+            try:
+                self._convert_encrypted_docker_archive(
+                    container_decryption_key_file, converted_sif_image_file
+                )
+                # Run
+                self._invoke_run(
+                    converted_sif_image_file, run_args, timeout, output_logs
+                )
+            finally:
+                remove_path(converted_sif_image_file, sensitive=True)
+            return
+
+        def convert_and_encrypt(output_path):
+            converted_sif_image_file = tmp_path_for_file_decryption()
+            try:
+                self._convert_encrypted_docker_archive(
+                    container_decryption_key_file, converted_sif_image_file
+                )
+                SymmetricEncryption().encrypt_file(
+                    converted_sif_image_file, container_decryption_key_file, output_path
+                )
+            finally:
+                remove_path(converted_sif_image_file, sensitive=True)
+
+        # convert if not cached, and run. The image is cached encrypted with the
+        # same key as the archive, so it is only decrypted for the duration of the run
+        image_name = f"{self.image_file_hash}.sif.gpg"
+        with cached_image(image_name, convert_and_encrypt) as encrypted_sif_image:
+            self._run_encrypted_sif(
+                encrypted_sif_image,
+                run_args,
+                timeout,
+                output_logs,
+                container_decryption_key_file,
+            )
+
+    def _convert_encrypted_docker_archive(
+        self, container_decryption_key_file, output_sif
+    ):
         decrypted_archive_file = tmp_path_for_file_decryption()
         try:
             # decrypt file
@@ -270,18 +317,11 @@ class SingularityRunner(Runner):
             # convert
             convert_docker_image_to_sif(
                 docker_image=decrypted_archive_file,
-                output_sif=converted_sif_image_file,
+                output_sif=output_sif,
                 singularity_executable=self.executable,
                 protocol="docker-archive",
             )
-            remove_path(decrypted_archive_file, sensitive=True)
-            cleanup_singularity_cache(self.executable)
-
-            # Run
-            self._invoke_run(converted_sif_image_file, run_args, timeout, output_logs)
-
         finally:
-            remove_path(converted_sif_image_file, sensitive=True)
             remove_path(decrypted_archive_file, sensitive=True)
             cleanup_singularity_cache(self.executable)
 
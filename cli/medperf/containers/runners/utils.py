@@ -1,8 +1,29 @@
+from contextlib import contextmanager
 from typing import Optional
 from medperf.exceptions import InvalidContainerSpec, MedperfException
 from medperf import config
 import os
 import logging
+import threading
+
+_thread_overrides = threading.local()
+
+
+@contextmanager
+def gpus_override(gpus: Optional[str]):
+    """Overrides config.gpus for the containers run by the current thread.
+    Used to pin concurrent executions to different GPU devices.
+
+    Args:
+        gpus (str, optional): gpus argument, in the same format as config.gpus.
+            If None, config.gpus is used.
+    """
+    previous = getattr(_thread_overrides, "gpus", None)
+    _thread_overrides.gpus = gpus
+    try:
+        yield
+    finally:
+        _thread_overrides.gpus = previous
 
 
 def check_allowed_run_args(run_args):
@@ -32,6 +53,8 @@ def add_user_defined_run_args(run_args):
     gpus = run_args.get("gpus")
     if config.gpus is not None:
         gpus = config.gpus
+    if getattr(_thread_overrides, "gpus", None) is not None:
+        gpus = _thread_overrides.gpus
     run_args["gpus"] = _normalize_gpu_arg(gpus)
 
 
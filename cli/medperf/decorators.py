@@ -154,6 +154,21 @@ def configurable(func: Callable) -> Callable:
             "--certificate_authority_fingerprint",
             help="Expected fingerprint of the configured certificate authority",
         ),
+        decrypted_files_tmpfs: str = typer.Option(
+            config.decrypted_files_tmpfs,
+            "--decrypted_files_tmpfs",
+            help="Memory-backed folder (e.g. /dev/shm/medperf) for decrypted containers",
+        ),
+        singularity_encrypted_sif_cache: bool = typer.Option(
+            config.singularity_encrypted_sif_cache,
+            "--singularity_encrypted_sif_cache/--no-singularity_encrypted_sif_cache",
+            help="Whether to cache the SIF images of encrypted containers, encrypted with the container key",
+        ),
+        ddl_parallel_connections: int = typer.Option(
+            config.ddl_parallel_connections,
+            "--ddl_parallel_connections",
+            help="Connections used to download large files from servers supporting range requests",
+        ),
         **kwargs,
     ):
         return func(*args, **kwargs)
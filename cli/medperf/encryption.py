@@ -1,17 +1,21 @@
 import os
+import shlex
 from medperf.exceptions import (
     DecryptionError,
     EncryptionError,
     ExecutionError,
     MedperfException,
 )
-from medperf.utils import run_command
+from medperf.utils import combine_proc_sp_text, run_command, spawn_and_kill
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives import serialization
 from cryptography import x509
 import logging
 
+# Exit status of the decryption pipeline when gpg fails
+GPG_FAILED_STATUS = 97
+
 
 # symmetric encryption/decryption
 class SymmetricEncryption:
@@ -54,6 +58,52 @@ class SymmetricEncryption:
         except Exception as e:
             raise DecryptionError(f"File decryption failed: {str(e)}")
 
+    def decrypt_file_to_command(
+        self, encrypted_file_path: str, decryption_key_file: str, command: list
+    ) -> str:
+        """Decrypts a GPG file and streams the plaintext into the standard input of a
+        command, so that the plaintext is never written to disk.
+
+        Args:
+            encrypted_file_path (str): path of the encrypted file
+            decryption_key_file (str): path of the file containing the passphrase
+            command (list): command consuming the plaintext from its standard input
+
+        Returns:
+            str: the output of the command
+        """
+        logging.debug("Decrypting a GPG file into a command")
+        logging.debug(f"Encrypted file path: {encrypted_file_path}")
+        logging.debug(f"Command: {command}")
+        logging.debug(f"Decryption key file path: {decryption_key_file}")
+        gpg_decrypt_command = [
+            self.gpg_exec,
+            "--batch",
+            "--decrypt",
+            "--passphrase-file",
+            decryption_key_file,
+            encrypted_file_path,
+        ]
+        # gpg and the command share a terminal, whose output is read while they run.
+        # Failures of the command are reported first, since gpg fails too if the
+        # command stops reading
+        pipeline = (
+            f"{shlex.join(gpg_decrypt_command)} | {shlex.join(command)}; "
+            'status=("${PIPESTATUS[@]}"); '
+            '[ "${status[1]}" -eq 0 ] || exit "${status[1]}"; '
+            f'[ "${{status[0]}}" -eq 0 ] || exit {GPG_FAILED_STATUS}'
+        )
+        logging.debug("Running GPG decrypt command")
+        with spawn_and_kill(shlex.join(["bash", "-c", pipeline])) as proc_wrapper:
+            proc = proc_wrapper.proc
+            output = combine_proc_sp_text(proc)
+
+        if proc.exitstatus == GPG_FAILED_STATUS:
+            raise DecryptionError(f"File decryption failed: {output.strip()}")
+        if proc.exitstatus != 0:
+            raise ExecutionError(f"Command consuming the decrypted file failed: {output}")
+        return output
+
     def encrypt_file(
         self, plaintext_file_path: str, decryption_key_file: str, output_path: str
     ) -> None:
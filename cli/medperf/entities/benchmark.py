@@ -34,6 +34,10 @@ class Benchmark(Entity):
     def get_comms_retriever():
         return config.comms.get_benchmark
 
+    @staticmethod
+    def get_comms_conditional_retriever():
+        return config.comms.get_benchmark_if_modified
+
     @staticmethod
     def get_metadata_filename():
         return config.benchmarks_filename
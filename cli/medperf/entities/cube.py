@@ -42,6 +42,14 @@ class Cube(Entity):
     def get_comms_retriever():
         return config.comms.get_cube_metadata
 
+    @staticmethod
+    def get_comms_conditional_retriever():
+        return config.comms.get_cube_metadata_if_modified
+
+    @staticmethod
+    def get_comms_batch_retriever():
+        return config.comms.get_many_cubes
+
     @staticmethod
     def get_metadata_filename():
         return config.cube_metadata_filename
@@ -147,21 +147,29 @@ class Dataset(Entity):
         flag_file = os.path.join(self.path, config.ready_flag_file)
         return os.path.exists(flag_file)
 
-    def calculate_raw_hash(self):
+    def calculate_raw_hash(self, full_rehash: bool = False):
         raw_data_path, raw_labels_path = self.get_raw_paths()
-        calculated_hash = get_folders_hash([raw_data_path, raw_labels_path])
+        calculated_hash = get_folders_hash(
+            [raw_data_path, raw_labels_path],
+            index_file=os.path.join(self.path, config.dataset_raw_hash_index_file),
+            full_rehash=full_rehash,
+        )
         logging.debug(f"Raw dataset calculated hash: {calculated_hash}")
         return calculated_hash
 
-    def calculate_prepared_hash(self):
-        calculated_hash = get_folders_hash([self.data_path, self.labels_path])
+    def calculate_prepared_hash(self, full_rehash: bool = False):
+        calculated_hash = get_folders_hash(
+            [self.data_path, self.labels_path],
+            index_file=os.path.join(self.path, config.dataset_hash_index_file),
+            full_rehash=full_rehash,
+        )
         logging.debug(f"Prepared dataset calculated hash: {calculated_hash}")
         return calculated_hash
 
-    def check_hash(self):
+    def check_hash(self, full_rehash: bool = False):
         if not self.is_operational():
             raise InvalidEntityError("Dataset is not operational. Cannot check hash.")
-        calculated_hash = self.calculate_prepared_hash()
+        calculated_hash = self.calculate_prepared_hash(full_rehash)
         return calculated_hash == self.generated_uid
 
     @staticmethod
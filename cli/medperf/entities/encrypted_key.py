@@ -5,6 +5,8 @@ from medperf.entities.interface import Entity
 from medperf.entities.schemas import EncryptedKeySchema
 from medperf import config
 from medperf.exceptions import (
+    CommunicationConnectionError,
+    CommunicationServerError,
     MedperfException,
     DecryptionError,
     PrivateContainerAccessError,
@@ -72,10 +74,48 @@ class EncryptedKey(Entity):
 
     @classmethod
     def upload_many(cls, encrypted_key_list: list[EncryptedKey]) -> list[dict]:
-        """Uploads many objects in a single operation on the server"""
-        list_as_dicts = [item.todict() for item in encrypted_key_list]
-        updated_body = config.comms.upload_many_encrypted_keys(list_as_dicts)
-        return updated_body
+        """Uploads many objects on the server, in chunks of at most
+        config.encrypted_keys_upload_chunk_size keys. Each chunk is stored atomically
+        by the server, so a failure only affects the chunk being uploaded. Failed
+        chunks are retried, skipping keys that a previous attempt managed to store.
+
+        Returns:
+            list[dict]: the uploaded keys as returned by the server
+        """
+        uploaded = []
+        chunk_size = config.encrypted_keys_upload_chunk_size
+        for i in range(0, len(encrypted_key_list), chunk_size):
+            chunk = encrypted_key_list[i : i + chunk_size]  # noqa: E203
+            uploaded += cls.__upload_chunk(chunk)
+        return uploaded
+
+    @classmethod
+    def __upload_chunk(cls, chunk: list[EncryptedKey]) -> list[dict]:
+        attempt = 1
+        while True:
+            list_as_dicts = [item.todict() for item in chunk]
+            try:
+                return config.comms.upload_many_encrypted_keys(list_as_dicts)
+            except (CommunicationConnectionError, CommunicationServerError) as e:
+                # Other errors (e.g. invalid keys) would fail again
+                if attempt >= config.encrypted_keys_upload_attempts:
+                    raise
+                logging.debug(f"Uploading encrypted keys failed, retrying: {e}")
+                attempt += 1
+
+            # The failed request may have been stored before the error was seen
+            chunk = cls.__pending_keys(chunk)
+            if not chunk:
+                return []
+
+    @classmethod
+    def __pending_keys(cls, chunk: list[EncryptedKey]) -> list[EncryptedKey]:
+        """Returns the keys of the chunk whose certificate has no stored key yet"""
+        stored = set()
+        for container_id in set(key.container for key in chunk):
+            for key in cls.get_container_keys(container_id):
+                stored.add((key.certificate, key.container))
+        return [key for key in chunk if (key.certificate, key.container) not in stored]
 
     def decrypt(self):
         logging.debug("Decrypting key.")
@@ -1,10 +1,19 @@
-from typing import List, Dict, Union, Callable
+from typing import List, Dict, Optional, Tuple, Union, Callable
 from abc import ABC
+from datetime import timedelta, timezone
+import json
 import logging
 import os
+import time
+from pydantic.datetime_parse import parse_datetime
 from medperf.utils import sanitize_path
+import medperf.config as config
 import yaml
-from medperf.exceptions import MedperfException, InvalidArgumentError
+from medperf.exceptions import (
+    AuthenticationError,
+    MedperfException,
+    InvalidArgumentError,
+)
 from medperf.entities.schemas import MedperfSchema
 from typing import Type, TypeVar
 from medperf.account_management import get_medperf_user_data
@@ -46,6 +55,23 @@ class Entity(ABC):
     def get_comms_retriever() -> Callable[[int], dict]:
         raise NotImplementedError()
 
+    @staticmethod
+    def get_comms_conditional_retriever() -> Optional[
+        Callable[[int, Optional[str]], Tuple[Optional[dict], Optional[str]]]
+    ]:
+        """Returns a comms function that retrieves the entity only if it changed
+        since a given ETag. Entities that don't support revalidation return None
+        and are always retrieved in full.
+        """
+        return None
+
+    @staticmethod
+    def get_comms_batch_retriever() -> Optional[Callable[[List[int]], List[dict]]]:
+        """Returns a comms function that retrieves several entities by id in a single
+        request. Entities without a batch endpoint return None and are retrieved one by one.
+        """
+        return None
+
     @staticmethod
     def get_metadata_filename() -> str:
         raise NotImplementedError()
@@ -101,11 +127,250 @@ class Entity(ABC):
 
     @classmethod
     def __remote_all(cls: Type[EntityType], filters: dict) -> List[EntityType]:
+        sync_key = cls.__sync_key(filters)
         comms_fn = cls.remote_prefilter(filters)
-        entity_meta = comms_fn(filters=filters)
+        if sync_key is None:
+            entity_meta = comms_fn(filters=filters)
+        else:
+            entity_meta = cls.__synced_remote_all(comms_fn, filters, sync_key)
         entities = [cls(**meta) for meta in entity_meta]
         return entities
 
+    @staticmethod
+    def __sync_key(filters: dict) -> Optional[str]:
+        """Identifies a remote list in the sync index. Returns None for lists that
+        can't be synced incrementally: partial retrievals (limit/offset), and lists
+        filtered by validity, since entities moving between valid and invalid
+        wouldn't be detected. Lists are also not synced without a logged in user,
+        since what a list contains depends on who retrieves it.
+        """
+        if not config.entity_list_sync:
+            return None
+        if any(key in filters for key in ["limit", "offset", "is_valid"]):
+            return None
+        try:
+            user_id = get_medperf_user_data()["id"]
+        except AuthenticationError:
+            return None
+        return json.dumps({"user": user_id, "filters": filters}, sort_keys=True)
+
+    @classmethod
+    def __synced_remote_all(
+        cls: Type[EntityType], comms_fn: Callable, filters: dict, sync_key: str
+    ) -> List[dict]:
+        """Retrieves a remote list, transferring only what changed since the last
+        retrieval of the same list. The sync index of the entity type keeps the ids of
+        the list, in the order the server returned them, along with the latest modification
+        time seen (the watermark). The entities themselves are kept in the local entity cache.
+        Entities modified since a bit before the watermark (config.entity_list_sync_overlap),
+        valid or not and regardless of the list filters, are requested first, so that
+        changes committed after the last retrieval are also seen. Changes to unfiltered lists
+        are merged, while filtered lists are retrieved again whenever any entity changed, since
+        a change may move an entity in or out of the list. Lists are also retrieved again when
+        an entity was invalidated, when a cached entity is missing, or if the server doesn't
+        filter by modification time. Deleted entities can't be detected, so lists older than
+        config.entity_list_sync_max_age are retrieved in full.
+
+        Args:
+            comms_fn (Callable): comms function retrieving the list
+            filters (dict): filters to apply
+            sync_key (str): identifier of the list in the sync index
+
+        Returns:
+            List[dict]: the entities of the list
+        """
+        index = cls.__read_sync_index()
+        synced_list = index.get(sync_key, {})
+        synced_at = time.time()
+        watermark = synced_list.get("watermark")
+        age = synced_at - synced_list.get("synced_at", 0)
+        fresh = watermark is not None and age < config.entity_list_sync_max_age
+        incremental = synced_list.get("incremental", True) or not fresh
+        entity_list = None
+        changes = []
+        cached_list = cls.__cached_list(synced_list.get("ids", [])) if fresh else None
+        if cached_list is not None and incremental:
+            since = cls.__sync_since(watermark)
+            logging.debug(f"Retrieving {cls.get_type()} entities modified since {since}")
+            # An empty is_valid disables the default validity filter
+            changes = comms_fn(filters={"modified_at__gt": since, "is_valid": ""})
+            entity_list, incremental = cls.__apply_changes(
+                synced_list, cached_list, changes, since, bool(filters)
+            )
+        if entity_list is None:
+            logging.debug(f"Retrieving the full list of {cls.get_type()} entities")
+            entity_list = comms_fn(filters=dict(filters))
+        cls.__cache_entities(entity_list)
+
+        modification_times = [
+            parse_datetime(entity_dict["modified_at"])
+            for entity_dict in entity_list + changes
+            if entity_dict.get("modified_at") is not None
+        ]
+        watermark = max(modification_times, default=None)
+        if watermark is not None:
+            watermark = watermark.isoformat()
+        versions = {
+            **synced_list.get("versions", {}),
+            **{str(entity_dict["id"]): entity_dict.get("modified_at") for entity_dict in changes},
+        }
+        index[sync_key] = {
+            "watermark": watermark,
+            "synced_at": synced_at,
+            "incremental": incremental,
+            "ids": [entity_dict["id"] for entity_dict in entity_list],
+            "versions": cls.__recent_versions(versions, watermark),
+        }
+        cls.__write_sync_index(cls.__prune_sync_index(index, synced_at))
+        return entity_list
+
+    @classmethod
+    def __apply_changes(
+        cls: Type[EntityType],
+        synced_list: dict,
+        cached_list: List[dict],
+        changes: List[dict],
+        since: str,
+        filtered: bool,
+    ) -> Tuple[Optional[List[dict]], bool]:
+        """Applies the entities modified since the given time to a synced list.
+        Changed entities are moved to the end of the list, in the order the server
+        returned them, since lists are ordered by modification time.
+
+        Returns:
+            Optional[List[dict]]: the updated entities of the list, or None if the list
+                must be retrieved in full
+            bool: whether the server filters the list by modification time
+        """
+        since = parse_datetime(since)
+        for entity_dict in changes:
+            modified_at = entity_dict.get("modified_at")
+            if modified_at is None or parse_datetime(modified_at) <= since:
+                logging.debug("The server doesn't filter by modification time")
+                return None, False
+
+        known_versions = {
+            **{str(entity_dict["id"]): entity_dict.get("modified_at") for entity_dict in cached_list},
+            **synced_list.get("versions", {}),
+        }
+        new_changes = [
+            entity_dict
+            for entity_dict in changes
+            if not cls.__same_version(
+                known_versions.get(str(entity_dict["id"])), entity_dict["modified_at"]
+            )
+        ]
+        if not new_changes:
+            return cached_list, True
+        if filtered or not all(entity_dict["is_valid"] for entity_dict in new_changes):
+            return None, True
+        changed_ids = {entity_dict["id"] for entity_dict in new_changes}
+        entity_list = [
+            entity_dict for entity_dict in cached_list if entity_dict["id"] not in changed_ids
+        ]
+        return entity_list + new_changes, True
+
+    @classmethod
+    def __cached_list(cls: Type[EntityType], uids: List[int]) -> Optional[List[dict]]:
+        """Reads the entities of a synced list from the local entity cache. Returns None
+        if any of them is missing.
+        """
+        entity_list = []
+        for uid in uids:
+            try:
+                entity_list.append(cls.__get_local_dict(uid))
+            except InvalidArgumentError:
+                logging.debug(f"{cls.get_type()} {uid} is no longer cached locally")
+                return None
+        return entity_list
+
+    @classmethod
+    def __cache_entities(cls: Type[EntityType], entity_list: List[dict]):
+        """Writes the retrieved entities to the local entity cache. Entities whose local
+        copy is already up to date are left untouched, so that they don't need to be
+        revalidated.
+        """
+        for entity_dict in entity_list:
+            try:
+                local_dict = cls.__get_local_dict(entity_dict["id"])
+            except InvalidArgumentError:
+                local_dict = {}
+            if local_dict and cls.__same_version(
+                local_dict.get("modified_at"), entity_dict.get("modified_at")
+            ):
+                continue
+            cls(**entity_dict).write()
+
+    @staticmethod
+    def __same_version(modified_at, other_modified_at) -> bool:
+        if modified_at is None or other_modified_at is None:
+            return False
+        return parse_datetime(modified_at) == parse_datetime(other_modified_at)
+
+    @staticmethod
+    def __sync_since(watermark: str) -> str:
+        since = parse_datetime(watermark) - timedelta(
+            seconds=config.entity_list_sync_overlap
+        )
+        return since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+    @classmethod
+    def __recent_versions(
+        cls: Type[EntityType], versions: dict, watermark: Optional[str]
+    ) -> dict:
+        """Keeps the versions of the entities that later listings can retrieve again"""
+        if watermark is None:
+            return {}
+        since = parse_datetime(cls.__sync_since(watermark))
+        return {
+            uid: modified_at
+            for uid, modified_at in versions.items()
+            if modified_at is not None and parse_datetime(modified_at) > since
+        }
+
+    @staticmethod
+    def __prune_sync_index(index: dict, now: float) -> dict:
+        """Drops the lists that would be retrieved in full anyway, and keeps only the
+        config.entity_list_sync_max_lists most recently synced ones.
+        """
+        synced_lists = [
+            (sync_key, synced_list)
+            for sync_key, synced_list in index.items()
+            if isinstance(synced_list, dict)
+            and now - synced_list.get("synced_at", 0) < config.entity_list_sync_max_age
+        ]
+        synced_lists.sort(key=lambda item: item[1]["synced_at"], reverse=True)
+        return dict(synced_lists[: config.entity_list_sync_max_lists])
+
+    @classmethod
+    def __sync_index_path(cls: Type[EntityType]) -> str:
+        return os.path.join(cls.get_storage_path(), config.entity_sync_index_file)
+
+    @classmethod
+    def __read_sync_index(cls: Type[EntityType]) -> dict:
+        sync_index_file = cls.__sync_index_path()
+        if not os.path.exists(sync_index_file):
+            return {}
+        try:
+            with open(sync_index_file) as f:
+                index = json.load(f)
+        except ValueError:
+            logging.warning(f"Ignoring corrupted sync index {sync_index_file}")
+            return {}
+        if not isinstance(index, dict):
+            return {}
+        return index
+
+    @classmethod
+    def __write_sync_index(cls: Type[EntityType], index: dict):
+        sync_index_file = cls.__sync_index_path()
+        os.makedirs(os.path.dirname(sync_index_file), exist_ok=True)
+        # Replace the index at once so that concurrent readers never see a partial file
+        tmp_file = f"{sync_index_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(index, f, default=str)
+        os.replace(tmp_file, sync_index_file)
+
     @classmethod
     def __unregistered_all(cls: Type[EntityType]) -> List[EntityType]:
         entities = []
@@ -161,6 +426,40 @@ class Entity(ABC):
             return cls.__local_get(uid)
         return cls.__remote_get(uid)
 
+    @classmethod
+    def get_many(cls: Type[EntityType], uids: List[int]) -> List[EntityType]:
+        """Gets several registered instances of the respective entity at once.
+        If the entity has a batch endpoint, all entities are retrieved with a single request.
+        Entities the batch endpoint didn't return are then retrieved individually, and
+        whether those requests are issued concurrently depends on the comms implementation.
+
+        Args:
+            uids (List[int]): server UIDs of the entities
+
+        Returns:
+            List[Entity]: Entity instances, in the same order as the given uids
+        """
+        logging.debug(f"Retrieving {cls.get_type()} entities {uids} remotely")
+        uids = [int(uid) for uid in uids]
+        entities_dicts = {}
+        batch_func = cls.get_comms_batch_retriever()
+        if batch_func is not None and uids:
+            for entity_dict in batch_func(list(dict.fromkeys(uids))):
+                entities_dicts[entity_dict["id"]] = entity_dict
+
+        missing = [uid for uid in dict.fromkeys(uids) if uid not in entities_dicts]
+        if missing:
+            comms_func = cls.get_comms_retriever()
+            for uid, entity_dict in zip(missing, config.comms.get_many(comms_func, missing)):
+                entities_dicts[uid] = entity_dict
+
+        entities = {}
+        for uid, entity_dict in entities_dicts.items():
+            entity = cls(**entity_dict)
+            entity.write()
+            entities[uid] = entity
+        return [entities[uid] for uid in uids]
+
     @classmethod
     def __remote_get(cls: Type[EntityType], uid: int) -> EntityType:
         """Retrieves and creates an entity instance from the comms instance.
@@ -172,12 +471,80 @@ class Entity(ABC):
             Entity: Specified Entity Instance
         """
         logging.debug(f"Retrieving {cls.get_type()} {uid} remotely")
+        if cls.get_comms_conditional_retriever() is not None:
+            return cls.__cached_remote_get(uid)
         comms_func = cls.get_comms_retriever()
         entity_dict = comms_func(uid)
         entity = cls(**entity_dict)
         entity.write()
         return entity
 
+    @classmethod
+    def __cached_remote_get(cls: Type[EntityType], uid: int) -> EntityType:
+        """Retrieves an entity instance, using the local copy if it is still valid.
+        The local copy is used without contacting the server if it was validated less than
+        config.entity_cache_ttl seconds ago. Otherwise, it is revalidated with a conditional
+        request, and only downloaded and rewritten if it changed on the server.
+
+        Args:
+            uid (int): server UID of the entity
+
+        Returns:
+            Entity: Specified Entity Instance
+        """
+        cache_info = cls.__read_cache_info(uid)
+        etag = cache_info.get("etag")
+        age = time.time() - cache_info.get("validated_at", 0)
+        if etag is not None and age < config.entity_cache_ttl:
+            logging.debug(f"Using cached {cls.get_type()} {uid}")
+            return cls.__local_get(uid)
+
+        comms_func = cls.get_comms_conditional_retriever()
+        entity_dict, etag = comms_func(uid, etag)
+        if entity_dict is None:
+            logging.debug(f"Cached {cls.get_type()} {uid} is up to date")
+            entity = cls.__local_get(uid)
+        else:
+            entity = cls(**entity_dict)
+            entity.write()
+        cls.__write_cache_info(uid, etag)
+        return entity
+
+    @classmethod
+    def __cache_info_path(cls: Type[EntityType], uid: int) -> str:
+        storage_path = cls.get_storage_path()
+        return os.path.join(storage_path, str(uid), config.entity_cache_info_file)
+
+    @classmethod
+    def __read_cache_info(cls: Type[EntityType], uid: int) -> dict:
+        """Reads the validation record of a locally cached entity. Returns an empty
+        dictionary if there is no valid local copy.
+        """
+        storage_path = cls.get_storage_path()
+        metadata_file = os.path.join(
+            storage_path, str(uid), cls.get_metadata_filename()
+        )
+        cache_info_file = cls.__cache_info_path(uid)
+        if not os.path.exists(metadata_file) or not os.path.exists(cache_info_file):
+            return {}
+        with open(cache_info_file) as f:
+            cache_info = yaml.safe_load(f)
+        if not isinstance(cache_info, dict):
+            return {}
+        return cache_info
+
+    @classmethod
+    def __write_cache_info(cls: Type[EntityType], uid: int, etag: Optional[str]):
+        cache_info_file = cls.__cache_info_path(uid)
+        if etag is None:
+            # The server didn't provide a validator, so the copy can't be revalidated
+            if os.path.exists(cache_info_file):
+                os.remove(cache_info_file)
+            return
+        cache_info = {"etag": etag, "validated_at": time.time()}
+        with open(cache_info_file, "w") as f:
+            yaml.safe_dump(cache_info, f)
+
     @classmethod
     def __local_get(cls: Type[EntityType], uid: Union[str, int]) -> EntityType:
         """Retrieves and creates an entity instance from the local storage.
@@ -232,6 +599,10 @@ class Entity(ABC):
         os.makedirs(self.path, exist_ok=True)
         with open(entity_file, "w") as f:
             yaml.dump(data, f)
+        # The local copy no longer necessarily matches the last validated version
+        cache_info_file = os.path.join(self.path, config.entity_cache_info_file)
+        if os.path.exists(cache_info_file):
+            os.remove(cache_info_file)
         return entity_file
 
     def upload(self) -> Dict:
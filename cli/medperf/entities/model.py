@@ -33,6 +33,14 @@ class Model(Entity):
     def get_comms_retriever():
         return config.comms.get_model
 
+    @staticmethod
+    def get_comms_conditional_retriever():
+        return config.comms.get_model_if_modified
+
+    @staticmethod
+    def get_comms_batch_retriever():
+        return config.comms.get_many_models
+
     @staticmethod
     def get_metadata_filename():
         return config.model_metadata_filename
@@ -18,6 +18,14 @@ class CommunicationAuthenticationError(CommunicationError):
     """Raised when the communication interface can't handle an authentication request"""
 
 
+class CommunicationConnectionError(CommunicationError):
+    """Raised when the communication interface can't reach the server"""
+
+
+class CommunicationServerError(CommunicationRetrievalError):
+    """Raised when the server fails to handle a request due to an internal error"""
+
+
 class InvalidEntityError(MedperfException):
     """Raised when an entity is considered invalid"""
 
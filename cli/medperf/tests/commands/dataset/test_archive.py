@@ -0,0 +1,150 @@
+import os
+
+import pytest
+from medperf import config
+from medperf.commands.dataset import archive
+from medperf.exceptions import ExecutionError
+
+PATCH_ARCHIVE = "medperf.commands.dataset.archive.{}"
+
+
+@pytest.fixture
+def dataset_archive(fs):
+    fs.create_file(f"/src/{config.archive_config_filename}", contents="dataset: 1")
+    fs.create_file("/src/1/data/file", contents="data")
+    manifest = {}
+    with archive.open_writer("/archive.gz") as tar:
+        for path in [f"/src/{config.archive_config_filename}", "/src/1"]:
+            archive.add_path(tar, path, os.path.basename(path), manifest)
+        archive.add_manifest(tar, manifest)
+    return "/archive.gz"
+
+
+def extract(archive_path, destinations):
+    with archive.open_reader(archive_path) as tar:
+        config_member = tar.next()
+        archive.extract_members(tar, destinations)
+    return config_member
+
+
+def test_config_is_the_first_member(dataset_archive):
+    # Act
+    config_member = extract(dataset_archive, {"1": "/dest"})
+
+    # Assert
+    assert config_member.name == config.archive_config_filename
+    with open("/dest/data/file") as f:
+        assert f.read() == "data"
+
+
+def test_unchanged_files_are_not_rewritten(mocker, dataset_archive):
+    # Arrange
+    extract(dataset_archive, {"1": "/dest"})
+    spy = mocker.spy(archive.tarfile.TarFile, "extractfile")
+
+    # Act
+    extract(dataset_archive, {"1": "/dest"})
+
+    # Assert
+    # Only the manifest is read
+    spy.assert_called_once()
+
+
+def test_changed_files_are_rewritten(dataset_archive):
+    # Arrange
+    extract(dataset_archive, {"1": "/dest"})
+    with open("/dest/data/file", "w") as f:
+        f.write("changed")
+
+    # Act
+    extract(dataset_archive, {"1": "/dest"})
+
+    # Assert
+    with open("/dest/data/file") as f:
+        assert f.read() == "data"
+
+
+def test_extraction_fails_if_file_hash_does_not_match(mocker, fs):
+    # Arrange
+    fs.create_file("/src/1/data/file", contents="data")
+    mocker.patch(PATCH_ARCHIVE.format("get_file_hash"), return_value="hash")
+    with archive.open_writer("/archive.gz") as tar:
+        archive.add_path(tar, "/src/1", "1", {})
+
+    # Act & Assert
+    with pytest.raises(ExecutionError, match="Hash mismatch"):
+        with archive.open_reader("/archive.gz") as tar:
+            archive.extract_members(tar, {"1": "/dest"})
+
+
+def archive_with_link(fs, target):
+    fs.create_file("/src/1/data/file", contents="data")
+    fs.create_symlink("/src/1/link", target)
+    manifest = {}
+    with archive.open_writer("/archive.gz") as tar:
+        archive.add_path(tar, "/src/1", "1", manifest)
+        archive.add_manifest(tar, manifest)
+    return "/archive.gz"
+
+
+def test_links_inside_the_destination_are_extracted(fs):
+    # Arrange
+    archive_path = archive_with_link(fs, "data/file")
+
+    # Act
+    with archive.open_reader(archive_path) as tar:
+        archive.extract_members(tar, {"1": "/dest"})
+
+    # Assert
+    assert os.readlink("/dest/link") == "data/file"
+
+
+@pytest.mark.parametrize("target", ["../outside", "/etc/passwd", "data/../../outside"])
+def test_extraction_fails_for_links_outside_the_destination(fs, target):
+    # Arrange
+    archive_path = archive_with_link(fs, target)
+
+    # Act & Assert
+    with pytest.raises(ExecutionError, match="Unexpected link"):
+        with archive.open_reader(archive_path) as tar:
+            archive.extract_members(tar, {"1": "/dest"})
+    assert not os.path.lexists("/dest/link")
+
+
+def test_extraction_fails_for_unexpected_paths(dataset_archive):
+    # Act & Assert
+    with pytest.raises(ExecutionError, match="Unexpected path"):
+        extract(dataset_archive, {"other": "/dest"})
+
+
+def test_hard_links_are_extracted_and_verified(fs):
+    # Arrange
+    fs.create_file("/src/1/data/file", contents="data")
+    os.link("/src/1/data/file", "/src/1/data/hard_link")
+    manifest = {}
+    with archive.open_writer("/archive.gz") as tar:
+        archive.add_path(tar, "/src/1", "1", manifest)
+        archive.add_manifest(tar, manifest)
+
+    # Act
+    with archive.open_reader("/archive.gz") as tar:
+        archive.extract_members(tar, {"1": "/dest"})
+
+    # Assert
+    assert manifest["1/data/hard_link"] == manifest["1/data/file"]
+    assert os.path.samefile("/dest/data/hard_link", "/dest/data/file")
+    with open("/dest/data/hard_link") as f:
+        assert f.read() == "data"
+
+
+def test_extraction_fails_for_unsupported_members(fs):
+    # Arrange
+    with archive.open_writer("/archive.gz") as tar:
+        info = archive.tarfile.TarInfo("1/fifo")
+        info.type = archive.tarfile.FIFOTYPE
+        tar.addfile(info)
+
+    # Act & Assert
+    with pytest.raises(ExecutionError, match="Unsupported member"):
+        with archive.open_reader("/archive.gz") as tar:
+            archive.extract_members(tar, {"1": "/dest"})
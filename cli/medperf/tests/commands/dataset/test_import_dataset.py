@@ -5,6 +5,8 @@ import pytest
 
 from medperf.tests.mocks.dataset import TestDataset
 from medperf.commands.dataset.import_dataset import ImportDataset
+from medperf.commands.dataset.export_dataset import ExportDataset
+from medperf.utils import remove_path, tar
 import yaml
 
 PATCH_IMPORT = "medperf.commands.dataset.import_dataset.{}"
@@ -271,3 +273,70 @@ def test_import_fails_if_raw_data_not_found_in_archive(mocker, fs, import_datase
     # Act & Assert
     with pytest.raises(ExecutionError, match="No raw data in archive"):
         import_dataset.validate()
+
+
+@pytest.mark.parametrize("state", ["OPERATION", "DEVELOPMENT"])
+def test_import_streams_exported_archive_into_destinations(mocker, fs, state):
+
+    # Arrange
+    dataset = TestDataset(id=1, state=state)
+    mocker.patch(PATCH_IMPORT.format("Dataset.get"), return_value=dataset)
+    mocker.patch(
+        "medperf.commands.dataset.export_dataset.Dataset.get", return_value=dataset
+    )
+    fs.create_file(os.path.join(dataset.data_path, "file"), contents="data")
+    fs.create_file(os.path.join(dataset.labels_path, "file"), contents="labels")
+    fs.create_file("/raw/data/file", contents="raw data")
+    fs.create_file("/raw/labels/file", contents="raw labels")
+    dataset.set_raw_paths("/raw/data", "/raw/labels")
+    ExportDataset.run(1, "/export")
+    remove_path(dataset.path)
+    import_dataset = ImportDataset(1, "/export/1.gz", "/new_raw")
+
+    # Act
+    streamable = import_dataset.is_streamable()
+    import_dataset.stream_files()
+
+    # Assert
+    assert streamable
+    with open(os.path.join(dataset.data_path, "file")) as f:
+        assert f.read() == "data"
+    assert not import_dataset._is_resuming()
+    if state == "DEVELOPMENT":
+        assert dataset.get_raw_paths() == ("/new_raw/data", "/new_raw/labels")
+        with open("/new_raw/labels/file") as f:
+            assert f.read() == "raw labels"
+    else:
+        assert dataset.get_raw_paths() == ("", "")
+
+
+def test_import_resumes_interrupted_streaming_import(mocker, fs):
+
+    # Arrange
+    dataset = TestDataset(id=1, state="OPERATION")
+    mocker.patch(PATCH_IMPORT.format("Dataset.get"), return_value=dataset)
+    mocker.patch(
+        "medperf.commands.dataset.export_dataset.Dataset.get", return_value=dataset
+    )
+    fs.create_file(os.path.join(dataset.data_path, "file"), contents="data")
+    ExportDataset.run(1, "/export")
+    fs.create_file(os.path.join(dataset.path, config.dataset_import_marker_file))
+    import_dataset = ImportDataset(1, "/export/1.gz", None)
+
+    # Act
+    import_dataset.stream_files()
+
+    # Assert
+    assert not import_dataset._is_resuming()
+
+
+def test_import_of_legacy_archive_is_not_streamed(import_dataset, fs):
+
+    # Arrange
+    fs.create_file("/legacy/1/data/file")
+    fs.create_file(f"/legacy/{config.archive_config_filename}")
+    tar("/legacy.gz", ["/legacy/1", f"/legacy/{config.archive_config_filename}"])
+    import_dataset.input_path = "/legacy.gz"
+
+    # Act & Assert
+    assert not import_dataset.is_streamable()
@@ -56,6 +56,25 @@ def test_generate_uids_assigns_uids_to_obj_properties(mocker, set_operational):
     assert set_operational.dataset.generated_uid == "out_hash"
 
 
+@pytest.mark.parametrize("full_rehash", [True, False])
+def test_generate_uids_forwards_full_rehash(mocker, set_operational, full_rehash):
+    # Arrange
+    set_operational.full_rehash = full_rehash
+    raw_spy = mocker.patch.object(
+        set_operational.dataset, "calculate_raw_hash", return_value="in_hash"
+    )
+    prepared_spy = mocker.patch.object(
+        set_operational.dataset, "calculate_prepared_hash", return_value="out_hash"
+    )
+
+    # Act
+    set_operational.generate_uids()
+
+    # Assert
+    raw_spy.assert_called_once_with(full_rehash)
+    prepared_spy.assert_called_once_with(full_rehash)
+
+
 def test_statistics_are_updated(mocker, set_operational, fs):
     # Arrange
     set_operational.dataset.statistics_path = "path"
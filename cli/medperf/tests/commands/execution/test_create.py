@@ -1,5 +1,7 @@
 import os
+import threading
 from medperf import config
+import medperf.containers.runners.utils as runner_utils
 from medperf.exceptions import ExecutionError, InvalidArgumentError, InvalidEntityError
 from medperf.tests.mocks.benchmark import TestBenchmark
 from medperf.tests.mocks.cube import TestCube
@@ -100,12 +102,26 @@ def mock_cube(mocker, state_variables):
 def mock_execution(mocker, state_variables):
     models_props = state_variables["models_props"]
 
-    def __exec_side_effect(dataset, model, evaluator, execution, ignore_model_errors):
+    def __exec_side_effect(
+        benchmark_id,
+        dataset,
+        model,
+        evaluator,
+        execution,
+        ignore_model_errors,
+        container_prefetcher=None,
+    ):
         if models_props[model.id] == "exec_error":
             raise ExecutionError
         return models_props[model.id]
 
     mocker.patch(PATCH_EXECUTION.format("Execution"), TestExecution)
+    mocker.patch(
+        PATCH_EXECUTION.format("Model.get_many"),
+        side_effect=lambda uids: [
+            mocker.Mock(id=uid, requires_cc=lambda: False) for uid in uids
+        ],
+    )
     return mocker.patch(
         PATCH_EXECUTION.format("ExecutionFlow.run"), side_effect=__exec_side_effect
     )
@@ -250,3 +266,119 @@ class TestDefaultSetup:
 
         # Assert
         self.spies["validate_models"].assert_not_called()
+
+
+@pytest.mark.parametrize("setup", [{"cached_executions_triplets": []}], indirect=True)
+class TestConcurrentExecution:
+    @pytest.fixture(autouse=True)
+    def set_common_attributes(self, mocker, setup):
+        state_variables, spies = setup
+        self.state_variables = state_variables
+        self.spies = spies
+
+        def __create_execution_side_effect(model_uid):
+            execution = TestExecution(id=100 + model_uid, model=model_uid)
+            execution.write()
+            return execution
+
+        self.create_spy = mocker.patch(
+            PATCH_EXECUTION.format("BenchmarkExecution._BenchmarkExecution__create_execution"),
+            side_effect=__create_execution_side_effect,
+        )
+
+    def test_concurrent_execution_keeps_models_order(self, mocker, setup):
+        # Arrange
+        models_uids = [2, 4, 5]
+
+        # Act
+        executions = BenchmarkExecution.run(1, 2, models_uids=models_uids, jobs=2)
+
+        # Assert
+        assert [execution.model for execution in executions] == models_uids
+        assert self.spies["exec"].call_count == len(models_uids)
+        assert all(execution.is_executed() for execution in executions)
+
+    def test_concurrent_execution_splits_gpu_devices(self, mocker, setup):
+        # Arrange
+        mocker.patch.object(config, "gpus", "device=0,1")
+        barrier = threading.Barrier(2, timeout=5)
+        used_gpus = set()
+
+        def __exec_side_effect(model, **kwargs):
+            used_gpus.add(runner_utils._thread_overrides.gpus)
+            barrier.wait()
+            return self.state_variables["models_props"][model.id]
+
+        self.spies["exec"].side_effect = __exec_side_effect
+
+        # Act
+        BenchmarkExecution.run(1, 2, models_uids=[2, 4], jobs=2)
+
+        # Assert
+        assert used_gpus == {"device=0", "device=1"}
+
+    def test_concurrent_execution_raises_failed_experiment(self, mocker, setup):
+        # Act & Assert
+        with pytest.raises(ExecutionError):
+            BenchmarkExecution.run(1, 2, models_uids=[2, 6], jobs=2)
+
+    def test_executions_are_created_right_before_running(self, mocker, setup):
+        # Act
+        with pytest.raises(ExecutionError):
+            BenchmarkExecution.run(1, 2, models_uids=[6, 2, 4])
+
+        # Assert
+        # Models after the failed one never ran, so they have no execution
+        self.create_spy.assert_called_once_with(6)
+
+    def test_concurrent_execution_ignores_failed_experiment_if_asked(self, mocker, setup):
+        # Act
+        executions = BenchmarkExecution.run(
+            1, 2, models_uids=[2, 6], jobs=2, ignore_failed_experiments=True
+        )
+
+        # Assert
+        assert executions[0].model == 2
+        assert executions[1] is None
+
+    def test_concurrent_execution_displays_output_from_main_thread(
+        self, mocker, setup, ui
+    ):
+        # Arrange
+        printing_threads = set()
+        ui.print.side_effect = lambda msg="": printing_threads.add(
+            threading.current_thread()
+        )
+
+        def __exec_side_effect(model, **kwargs):
+            config.ui.print(f"running {model.id}")
+            return self.state_variables["models_props"][model.id]
+
+        self.spies["exec"].side_effect = __exec_side_effect
+
+        # Act
+        BenchmarkExecution.run(1, 2, models_uids=[2, 4], jobs=2)
+
+        # Assert
+        assert printing_threads == {threading.main_thread()}
+        ui.print.assert_any_call("running 2")
+        assert config.ui is ui
+
+    def test_concurrent_execution_stops_containers_on_interrupt(self, mocker, setup):
+        # Arrange
+        container = mocker.Mock()
+        mocker.patch.object(config, "running_containers", {"infer": container})
+        self.spies["exec"].side_effect = KeyboardInterrupt
+
+        # Act
+        with pytest.raises(KeyboardInterrupt):
+            BenchmarkExecution.run(1, 2, models_uids=[2, 4], jobs=2)
+
+        # Assert
+        container.killpg.assert_called_once()
+
+    @pytest.mark.parametrize("jobs", [0, -1])
+    def test_failure_with_invalid_jobs(self, mocker, setup, jobs):
+        # Act & Assert
+        with pytest.raises(InvalidArgumentError):
+            BenchmarkExecution.run(1, 2, models_uids=[2], jobs=jobs)
@@ -0,0 +1,117 @@
+import threading
+
+import pytest
+
+from medperf import config
+from medperf.commands.execution.prefetch import ContainerPrefetcher
+from medperf.exceptions import InvalidEntityError
+from medperf.tests.mocks.cube import TestCube
+
+
+def make_model(mocker, container_id, is_container=True):
+    container = TestCube(id=container_id)
+    model = mocker.Mock()
+    model.is_container.return_value = is_container
+    model.container.id = container_id
+    model.container_obj = container
+    return model
+
+
+@pytest.fixture
+def download_spy(mocker):
+    return mocker.patch.object(TestCube, "download_run_files")
+
+
+class TestContainerPrefetcher:
+    def test_get_returns_prefetched_container(self, mocker, download_spy):
+        # Arrange
+        model = make_model(mocker, 1)
+
+        # Act
+        with ContainerPrefetcher(max_workers=1) as prefetcher:
+            prefetcher.prefetch([model])
+            container = prefetcher.get(model)
+
+        # Assert
+        assert container is model.container_obj
+        download_spy.assert_called_once()
+
+    def test_get_downloads_containers_not_prefetched(self, mocker, download_spy):
+        # Arrange
+        model = make_model(mocker, 1)
+
+        # Act
+        with ContainerPrefetcher(max_workers=1) as prefetcher:
+            container = prefetcher.get(model)
+
+        # Assert
+        assert container is model.container_obj
+        download_spy.assert_called_once()
+
+    def test_prefetch_skips_asset_models(self, mocker, download_spy):
+        # Arrange
+        model = make_model(mocker, 1, is_container=False)
+
+        # Act
+        with ContainerPrefetcher(max_workers=1) as prefetcher:
+            prefetcher.prefetch([model])
+
+        # Assert
+        download_spy.assert_not_called()
+
+    def test_shared_containers_are_downloaded_once(self, mocker, download_spy):
+        # Arrange
+        models = [make_model(mocker, 1), make_model(mocker, 1)]
+
+        # Act
+        with ContainerPrefetcher(max_workers=2) as prefetcher:
+            prefetcher.prefetch(models)
+            prefetcher.get(models[1])
+
+        # Assert
+        download_spy.assert_called_once()
+
+    def test_get_raises_prefetch_errors(self, mocker, download_spy):
+        # Arrange
+        model = make_model(mocker, 1)
+        download_spy.side_effect = InvalidEntityError
+
+        # Act & Assert
+        with ContainerPrefetcher(max_workers=1) as prefetcher:
+            prefetcher.prefetch([model])
+            with pytest.raises(InvalidEntityError):
+                prefetcher.get(model)
+
+    def test_prefetch_is_disabled_without_workers(self, mocker, download_spy):
+        # Arrange
+        model = make_model(mocker, 1)
+
+        # Act
+        with ContainerPrefetcher(max_workers=0) as prefetcher:
+            prefetcher.prefetch([model])
+            download_spy.assert_not_called()
+            prefetcher.get(model)
+
+        # Assert
+        download_spy.assert_called_once()
+
+    def test_background_messages_are_displayed_by_the_opening_thread(
+        self, mocker, download_spy, ui
+    ):
+        # Arrange
+        model = make_model(mocker, 1)
+        printing_threads = set()
+        ui.print.side_effect = lambda msg="": printing_threads.add(
+            threading.current_thread()
+        )
+        download_spy.side_effect = lambda: config.ui.print("downloading")
+
+        # Act
+        with ContainerPrefetcher(max_workers=1) as prefetcher:
+            prefetcher.prefetch([model])
+            prefetcher.get(model)
+
+        # Assert
+        ui.print.assert_called_once_with("downloading")
+        assert printing_threads == {threading.main_thread()}
+        assert config.ui is ui
@@ -1,6 +1,12 @@
 import pytest
 import base64
-from medperf.exceptions import CleanExit, InvalidCertificateError
+import datetime
+from cryptography import x509
+from cryptography.x509.oid import NameOID
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from medperf.encryption import AsymmetricEncryption
+from medperf.exceptions import CleanExit
 from medperf.commands.mlcube.grant_access import GrantAccess
 from medperf.tests.mocks.certificate import TestCertificate
 from medperf.tests.mocks.ca import TestCA
@@ -31,7 +37,7 @@ def grantaccess(mocker, fs):
     )
     mocker.patch(PATCH_GRANTACCESS.format("EncryptedKey.upload_many"))
     mocker.patch(PATCH_GRANTACCESS.format("verify_certificate_authority"))
-    mocker.patch(PATCH_GRANTACCESS.format("verify_certificate"))
+    mocker.patch(PATCH_GRANTACCESS.format("verify_certificates"))
     key_path = "keyfile"
     mocker.patch(
         PATCH_GRANTACCESS.format("get_decryption_key_path"), return_value="keyfile"
@@ -224,14 +230,11 @@ def test_filter_certificates_when_empty(grantaccess):
 
 def test_verify_certificates_filters_invalid_certs(mocker, grantaccess):
     # Arrange
-    def verify_side_effect(cert, **kwargs):
-        if cert.id == 2:
-            raise InvalidCertificateError()
-
-    mocker.patch(
-        PATCH_GRANTACCESS.format("verify_certificate"), side_effect=verify_side_effect
+    spy = mocker.patch(
+        PATCH_GRANTACCESS.format("verify_certificates"), return_value=[True, False]
     )
-    grantaccess.certificates = [TestCertificate(id=1), TestCertificate(id=2)]
+    certificates = [TestCertificate(id=1), TestCertificate(id=2)]
+    grantaccess.certificates = certificates
     grantaccess.cert_user_info = {
         1: {"email": "alice@example.com"},
         2: {"email": "bob@example.com"},
@@ -242,15 +245,17 @@ def test_verify_certificates_filters_invalid_certs(mocker, grantaccess):
 
     # Assert
     assert [cert.id for cert in grantaccess.certificates] == [1]
+    spy.assert_called_once_with(
+        certificates,
+        ["alice@example.com", "bob@example.com"],
+        verify_ca=False,
+    )
 
 
 def test_verify_certificates_when_empty(mocker, grantaccess):
     # Arrange
-    def verify_side_effect(cert, **kwargs):
-        raise InvalidCertificateError()
-
     mocker.patch(
-        PATCH_GRANTACCESS.format("verify_certificate"), side_effect=verify_side_effect
+        PATCH_GRANTACCESS.format("verify_certificates"), return_value=[False, False]
     )
     grantaccess.certificates = [TestCertificate(id=1), TestCertificate(id=2)]
     grantaccess.cert_user_info = {
@@ -278,13 +283,51 @@ def test_generate_encrypted_keys_list_returns_keys(grantaccess):
     assert key.encrypted_key_base64 == base64.b64encode("encrypted".encode()).decode()
 
 
-def test_upload_calls_upload_many(mocker, grantaccess):
+def _rsa_certificate(cert_id):
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, f"user{cert_id}")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    content = cert.public_bytes(serialization.Encoding.PEM)
+    certificate = TestCertificate(
+        id=cert_id, certificate_content_base64=base64.b64encode(content).decode()
+    )
+    private_bytes = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    return certificate, private_bytes
+
+
+def test_generate_encrypted_keys_list_encrypts_each_certificate_once(mocker, fs):
     # Arrange
-    spy = mocker.patch(PATCH_GRANTACCESS.format("EncryptedKey.upload_many"))
-    keys = [TestEncryptedKey()]
+    fs.create_file("keyfile", contents=b"container_key_bytes")
+    mocker.patch(
+        PATCH_GRANTACCESS.format("get_decryption_key_path"), return_value="keyfile"
+    )
+    encrypt_spy = mocker.spy(AsymmetricEncryption, "encrypt")
+    certs_and_keys = [_rsa_certificate(cert_id) for cert_id in [1, 2, 3]]
+    ga = GrantAccess(BENCHMARK_ID, MODEL_ID)
+    ga.certificates = [certificate for certificate, _ in certs_and_keys]
+    ga.certificates.append(certs_and_keys[0][0])
 
     # Act
-    grantaccess.upload(keys)
+    keys = ga.generate_encrypted_keys_list()
 
     # Assert
-    spy.assert_called_once_with(keys)
+    assert encrypt_spy.call_count == 3
+    assert [key.certificate for key in keys] == [1, 2, 3, 1]
+    for key, (_, private_bytes) in zip(keys, certs_and_keys):
+        encrypted_bytes = base64.b64decode(key.encrypted_key_base64)
+        decrypted = AsymmetricEncryption().decrypt(private_bytes, encrypted_bytes)
+        assert decrypted == b"container_key_bytes"
@@ -2,10 +2,13 @@ from medperf.tests.mocks import MockResponse
 from medperf.comms.entity_resources.sources.direct import DirectLinkSource
 import medperf.config as config
 import pytest
+import hashlib
+import requests
 from medperf.exceptions import CommunicationRetrievalError
 
 PATCH_DIRECT = "medperf.comms.entity_resources.sources.direct.{}"
 url = "https://mock.com"
+timeout = (config.ddl_connect_timeout, config.ddl_read_timeout)
 
 
 def test_download_works_as_expected(mocker, fs):
@@ -16,11 +19,12 @@ def test_download_works_as_expected(mocker, fs):
     get_spy = mocker.patch(PATCH_DIRECT.format("requests.get"), return_value=res)
 
     # Act
-    DirectLinkSource().download(url, filename)
+    calc_hash = DirectLinkSource().download(url, filename)
 
     # Assert
     assert open(filename).read() == "sometext"
-    get_spy.assert_called_once_with(url, stream=True)
+    assert calc_hash == hashlib.sha256(b"sometext").hexdigest()
+    get_spy.assert_called_once_with(url, stream=True, timeout=timeout)
     iter_spy.assert_called_once_with(chunk_size=config.ddl_stream_chunk_size)
 
 
@@ -35,3 +39,144 @@ def test_download_raises_for_failed_request_after_multiple_attempts(mocker):
         DirectLinkSource().download(url, filename)
 
     assert spy.call_count == config.ddl_max_redownload_attempts
+
+
+def interrupted_content(*chunks):
+    def iter_content(*args, **kwargs):
+        yield from chunks
+        raise requests.exceptions.ChunkedEncodingError()
+
+    return iter_content
+
+
+def test_download_resumes_interrupted_download(mocker, fs):
+    # Arrange
+    filename = "filename"
+    res1 = MockResponse({}, 200)
+    mocker.patch.object(res1, "iter_content", side_effect=interrupted_content(b"some"))
+    res2 = MockResponse({}, 206, {"Content-Range": "bytes 4-7/8"})
+    mocker.patch.object(res2, "iter_content", return_value=[b"text"])
+    get_spy = mocker.patch(PATCH_DIRECT.format("requests.get"), side_effect=[res1, res2])
+
+    # Act
+    calc_hash = DirectLinkSource().download(url, filename)
+
+    # Assert
+    assert open(filename).read() == "sometext"
+    assert calc_hash == hashlib.sha256(b"sometext").hexdigest()
+    get_spy.assert_called_with(
+        url, stream=True, timeout=timeout, headers={"Range": "bytes=4-"}
+    )
+
+
+@pytest.mark.parametrize("content_range", [None, "bytes 0-7/8", "bytes */8"])
+def test_download_restarts_if_server_returns_another_range(
+    mocker, fs, content_range
+):
+    # Arrange
+    filename = "filename"
+    res1 = MockResponse({}, 200)
+    mocker.patch.object(res1, "iter_content", side_effect=interrupted_content(b"some"))
+    headers = {"Content-Range": content_range} if content_range else {}
+    res2 = MockResponse({}, 206, headers)
+    mocker.patch.object(res2, "iter_content", return_value=[b"some", b"text"])
+    res3 = MockResponse({}, 200)
+    mocker.patch.object(res3, "iter_content", return_value=[b"some", b"text"])
+    get_spy = mocker.patch(
+        PATCH_DIRECT.format("requests.get"), side_effect=[res1, res2, res3]
+    )
+
+    # Act
+    calc_hash = DirectLinkSource().download(url, filename)
+
+    # Assert
+    assert open(filename).read() == "sometext"
+    assert calc_hash == hashlib.sha256(b"sometext").hexdigest()
+    get_spy.assert_called_with(url, stream=True, timeout=timeout)
+
+
+def test_download_restarts_if_server_does_not_support_ranges(mocker, fs):
+    # Arrange
+    filename = "filename"
+    res1 = MockResponse({}, 200)
+    mocker.patch.object(res1, "iter_content", side_effect=interrupted_content(b"some"))
+    res2 = MockResponse({}, 200)
+    mocker.patch.object(res2, "iter_content", return_value=[b"some", b"text"])
+    mocker.patch(PATCH_DIRECT.format("requests.get"), side_effect=[res1, res2])
+
+    # Act
+    calc_hash = DirectLinkSource().download(url, filename)
+
+    # Assert
+    assert open(filename).read() == "sometext"
+    assert calc_hash == hashlib.sha256(b"sometext").hexdigest()
+
+
+def test_download_retries_incomplete_download(mocker, fs):
+    # Arrange
+    filename = "filename"
+    headers = {"Content-Length": "8"}
+    res1 = MockResponse({}, 200, headers)
+    mocker.patch.object(res1, "iter_content", return_value=[b"some"])
+    headers = {"Content-Length": "4", "Content-Range": "bytes 4-7/8"}
+    res2 = MockResponse({}, 206, headers)
+    mocker.patch.object(res2, "iter_content", return_value=[b"text"])
+    get_spy = mocker.patch(PATCH_DIRECT.format("requests.get"), side_effect=[res1, res2])
+
+    # Act
+    DirectLinkSource().download(url, filename)
+
+    # Assert
+    assert open(filename).read() == "sometext"
+    assert get_spy.call_count == 2
+
+
+def test_download_only_counts_consecutive_failed_attempts(mocker, fs):
+    # Arrange
+    filename = "filename"
+    config.ddl_max_redownload_attempts = 2
+    res1 = MockResponse({}, 404)
+    res2 = MockResponse({}, 200)
+    mocker.patch.object(res2, "iter_content", side_effect=interrupted_content(b"some"))
+    res3 = MockResponse({}, 503)
+    res4 = MockResponse({}, 206, {"Content-Range": "bytes 4-7/8"})
+    mocker.patch.object(res4, "iter_content", return_value=[b"text"])
+    mocker.patch(
+        PATCH_DIRECT.format("requests.get"), side_effect=[res1, res2, res3, res4]
+    )
+
+    # Act
+    DirectLinkSource().download(url, filename)
+
+    # Assert
+    assert open(filename).read() == "sometext"
+
+
+def test_download_fetches_ranges_in_parallel(mocker, fs):
+    # Arrange
+    filename = "filename"
+    content = b"some text to download"
+    config.ddl_parallel_connections = 2
+    config.ddl_parallel_part_size = 5
+    headers = {"Accept-Ranges": "bytes", "Content-Length": str(len(content))}
+    head_spy = mocker.patch(
+        PATCH_DIRECT.format("requests.head"), return_value=MockResponse({}, 200, headers)
+    )
+
+    def get(url, stream, headers, timeout):
+        start, end = headers["Range"][len("bytes=") :].split("-")  # noqa: E203
+        res = MockResponse({}, 206, {"Content-Range": f"bytes {start}-{end}/21"})
+        body = content[int(start) : int(end) + 1]  # noqa: E203
+        res.iter_content = lambda **kwargs: [body]
+        return res
+
+    get_spy = mocker.patch(PATCH_DIRECT.format("requests.get"), side_effect=get)
+
+    # Act
+    calc_hash = DirectLinkSource().download(url, filename)
+
+    # Assert
+    assert open(filename, "rb").read() == content
+    assert calc_hash == hashlib.sha256(content).hexdigest()
+    assert get_spy.call_count == 5
+    head_spy.assert_called_once_with(url, allow_redirects=True, timeout=timeout)
@@ -51,6 +51,55 @@ class TestGetCubeImage:
         spy.assert_called_once()
 
 
+class TestVerifiedHashRecord:
+    @pytest.fixture(autouse=True)
+    def class_setup(self, fs):
+        os.makedirs(config.hashed_files_folder, exist_ok=True)
+
+    def test_cached_file_is_not_rehashed(self, mocker):
+        # Arrange
+        _, calc_hash = resources.get_hashed_file(url, None)
+        spy = mocker.spy(resources, "get_file_hash")
+
+        # Act
+        resources.get_hashed_file(url, calc_hash)
+
+        # Assert
+        spy.assert_not_called()
+
+    def test_modified_cached_file_is_rehashed_and_redownloaded(self, mocker):
+        # Arrange
+        file_path, calc_hash = resources.get_hashed_file(url, None)
+        with open(file_path, "a") as f:
+            f.write("tampered")
+        hash_spy = mocker.spy(resources, "get_file_hash")
+        download_spy = mocker.spy(resources, "download_resource")
+
+        # Act
+        resources.get_hashed_file(url, calc_hash)
+
+        # Assert
+        hash_spy.assert_called_once_with(file_path)
+        download_spy.assert_called_once()
+
+    def test_unrecorded_valid_file_is_hashed_once(self, mocker, fs):
+        # Arrange
+        fs.create_file("file", contents=url)
+        calc_hash = get_file_hash("file")
+        file_path = os.path.join(config.hashed_files_folder, calc_hash)
+        os.rename("file", file_path)
+        hash_spy = mocker.spy(resources, "get_file_hash")
+        download_spy = mocker.spy(resources, "download_resource")
+
+        # Act
+        resources.get_hashed_file(url, calc_hash)
+        resources.get_hashed_file(url, calc_hash)
+
+        # Assert
+        hash_spy.assert_called_once_with(file_path)
+        download_spy.assert_not_called()
+
+
 class TestGetAdditionalFiles:
     @pytest.fixture(autouse=True)
     def class_setup(self, mocker):
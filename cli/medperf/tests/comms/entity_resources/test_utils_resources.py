@@ -92,3 +92,26 @@ class TestWithHash:
 
         # Assert
         assert open(output_path).read() == DOWNLOADED_FILE_CONTENTS
+
+    def test_download_uses_hash_computed_by_source(self, mocker, fs):
+        # Arrange
+        output_path = "out"
+        expected_hash = calculate_fake_file_hash(fs, DOWNLOADED_FILE_CONTENTS)
+
+        def download_side_effect(identifier, outpath):
+            fs.create_file(outpath, contents=DOWNLOADED_FILE_CONTENTS)
+            return expected_hash
+
+        mocker.patch.object(
+            sources.DirectLinkSource, "download", side_effect=download_side_effect
+        )
+        spy = mocker.spy(utils, "get_file_hash")
+
+        # Act
+        calc_hash = utils.download_resource(
+            "https://url.com", output_path, expected_hash
+        )
+
+        # Assert
+        assert calc_hash == expected_hash
+        spy.assert_not_called()
@@ -1,4 +1,8 @@
-from medperf.exceptions import CommunicationRetrievalError
+from medperf.exceptions import (
+    CommunicationConnectionError,
+    CommunicationRetrievalError,
+    CommunicationServerError,
+)
 import pytest
 import requests
 from unittest.mock import ANY, call
@@ -154,12 +158,75 @@ def test_auth_get_adds_token_to_request(mocker, server, token, req_type, auth):
 
     exp_headers = {"Authorization": f"Bearer {token}"}
     cert_verify = config.certificate or True
+    exp_timeout = (config.comms_connect_timeout, config.comms_read_timeout)
 
     # Act
     server._REST__auth_req(url, func)
 
     # Assert
-    spy.assert_called_once_with(url, headers=exp_headers, verify=cert_verify)
+    spy.assert_called_once_with(
+        url, headers=exp_headers, verify=cert_verify, timeout=exp_timeout
+    )
+
+
+@pytest.mark.parametrize("req_type", ["get", "post", "put"])
+def test_auth_methods_use_shared_session(mocker, server, req_type, auth):
+    # Arrange
+    spy = mocker.patch.object(server.session, req_type)
+
+    # Act
+    getattr(server, f"_REST__auth_{req_type}")(url)
+
+    # Assert
+    spy.assert_called_once()
+
+
+def test_session_is_pooled_and_retries_idempotent_requests(server):
+    # Act
+    adapter = server.session.get_adapter(full_url)
+
+    # Assert
+    assert adapter._pool_maxsize == config.comms_pool_size
+    assert adapter.max_retries.total == config.comms_max_retries
+    assert "GET" in adapter.max_retries.allowed_methods
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+
+def test__req_respects_custom_timeout(mocker, server):
+    # Arrange
+    spy = mocker.patch("requests.get")
+    func = requests.get
+
+    # Act
+    server._REST__req(url, func, timeout=5)
+
+    # Assert
+    spy.assert_called_once_with(url, verify=ANY, timeout=5)
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [requests.exceptions.ConnectionError, requests.exceptions.ReadTimeout],
+)
+def test__req_fails_on_connection_errors(mocker, server, exception):
+    # Arrange
+    mocker.patch("requests.get", side_effect=exception)
+    func = requests.get
+
+    # Act & Assert
+    with pytest.raises(CommunicationConnectionError):
+        server._REST__req(url, func)
+
+
+@pytest.mark.parametrize("status", [500, 503])
+def test_upload_many_encrypted_keys_reports_server_errors(mocker, server, status):
+    # Arrange
+    res = MockResponse("<html>Service Unavailable</html>", status)
+    mocker.patch(patch_server.format("REST._REST__auth_post"), return_value=res)
+
+    # Act & Assert
+    with pytest.raises(CommunicationServerError):
+        server.upload_many_encrypted_keys([{}])
 
 
 def test__req_sanitizes_json(mocker, server):
@@ -179,7 +246,7 @@ def test__req_sanitizes_json(mocker, server):
 def test__get_list_uses_default_page_size(mocker, server):
     # Arrange
     exp_page_size = config.default_page_size
-    exp_url = f"{full_url}?is_valid=True&limit={exp_page_size}&offset=0"
+    exp_url = f"{full_url}?is_valid=True&limit={exp_page_size}&pagination=keyset"
     ret_body = MockResponse({"count": 1, "next": None, "results": []}, 200)
     spy = mocker.patch.object(server, "_REST__auth_get", return_value=ret_body)
 
@@ -224,6 +291,7 @@ def test__get_list_returns_desired_number_of_elements(mocker, server, num_elemen
 
 def test__get_list_splits_page_size_on_error(mocker, server):
     # Arrange
+    mocker.patch.object(config, "comms_keyset_pagination", False)
     failing_body = MockResponse({}, 500)
     reduced_body = MockResponse(
         {"count": 16, "next": url, "results": ["element"] * 16}, 200
@@ -247,6 +315,88 @@ def test__get_list_splits_page_size_on_error(mocker, server):
     spy.assert_has_calls(exp_calls)
 
 
+def test__get_list_follows_keyset_cursors(mocker, server):
+    # Arrange
+    next_url = f"{url}?is_valid=True&limit=32&pagination=keyset&cursor=abc%3D"
+    first_page = MockResponse({"next": next_url, "results": [{"id": 1}]}, 200)
+    last_page = MockResponse({"next": None, "results": [{"id": 2}]}, 200)
+    spy = mocker.patch.object(
+        server, "_REST__auth_get", side_effect=[first_page, last_page]
+    )
+    gen_url = url + "?is_valid=True&limit=32&pagination=keyset"
+    exp_calls = [call(gen_url), call(gen_url + "&cursor=abc%3D")]
+
+    # Act
+    elements = server._REST__get_list(url)
+
+    # Assert
+    spy.assert_has_calls(exp_calls)
+    assert elements == [{"id": 1}, {"id": 2}]
+
+
+def test__get_list_keeps_latest_version_of_elements_modified_while_listing(
+    mocker, server
+):
+    # Arrange
+    next_url = f"{url}?cursor=abc"
+    first_page = MockResponse(
+        {"next": next_url, "results": [{"id": 1, "v": 1}, {"id": 2, "v": 1}]}, 200
+    )
+    last_page = MockResponse(
+        {"next": None, "results": [{"id": 3, "v": 1}, {"id": 1, "v": 2}]}, 200
+    )
+    mocker.patch.object(server, "_REST__auth_get", side_effect=[first_page, last_page])
+
+    # Act
+    elements = server._REST__get_list(url)
+
+    # Assert
+    assert elements == [{"id": 1, "v": 2}, {"id": 2, "v": 1}, {"id": 3, "v": 1}]
+
+
+def test__get_list_falls_back_to_offsets_if_server_ignores_keyset(mocker, server):
+    # Arrange
+    next_url = f"{url}?limit=32&offset=32"
+    first_page = MockResponse(
+        {"count": 33, "next": next_url, "results": [{}] * 32}, 200
+    )
+    last_page = MockResponse({"count": 33, "next": None, "results": [{}]}, 200)
+    spy = mocker.patch.object(
+        server, "_REST__auth_get", side_effect=[first_page, last_page]
+    )
+
+    # Act
+    elements = server._REST__get_list(url)
+
+    # Assert
+    spy.assert_called_with(url + "?is_valid=True&limit=32&offset=32")
+    assert len(elements) == 33
+
+
+def test__get_list_uses_offsets_for_partial_lists(mocker, server):
+    # Arrange
+    ret_body = MockResponse({"count": 1, "next": None, "results": []}, 200)
+    spy = mocker.patch.object(server, "_REST__auth_get", return_value=ret_body)
+
+    # Act
+    server._REST__get_list(url, num_elements=1, page_size=1)
+
+    # Assert
+    spy.assert_called_once_with(url + "?is_valid=True&limit=1&offset=0")
+
+
+def test__get_list_keeps_explicit_validity_filter(mocker, server):
+    # Arrange
+    ret_body = MockResponse({"count": 1, "next": None, "results": []}, 200)
+    spy = mocker.patch.object(server, "_REST__auth_get", return_value=ret_body)
+
+    # Act
+    server._REST__get_list(url, num_elements=1, page_size=1, filters={"is_valid": False})
+
+    # Assert
+    spy.assert_called_once_with(url + "?is_valid=False&limit=1&offset=0")
+
+
 def test__get_list_fails_if_failing_element_encountered(mocker, server):
     # Arrange
     failing_body = MockResponse({}, 500)
@@ -257,6 +407,131 @@ def test__get_list_fails_if_failing_element_encountered(mocker, server):
         server._REST__get_list(url, page_size=1)
 
 
+@pytest.mark.parametrize(
+    "method,args,exp_url",
+    [
+        ("get_datasets", [], f"{full_url}/datasets/"),
+        ("get_executions", [], f"{full_url}/results/"),
+        ("get_user_datasets", [], f"{full_url}/me/datasets/"),
+        ("get_user_executions", [], f"{full_url}/me/results/"),
+        ("get_benchmark_executions", [1], f"{full_url}/benchmarks/1/results/"),
+    ],
+)
+def test_full_lists_use_keyset_pagination(
+    mocker, server, method, args, exp_url
+):
+    # Arrange
+    ret_body = MockResponse({"next": None, "results": []}, 200)
+    count_spy = mocker.patch.object(server, "_REST__get_count")
+    spy = mocker.patch.object(server, "_REST__auth_get", return_value=ret_body)
+
+    # Act
+    getattr(server, method)(*args)
+
+    # Assert
+    count_spy.assert_not_called()
+    spy.assert_called_once_with(exp_url + "?is_valid=True&limit=32&pagination=keyset")
+
+
+@pytest.mark.parametrize(
+    "method,exp_url",
+    [("get_many_cubes", f"{full_url}/mlcubes/"), ("get_many_models", f"{full_url}/models/")],
+)
+def test_get_many_entities_filters_by_ids(mocker, server, method, exp_url):
+    # Arrange
+    spy = mocker.patch.object(server, "_REST__get_list", return_value=[{"id": 1}])
+
+    # Act
+    retrieved = getattr(server, method)([1, 2])
+
+    # Assert
+    assert retrieved == [{"id": 1}]
+    spy.assert_called_once_with(
+        exp_url,
+        num_elements=2,
+        page_size=2,
+        filters={"id__in": "1,2"},
+        error_msg=ANY,
+    )
+
+
+def test_get_many_models_chunks_ids(mocker, server):
+    # Arrange
+    config.comms_max_ids_per_request = 2
+    spy = mocker.patch.object(
+        server,
+        "_REST__get_list",
+        side_effect=lambda url, filters, **kwargs: [
+            {"id": int(uid)} for uid in filters["id__in"].split(",")
+        ],
+    )
+
+    # Act
+    retrieved = server.get_many_models([1, 2, 3])
+
+    # Assert
+    assert retrieved == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert spy.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "method,exp_url",
+    [
+        ("get_benchmark_if_modified", f"{full_url}/benchmarks/1"),
+        ("get_cube_metadata_if_modified", f"{full_url}/mlcubes/1/"),
+        ("get_model_if_modified", f"{full_url}/models/1/"),
+    ],
+)
+def test_get_if_modified_sends_etag(mocker, server, method, exp_url):
+    # Arrange
+    res = MockResponse({}, 304)
+    spy = mocker.patch.object(server, "_REST__auth_get", return_value=res)
+
+    # Act
+    getattr(server, method)(1, '"etag"')
+
+    # Assert
+    spy.assert_called_once_with(exp_url, headers={"If-None-Match": '"etag"'})
+
+
+def test_get_if_modified_returns_none_if_not_modified(mocker, server):
+    # Arrange
+    res = MockResponse({}, 304)
+    mocker.patch.object(server, "_REST__auth_get", return_value=res)
+
+    # Act
+    body, etag = server.get_benchmark_if_modified(1, '"etag"')
+
+    # Assert
+    assert body is None
+    assert etag == '"etag"'
+
+
+def test_get_if_modified_returns_body_and_new_etag(mocker, server):
+    # Arrange
+    res = MockResponse({"id": 1}, 200, headers={"ETag": '"new"'})
+    mocker.patch.object(server, "_REST__auth_get", return_value=res)
+
+    # Act
+    body, etag = server.get_benchmark_if_modified(1, '"etag"')
+
+    # Assert
+    assert body == {"id": 1}
+    assert etag == '"new"'
+
+
+def test_get_if_modified_without_etag_sends_no_condition(mocker, server):
+    # Arrange
+    res = MockResponse({"id": 1}, 200)
+    spy = mocker.patch.object(server, "_REST__auth_get", return_value=res)
+
+    # Act
+    server.get_benchmark_if_modified(1)
+
+    # Assert
+    spy.assert_called_once_with(ANY, headers={})
+
+
 @pytest.mark.parametrize("body", [{"benchmark": 1}, {}, {"test": "test"}])
 def test_get_benchmarks_calls_benchmarks_path(mocker, server, body):
     # Arrange
@@ -593,3 +868,16 @@ def test_get_mlcube_datasets_calls_auth_get_for_expected_path(mocker, server):
         f"{full_url}/mlcubes/{cube_id}/datasets/", filters={}, error_msg=ANY
     )
     assert exp_datasets == datasets
+
+
+@pytest.mark.parametrize("uids", [[], [1], [5, 3, 9, 1]])
+def test_get_many_returns_objects_in_order(mocker, server, uids):
+    # Arrange
+    retriever = mocker.Mock(side_effect=lambda uid: {"id": uid})
+
+    # Act
+    objects = server.get_many(retriever, uids)
+
+    # Assert
+    assert objects == [{"id": uid} for uid in uids]
+    assert retriever.call_count == len(uids)
@@ -0,0 +1,168 @@
+import os
+
+import pytest
+from medperf import config
+from medperf.containers.runners import docker_image_cache
+from medperf.containers.runners.docker_image_cache import loaded_image
+
+PATCH_CACHE = "medperf.containers.runners.docker_image_cache.{}"
+PATCH_FLOCK = PATCH_CACHE.format("fcntl.flock")
+
+
+@pytest.fixture
+def local_images():
+    return {}
+
+
+@pytest.fixture
+def undeletable_images():
+    return set()
+
+
+@pytest.fixture
+def docker(mocker, local_images, undeletable_images, fs):
+    archives = {"a.tar": ("a:latest", "sha256:a"), "b.tar": ("b:latest", "sha256:b")}
+
+    def load(archive_path):
+        tag, image_id = archives[archive_path]
+        local_images[tag] = (image_id, 10)
+        local_images[image_id] = (image_id, 10)
+
+    def delete(image):
+        if image in undeletable_images:
+            return False
+        local_images.pop(image, None)
+        return True
+
+    mocker.patch(
+        PATCH_CACHE.format("get_repo_tags_from_archive"),
+        side_effect=lambda archive_path: [archives[archive_path][0]],
+    )
+    mocker.patch(
+        PATCH_CACHE.format("get_local_image_props"), side_effect=local_images.get
+    )
+    return {
+        "load": mocker.patch(PATCH_CACHE.format("load_image"), side_effect=load),
+        "delete": mocker.patch(
+            PATCH_CACHE.format("delete_image"), side_effect=delete
+        ),
+    }
+
+
+def use(archive_path, archive_hash):
+    with loaded_image(archive_path, archive_hash) as image:
+        return image
+
+
+def test_archive_is_loaded_on_first_use(docker):
+    # Act
+    image = use("a.tar", "hash_a")
+
+    # Assert
+    assert image == "sha256:a"
+    docker["load"].assert_called_once_with("a.tar")
+
+
+def test_loaded_archive_is_not_loaded_again(docker):
+    # Arrange
+    use("a.tar", "hash_a")
+
+    # Act
+    image = use("a.tar", "hash_a")
+
+    # Assert
+    assert image == "sha256:a"
+    docker["load"].assert_called_once()
+
+
+def test_archive_is_reloaded_if_its_image_was_removed(docker, local_images):
+    # Arrange
+    use("a.tar", "hash_a")
+    local_images.clear()
+
+    # Act
+    use("a.tar", "hash_a")
+
+    # Assert
+    assert docker["load"].call_count == 2
+
+
+def test_least_recently_used_images_are_evicted_beyond_budget(docker, local_images):
+    # Arrange
+    config.docker_image_cache_size = 15
+    use("a.tar", "hash_a")
+
+    # Act
+    use("b.tar", "hash_b")
+
+    # Assert
+    docker["delete"].assert_called_once_with("sha256:a")
+    assert "sha256:b" in local_images
+
+
+def test_images_in_use_are_not_evicted(docker):
+    # Arrange
+    config.docker_image_cache_size = 15
+
+    # Act
+    with loaded_image("a.tar", "hash_a"):
+        use("b.tar", "hash_b")
+
+    # Assert
+    docker["delete"].assert_not_called()
+    assert docker_image_cache._in_use["hash_a"] == 0
+
+
+def test_images_that_cannot_be_deleted_are_kept(
+    docker, local_images, undeletable_images
+):
+    # Arrange
+    config.docker_image_cache_size = 15
+    undeletable_images.add("sha256:a")
+    use("a.tar", "hash_a")
+    use("b.tar", "hash_b")
+
+    # Act
+    image = use("a.tar", "hash_a")
+
+    # Assert
+    assert image == "sha256:a"
+    docker["load"].assert_called_with("b.tar")
+    assert "sha256:b" not in local_images
+
+
+def test_images_used_by_other_processes_are_not_evicted(mocker, docker, local_images):
+    # Arrange
+    config.docker_image_cache_size = 15
+    use("a.tar", "hash_a")
+
+    def flock(f, operation):
+        if operation & docker_image_cache.fcntl.LOCK_NB:
+            raise BlockingIOError
+
+    mocker.patch(PATCH_FLOCK, side_effect=flock)
+
+    # Act
+    use("b.tar", "hash_b")
+
+    # Assert
+    docker["delete"].assert_not_called()
+    assert "sha256:a" in local_images
+    assert "sha256:b" in local_images
+
+
+def test_registry_and_archive_loads_are_locked_across_processes(mocker, docker):
+    # Arrange
+    flock = mocker.patch(PATCH_FLOCK)
+
+    # Act
+    use("a.tar", "hash_a")
+
+    # Assert
+    locked_files = {
+        os.path.basename(args[0].name)
+        for args, _ in flock.call_args_list
+        if args[1] == docker_image_cache.fcntl.LOCK_EX
+    }
+    assert f"{config.docker_images_registry_file}.lock" in locked_files
+    assert "hash_a.load.lock" in locked_files
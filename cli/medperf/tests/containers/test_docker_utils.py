@@ -0,0 +1,36 @@
+import pytest
+from medperf.containers.runners.docker_utils import load_encrypted_image
+from medperf.exceptions import ExecutionError
+
+PATCH_DECRYPT = (
+    "medperf.containers.runners.docker_utils.SymmetricEncryption.decrypt_file_to_command"
+)
+
+
+@pytest.mark.parametrize(
+    "output,images",
+    [
+        ("Loaded image: repo/image:tag\n", ["repo/image:tag"]),
+        ("abc: Loading layer\nLoaded image ID: sha256:abc\n", ["sha256:abc"]),
+        ("Loaded image: a:1\nLoaded image: b:2\n", ["a:1", "b:2"]),
+    ],
+)
+def test_load_encrypted_image_returns_loaded_images(mocker, output, images):
+    # Arrange
+    spy = mocker.patch(PATCH_DECRYPT, return_value=output)
+
+    # Act
+    loaded = load_encrypted_image("image.tar.gpg", "key")
+
+    # Assert
+    spy.assert_called_once_with("image.tar.gpg", "key", ["docker", "load"])
+    assert loaded == images
+
+
+def test_load_encrypted_image_fails_if_nothing_was_loaded(mocker):
+    # Arrange
+    mocker.patch(PATCH_DECRYPT, return_value="")
+
+    # Act & Assert
+    with pytest.raises(ExecutionError):
+        load_encrypted_image("image.tar.gpg", "key")
@@ -0,0 +1,106 @@
+import os
+
+import pytest
+from medperf import config
+from medperf.containers.runners import sif_image_cache
+from medperf.containers.runners.sif_image_cache import cached_image
+
+PATCH_FLOCK = "medperf.containers.runners.sif_image_cache.fcntl.flock"
+
+
+@pytest.fixture
+def build(mocker, fs):
+    def write_image(output_path):
+        with open(output_path, "w") as f:
+            f.write("x" * 10)
+
+    return mocker.Mock(side_effect=write_image)
+
+
+def use(image_name, build):
+    with cached_image(image_name, build) as image_path:
+        return image_path
+
+
+def test_image_is_built_on_first_use(build):
+    # Act
+    image_path = use("a.sif", build)
+
+    # Assert
+    assert image_path == os.path.join(config.images_folder, "a.sif")
+    assert os.path.exists(image_path)
+    build.assert_called_once()
+    assert build.call_args[0][0] != image_path
+
+
+def test_cached_image_is_not_built_again(build):
+    # Arrange
+    use("a.sif", build)
+
+    # Act
+    use("a.sif", build)
+
+    # Assert
+    build.assert_called_once()
+
+
+def test_failed_build_leaves_no_image(mocker, fs):
+    # Arrange
+    def fail(output_path):
+        with open(output_path, "w") as f:
+            f.write("partial")
+        raise RuntimeError
+
+    # Act
+    with pytest.raises(RuntimeError):
+        use("a.sif", fail)
+
+    # Assert
+    files = os.listdir(config.images_folder)
+    assert [file for file in files if file != sif_image_cache.SIF_LOCKS_FOLDER] == []
+
+
+def test_least_recently_used_images_are_evicted_beyond_budget(build):
+    # Arrange
+    config.sif_image_cache_size = 15
+    image_a = use("a.sif", build)
+
+    # Act
+    image_b = use("b.sif", build)
+
+    # Assert
+    assert not os.path.exists(image_a)
+    assert os.path.exists(image_b)
+
+
+def test_images_in_use_are_not_evicted(build):
+    # Arrange
+    config.sif_image_cache_size = 15
+
+    # Act
+    with cached_image("a.sif", build) as image_a:
+        image_b = use("b.sif", build)
+
+    # Assert
+    assert os.path.exists(image_a)
+    assert os.path.exists(image_b)
+    assert sif_image_cache._in_use["a.sif"] == 0
+
+
+def test_images_used_by_other_processes_are_not_evicted(mocker, build):
+    # Arrange
+    config.sif_image_cache_size = 15
+    image_a = use("a.sif", build)
+
+    def flock(f, operation):
+        if operation & sif_image_cache.fcntl.LOCK_NB:
+            raise BlockingIOError
+
+    mocker.patch(PATCH_FLOCK, side_effect=flock)
+
+    # Act
+    image_b = use("b.sif", build)
+
+    # Assert
+    assert os.path.exists(image_a)
+    assert os.path.exists(image_b)
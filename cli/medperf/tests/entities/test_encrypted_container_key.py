@@ -1,8 +1,12 @@
 import pytest
 import base64
 from medperf.tests.mocks.certificate import TestCertificate
+from medperf.tests.mocks.encrypted_key import TestEncryptedKey
 from medperf.entities.encrypted_key import EncryptedKey
 from medperf.exceptions import (
+    CommunicationConnectionError,
+    CommunicationRetrievalError,
+    CommunicationServerError,
     MedperfException,
     PrivateContainerAccessError,
     DecryptionError,
@@ -151,3 +155,78 @@ def test_decrypt_missing_private_key(mocker):
     # Act + Assert
     with pytest.raises(DecryptionError):
         encrypted_key.decrypt()
+
+
+# -------------------------------------------------------------------
+# upload_many
+# -------------------------------------------------------------------
+def _keys(cert_ids):
+    return [
+        TestEncryptedKey(id=None, certificate=cid, name=f"k{cid}") for cid in cert_ids
+    ]
+
+
+def _uploaded_certificates(upload_spy):
+    calls = upload_spy.call_args_list
+    return [[key["certificate"] for key in c.args[0]] for c in calls]
+
+
+def test_upload_many_uploads_in_chunks(mocker, comms):
+    # Arrange
+    mocker.patch(PATCH_EK.format("config.encrypted_keys_upload_chunk_size"), 2)
+    spy = mocker.patch.object(
+        comms, "upload_many_encrypted_keys", side_effect=lambda keys: keys
+    )
+
+    # Act
+    uploaded = EncryptedKey.upload_many(_keys([1, 2, 3, 4, 5]))
+
+    # Assert
+    assert _uploaded_certificates(spy) == [[1, 2], [3, 4], [5]]
+    assert [key["certificate"] for key in uploaded] == [1, 2, 3, 4, 5]
+
+
+def test_upload_many_retries_only_keys_not_stored(mocker, comms):
+    # Arrange
+    mocker.patch(PATCH_EK.format("config.encrypted_keys_upload_chunk_size"), 2)
+    spy = mocker.patch.object(
+        comms,
+        "upload_many_encrypted_keys",
+        side_effect=[[{}, {}], CommunicationConnectionError, [{}]],
+    )
+    get_keys_spy = mocker.patch.object(
+        EncryptedKey, "get_container_keys", return_value=_keys([1, 2, 3])
+    )
+
+    # Act
+    EncryptedKey.upload_many(_keys([1, 2, 3, 4]))
+
+    # Assert
+    assert _uploaded_certificates(spy) == [[1, 2], [3, 4], [4]]
+    get_keys_spy.assert_called_once_with(1)
+
+
+def test_upload_many_raises_after_all_attempts_fail(mocker, comms):
+    # Arrange
+    mocker.patch(PATCH_EK.format("config.encrypted_keys_upload_attempts"), 2)
+    spy = mocker.patch.object(
+        comms, "upload_many_encrypted_keys", side_effect=CommunicationServerError
+    )
+    mocker.patch.object(EncryptedKey, "get_container_keys", return_value=[])
+
+    # Act & Assert
+    with pytest.raises(CommunicationServerError):
+        EncryptedKey.upload_many(_keys([1, 2]))
+    assert spy.call_count == 2
+
+
+def test_upload_many_does_not_retry_rejected_keys(mocker, comms):
+    # Arrange
+    spy = mocker.patch.object(
+        comms, "upload_many_encrypted_keys", side_effect=CommunicationRetrievalError
+    )
+
+    # Act & Assert
+    with pytest.raises(CommunicationRetrievalError):
+        EncryptedKey.upload_many(_keys([1, 2]))
+    spy.assert_called_once()
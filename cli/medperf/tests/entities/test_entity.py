@@ -1,5 +1,9 @@
+import json
 import os
+import shutil
+from unittest.mock import call
 import pytest
+from medperf import config
 from medperf.entities.benchmark import Benchmark
 from medperf.entities.cube import Cube
 from medperf.entities.dataset import Dataset
@@ -16,6 +20,9 @@ from medperf.tests.entities.utils import (
     setup_execution_comms,
 )
 from medperf.exceptions import CommunicationRetrievalError, InvalidArgumentError
+from medperf.tests.mocks.benchmark import TestBenchmark
+
+PATCH_USER_DATA = "medperf.entities.interface.get_medperf_user_data"
 
 
 @pytest.fixture(params=[Benchmark, Cube, Dataset, Execution])
@@ -128,6 +135,347 @@ class TestGet:
             Implementation.get(id)
 
 
+@pytest.mark.parametrize("setup", [{"remote": [479, 42, 7, 1]}], indirect=True)
+class TestGetMany:
+    def test_get_many_retrieves_entities_in_order(self, Implementation, comms, setup):
+        # Arrange
+        ids = [7, 479, 1]
+        comms.get_many.side_effect = lambda retriever, uids: [
+            retriever(uid) for uid in uids
+        ]
+
+        # Act
+        entities = Implementation.get_many(ids)
+
+        # Assert
+        assert [entity.todict()["id"] for entity in entities] == ids
+
+    def test_get_many_stores_entities_locally(self, Implementation, comms, setup):
+        # Arrange
+        ids = [42, 1]
+        comms.get_many.side_effect = lambda retriever, uids: [
+            retriever(uid) for uid in uids
+        ]
+
+        # Act
+        entities = Implementation.get_many(ids)
+
+        # Assert
+        for entity in entities:
+            assert os.path.exists(entity.path)
+
+
+@pytest.mark.parametrize("Implementation", [Cube])
+@pytest.mark.parametrize("setup", [{"remote": [1, 2, 3]}], indirect=True)
+class TestBatchGetMany:
+    @pytest.fixture(autouse=True)
+    def set_common_attributes(self, comms):
+        comms.get_many.side_effect = lambda retriever, uids: [
+            retriever(uid) for uid in uids
+        ]
+
+    def test_get_many_uses_single_batch_request(self, Implementation, comms, setup):
+        # Arrange
+        ids = [3, 1, 2]
+
+        # Act
+        entities = Implementation.get_many(ids)
+
+        # Assert
+        assert [entity.id for entity in entities] == ids
+        comms.get_many_cubes.assert_called_once_with(ids)
+        comms.get_many.assert_not_called()
+
+    def test_get_many_retrieves_missing_entities_individually(
+        self, Implementation, comms, setup
+    ):
+        # Arrange
+        ids = [2, 1]
+        comms.get_many_cubes.side_effect = lambda uids: [
+            comms.get_cube_metadata.side_effect(2)
+        ]
+
+        # Act
+        entities = Implementation.get_many(ids)
+
+        # Assert
+        assert [entity.id for entity in entities] == ids
+        comms.get_many.assert_called_once_with(comms.get_cube_metadata, [1])
+
+    def test_get_many_handles_duplicated_uids(self, Implementation, comms, setup):
+        # Arrange
+        ids = [1, 2, 1]
+
+        # Act
+        entities = Implementation.get_many(ids)
+
+        # Assert
+        assert [entity.id for entity in entities] == ids
+        comms.get_many_cubes.assert_called_once_with([1, 2])
+
+
+@pytest.mark.parametrize("Implementation", [Benchmark, Cube])
+@pytest.mark.parametrize("setup", [{"remote": [479]}], indirect=True)
+class TestCachedGet:
+    @pytest.fixture(autouse=True)
+    def set_common_attributes(self, mocker, comms, Implementation, setup):
+        self.id = setup["remote"][0]
+        self.conditional_func = Implementation.get_comms_conditional_retriever()
+        first_get = self.conditional_func.side_effect(self.id)[0]
+        self.conditional_func.side_effect = [(first_get, '"v1"'), (None, '"v1"')]
+
+    def test_get_revalidates_cached_entity(self, Implementation):
+        # Arrange
+        Implementation.get(self.id)
+
+        # Act
+        entity = Implementation.get(self.id)
+
+        # Assert
+        assert entity.id == self.id
+        self.conditional_func.assert_called_with(self.id, '"v1"')
+
+    def test_get_serves_fresh_cached_entity_locally(self, Implementation):
+        # Arrange
+        config.entity_cache_ttl = 3600
+        Implementation.get(self.id)
+
+        # Act
+        entity = Implementation.get(self.id)
+
+        # Assert
+        assert entity.id == self.id
+        self.conditional_func.assert_called_once_with(self.id, None)
+
+    def test_write_invalidates_cache(self, Implementation):
+        # Arrange
+        config.entity_cache_ttl = 3600
+        entity = Implementation.get(self.id)
+        entity.write()
+        self.conditional_func.side_effect = None
+        self.conditional_func.return_value = (entity.todict(), '"v2"')
+
+        # Act
+        Implementation.get(self.id)
+
+        # Assert
+        self.conditional_func.assert_called_with(self.id, None)
+
+
+def benchmark_dict(id, modified_at, **kwargs):
+    return {**TestBenchmark(id=id, **kwargs).todict(), "modified_at": modified_at}
+
+
+class TestSyncedAll:
+    @pytest.fixture(autouse=True)
+    def set_common_attributes(self, mocker, comms, fs):
+        mocker.patch(PATCH_USER_DATA, return_value={"id": 1})
+        self.get_all = comms.get_benchmarks
+        self.first = benchmark_dict(1, "2026-01-01T00:00:00Z")
+        self.second = benchmark_dict(2, "2026-01-02T00:00:00Z")
+
+    def test_relisting_only_retrieves_changes_since_watermark(self):
+        # Arrange
+        config.entity_list_sync_overlap = 60
+        self.get_all.side_effect = [[self.first, self.second], []]
+        Benchmark.all()
+
+        # Act
+        Benchmark.all()
+
+        # Assert
+        since = "2026-01-01T23:59:00.000000Z"
+        self.get_all.assert_called_with(filters={"modified_at__gt": since, "is_valid": ""})
+        assert self.get_all.call_count == 2
+
+    def test_relisting_reuses_the_list_if_nothing_changed(self):
+        # Arrange
+        self.get_all.side_effect = [[self.first, self.second], [self.second]]
+        Benchmark.all()
+
+        # Act
+        entities = Benchmark.all()
+
+        # Assert
+        assert [entity.id for entity in entities] == [1, 2]
+        assert self.get_all.call_count == 2
+
+    def test_relisting_keeps_the_server_order(self):
+        # Arrange
+        self.get_all.side_effect = [[self.second, self.first], []]
+        Benchmark.all()
+
+        # Act
+        entities = Benchmark.all()
+
+        # Assert
+        assert [entity.id for entity in entities] == [2, 1]
+
+    def test_sync_index_only_keeps_ids(self):
+        # Arrange
+        self.get_all.side_effect = [[self.first, self.second]]
+
+        # Act
+        Benchmark.all()
+
+        # Assert
+        sync_index_file = os.path.join(
+            Benchmark.get_storage_path(), config.entity_sync_index_file
+        )
+        with open(sync_index_file) as f:
+            index = json.load(f)
+        (synced_list,) = index.values()
+        assert synced_list["ids"] == [1, 2]
+        assert "entities" not in synced_list
+
+    def test_relisting_retrieves_the_list_if_an_entity_is_no_longer_cached(self):
+        # Arrange
+        self.get_all.side_effect = [[self.first, self.second], [self.first, self.second]]
+        Benchmark.all()
+        shutil.rmtree(os.path.join(Benchmark.get_storage_path(), "2"))
+
+        # Act
+        entities = Benchmark.all()
+
+        # Assert
+        assert [entity.id for entity in entities] == [1, 2]
+        self.get_all.assert_called_with(filters={})
+
+    def test_sync_index_keeps_the_most_recently_synced_lists(self):
+        # Arrange
+        config.entity_list_sync_max_lists = 1
+        self.get_all.return_value = [self.first]
+        Benchmark.all(filters={"state": "OPERATION"})
+
+        # Act
+        Benchmark.all(filters={"state": "DEVELOPMENT"})
+
+        # Assert
+        sync_index_file = os.path.join(
+            Benchmark.get_storage_path(), config.entity_sync_index_file
+        )
+        with open(sync_index_file) as f:
+            index = json.load(f)
+        (sync_key,) = index
+        assert json.loads(sync_key)["filters"] == {"state": "DEVELOPMENT"}
+
+    def test_relisting_merges_changed_entities(self):
+        # Arrange
+        updated = benchmark_dict(1, "2026-01-03T00:00:00Z", name="updated")
+        self.get_all.side_effect = [[self.first, self.second], [updated]]
+        Benchmark.all()
+
+        # Act
+        entities = Benchmark.all()
+
+        # Assert
+        assert [entity.id for entity in entities] == [2, 1]
+        assert entities[1].name == "updated"
+        assert self.get_all.call_count == 2
+
+    def test_relisting_retrieves_the_list_if_an_entity_was_invalidated(self):
+        # Arrange
+        invalidated = benchmark_dict(2, "2026-01-03T00:00:00Z", is_valid=False)
+        self.get_all.side_effect = [
+            [self.first, self.second],
+            [invalidated],
+            [self.first],
+        ]
+        Benchmark.all()
+
+        # Act
+        entities = Benchmark.all()
+
+        # Assert
+        assert [entity.id for entity in entities] == [1]
+        self.get_all.assert_called_with(filters={})
+
+    def test_relisting_retrieves_filtered_lists_if_an_entity_changed(self):
+        # Arrange
+        filters = {"state": "OPERATION"}
+        moved_out = benchmark_dict(2, "2026-01-03T00:00:00Z", state="DEVELOPMENT")
+        self.get_all.side_effect = [
+            [self.first, self.second],
+            [moved_out],
+            [self.first],
+        ]
+        Benchmark.all(filters=dict(filters))
+
+        # Act
+        entities = Benchmark.all(filters=dict(filters))
+
+        # Assert
+        assert [entity.id for entity in entities] == [1]
+        self.get_all.assert_called_with(filters=filters)
+
+    def test_relisting_ignores_changes_already_seen(self):
+        # Arrange
+        filters = {"state": "OPERATION"}
+        other = benchmark_dict(3, "2026-01-03T00:00:00Z", state="DEVELOPMENT")
+        self.get_all.side_effect = [
+            [self.first, self.second],
+            [other],
+            [self.first, self.second],
+            [other],
+        ]
+        Benchmark.all(filters=dict(filters))
+        Benchmark.all(filters=dict(filters))
+
+        # Act
+        entities = Benchmark.all(filters=dict(filters))
+
+        # Assert
+        assert [entity.id for entity in entities] == [1, 2]
+        assert self.get_all.call_count == 4
+
+    def test_lists_are_retrieved_in_full_if_the_server_ignores_the_watermark(self):
+        # Arrange
+        self.get_all.side_effect = [
+            [self.first, self.second],
+            [self.first, self.second],
+            [self.first],
+            [self.first],
+        ]
+        Benchmark.all()
+        Benchmark.all()
+
+        # Act
+        entities = Benchmark.all()
+
+        # Assert
+        assert [entity.id for entity in entities] == [1]
+        # Once the server is known to ignore it, changes are not requested
+        assert self.get_all.call_args_list[2:] == [call(filters={}), call(filters={})]
+
+    def test_old_lists_are_retrieved_in_full(self):
+        # Arrange
+        config.entity_list_sync_max_age = 0
+        self.get_all.side_effect = [[self.first, self.second], [self.first]]
+        Benchmark.all()
+
+        # Act
+        entities = Benchmark.all()
+
+        # Assert
+        assert [entity.id for entity in entities] == [1]
+        self.get_all.assert_called_with(filters={})
+
+    @pytest.mark.parametrize("filters", [{"is_valid": True}, {"limit": 1}])
+    def test_partial_lists_are_not_synced(self, filters):
+        # Arrange
+        self.get_all.return_value = [self.first]
+        Benchmark.all(filters=dict(filters))
+
+        # Act
+        Benchmark.all(filters=dict(filters))
+
+        # Assert
+        self.get_all.assert_called_with(filters=filters)
+        assert not os.path.exists(
+            os.path.join(Benchmark.get_storage_path(), config.entity_sync_index_file)
+        )
+
+
 @pytest.mark.parametrize("setup", [{"remote": [742]}], indirect=True)
 class TestToDict:
     @pytest.fixture(autouse=True)
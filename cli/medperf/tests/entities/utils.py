@@ -43,6 +43,7 @@ def setup_benchmark_comms(mocker, comms, all_ents, user_ents, uploaded):
         "get_all": "get_benchmarks",
         "get_user": "get_user_benchmarks",
         "get_instance": "get_benchmark",
+        "get_instance_if_modified": "get_benchmark_if_modified",
         "upload_instance": "upload_benchmark",
     }
     mocker.patch.object(comms, "get_benchmark_models_associations", return_value=[])
@@ -76,6 +77,8 @@ def setup_cube_comms(mocker, comms, all_ents, user_ents, uploaded):
         "get_all": "get_cubes",
         "get_user": "get_user_cubes",
         "get_instance": "get_cube_metadata",
+        "get_instance_if_modified": "get_cube_metadata_if_modified",
+        "get_many_instances": "get_many_cubes",
         "upload_instance": "upload_mlcube",
     }
     mock_comms_entity_gets(
@@ -27,6 +27,9 @@ def mock_comms_entity_gets(
             - get_user
             - get_instance
             - upload_instance
+            Optional keys:
+            - get_instance_if_modified
+            - get_many_instances
         all_ids (List[Union[str, Dict]]): List of ids or curations that should be returned by the all endpoint
         user_ids (List[Union[str, Dict]]): List of ids or configurations that should be returned by the user endpoint
         uploaded (List): List that will be updated with uploaded instances
@@ -49,6 +52,19 @@ def mock_comms_entity_gets(
         get_instance,
         side_effect=get_behavior,
     )
+    if "get_instance_if_modified" in comms_calls:
+        mocker.patch.object(
+            comms,
+            comms_calls["get_instance_if_modified"],
+            side_effect=lambda uid, etag=None: (get_behavior(uid), None),
+        )
+    if "get_many_instances" in comms_calls:
+        ids = [ent["id"] for ent in all_ents]
+        mocker.patch.object(
+            comms,
+            comms_calls["get_many_instances"],
+            side_effect=lambda uids: [get_behavior(uid) for uid in uids if uid in ids],
+        )
     upload_behavior = upload_comms_instance_behavior(uploaded)
     mocker.patch.object(comms, upload_instance, side_effect=upload_behavior)
 
@@ -1,4 +1,11 @@
+import base64
+import datetime
+import os
 import pytest
+from cryptography import x509
+from cryptography.x509.oid import ExtendedKeyUsageOID, NameOID
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
 from medperf.exceptions import (
     InvalidCertificateAuthorityError,
     InvalidCertificateError,
@@ -143,3 +150,200 @@ def test_verify_certificate_failure_run_exception(mocker):
         certs.verify_certificate(
             certificate, expected_cn="alice@example.com", verify_ca=False
         )
+
+
+# -------------------------------------------------------------------------
+# verify_certificates
+# -------------------------------------------------------------------------
+
+
+def _name(common_name):
+    return x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, common_name)])
+
+
+def _build_cert(common_name, key, issuer_name, issuer_key, is_ca):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    builder = (
+        x509.CertificateBuilder()
+        .subject_name(_name(common_name))
+        .issuer_name(issuer_name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.BasicConstraints(ca=is_ca, path_length=None), True)
+        .add_extension(
+            x509.AuthorityKeyIdentifier.from_issuer_public_key(
+                issuer_key.public_key()
+            ),
+            False,
+        )
+    )
+    if is_ca:
+        builder = builder.add_extension(
+            x509.KeyUsage(
+                digital_signature=True,
+                content_commitment=False,
+                key_encipherment=False,
+                data_encipherment=False,
+                key_agreement=False,
+                key_cert_sign=True,
+                crl_sign=True,
+                encipher_only=False,
+                decipher_only=False,
+            ),
+            True,
+        ).add_extension(
+            x509.SubjectKeyIdentifier.from_public_key(key.public_key()), False
+        )
+    else:
+        builder = builder.add_extension(
+            x509.ExtendedKeyUsage([ExtendedKeyUsageOID.CLIENT_AUTH]), False
+        ).add_extension(
+            x509.SubjectAlternativeName([x509.RFC822Name(common_name)]), False
+        )
+    return builder.sign(issuer_key, hashes.SHA256())
+
+
+@pytest.fixture
+def root(fs):
+    key = ec.generate_private_key(ec.SECP256R1())
+    cert = _build_cert("root", key, _name("root"), key, is_ca=True)
+    return cert, key
+
+
+def _client_certificate(root, common_name, cert_id=1):
+    root_cert, root_key = root
+    key = ec.generate_private_key(ec.SECP256R1())
+    cert = _build_cert(common_name, key, root_cert.subject, root_key, is_ca=False)
+    content = cert.public_bytes(serialization.Encoding.PEM)
+    return TestCertificate(
+        id=cert_id, certificate_content_base64=base64.b64encode(content).decode()
+    )
+
+
+@pytest.fixture
+def ca(mocker, root):
+    ca = TestCA()
+    os.makedirs(ca.pki_assets, exist_ok=True)
+    with open(os.path.join(ca.pki_assets, "root.crt"), "wb") as f:
+        f.write(root[0].public_bytes(serialization.Encoding.PEM))
+    mocker.patch(PATCH_CERTS.format("CA.get"), return_value=ca)
+    mocker.patch.object(certs, "_verified_certificates", set())
+    fingerprint = root[0].fingerprint(hashes.SHA256()).hex()
+    mocker.patch.object(config, "certificate_authority_fingerprint", fingerprint)
+    return ca
+
+
+def test_verify_certificates_verifies_valid_certificates_in_process(
+    mocker, ca, root
+):
+    # Arrange
+    certificates = [
+        _client_certificate(root, "alice@example.com", 1),
+        _client_certificate(root, "bob@example.com", 2),
+    ]
+    spy = mocker.patch(PATCH_CERTS.format("verify_certificate"))
+
+    # Act
+    results = certs.verify_certificates(
+        certificates, ["alice@example.com", "bob@example.com"], verify_ca=False
+    )
+
+    # Assert
+    assert results == [True, True]
+    spy.assert_not_called()
+
+
+def test_verify_certificates_falls_back_to_container_on_cn_mismatch(
+    mocker, ca, root
+):
+    # Arrange
+    certificate = _client_certificate(root, "alice@example.com")
+    spy = mocker.patch(
+        PATCH_CERTS.format("verify_certificate"), side_effect=InvalidCertificateError
+    )
+
+    # Act
+    results = certs.verify_certificates(
+        [certificate], ["bob@example.com"], verify_ca=False
+    )
+
+    # Assert
+    assert results == [False]
+    spy.assert_called_once_with(certificate, "bob@example.com", verify_ca=False)
+
+
+def test_verify_certificates_falls_back_to_container_for_unknown_issuer(
+    mocker, ca, fs
+):
+    # Arrange
+    other_key = ec.generate_private_key(ec.SECP256R1())
+    other_root = _build_cert("other", other_key, _name("other"), other_key, True)
+    certificate = _client_certificate((other_root, other_key), "alice@example.com")
+    spy = mocker.patch(PATCH_CERTS.format("verify_certificate"))
+
+    # Act
+    results = certs.verify_certificates(
+        [certificate], ["alice@example.com"], verify_ca=False
+    )
+
+    # Assert
+    assert results == [True]
+    spy.assert_called_once()
+
+
+def test_verify_certificates_only_trusts_the_configured_root(mocker, ca):
+    # Arrange
+    other_key = ec.generate_private_key(ec.SECP256R1())
+    other_root = _build_cert("other", other_key, _name("other"), other_key, True)
+    with open(os.path.join(ca.pki_assets, "other.crt"), "wb") as f:
+        f.write(other_root.public_bytes(serialization.Encoding.PEM))
+    certificate = _client_certificate((other_root, other_key), "alice@example.com")
+    spy = mocker.patch(
+        PATCH_CERTS.format("verify_certificate"), side_effect=InvalidCertificateError
+    )
+
+    # Act
+    results = certs.verify_certificates(
+        [certificate], ["alice@example.com"], verify_ca=False
+    )
+
+    # Assert
+    assert results == [False]
+    spy.assert_called_once()
+
+
+def test_verify_certificates_caches_successful_verifications(mocker, ca, root):
+    # Arrange
+    certificate = _client_certificate(root, "alice@example.com")
+    in_process_spy = mocker.spy(certs, "_verify_certificate_in_process")
+
+    # Act
+    certs.verify_certificates([certificate], ["alice@example.com"], verify_ca=False)
+    results = certs.verify_certificates(
+        [certificate], ["alice@example.com"], verify_ca=False
+    )
+
+    # Assert
+    assert results == [True]
+    in_process_spy.assert_called_once()
+
+
+def test_verify_certificates_prepares_each_ca_once(mocker, ca, root):
+    # Arrange
+    certificates = [
+        _client_certificate(root, f"user{i}@example.com", i) for i in range(3)
+    ]
+    verify_ca_spy = mocker.patch(PATCH_CERTS.format("verify_certificate_authority"))
+
+    # Act
+    certs.verify_certificates(
+        certificates, [f"user{i}@example.com" for i in range(3)], verify_ca=True
+    )
+
+    # Assert
+    certs.CA.get.assert_called_once_with(1)
+    verify_ca_spy.assert_called_once_with(
+        ca, expected_fingerprint=config.certificate_authority_fingerprint
+    )
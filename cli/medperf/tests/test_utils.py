@@ -1,4 +1,5 @@
 import os
+import json
 from medperf.exceptions import InvalidArgumentError
 import pytest
 import logging
@@ -275,6 +276,7 @@ def test_dict_pretty_print_passes_clean_dict_to_yaml(mocker, ui, dict_with_nones
 
 def test_get_folders_hash_hashes_all_files_in_folder(mocker, filesystem):
     # Arrange
+    mocker.patch.object(config, "hash_workers", 1)
     fs = filesystem[0]
     files = filesystem[1]
     exp_calls = [call(file) for file in files]
@@ -290,6 +292,7 @@ def test_get_folders_hash_hashes_all_files_in_folder(mocker, filesystem):
 
 def test_get_folders_hash_sorts_individual_hashes(mocker, filesystem):
     # Arrange
+    mocker.patch.object(config, "hash_workers", 1)
     fs = filesystem[0]
     files = filesystem[1]
     mocker.patch("os.walk", return_value=fs)
@@ -305,6 +308,7 @@ def test_get_folders_hash_sorts_individual_hashes(mocker, filesystem):
 
 def test_get_folders_hash_returns_expected_hash(mocker, filesystem):
     # Arrange
+    mocker.patch.object(config, "hash_workers", 1)
     fs = filesystem[0]
     files = filesystem[1]
     mocker.patch("os.walk", return_value=fs)
@@ -317,6 +321,139 @@ def test_get_folders_hash_returns_expected_hash(mocker, filesystem):
     assert hash == "b7e9365f1e796ba29e9e6b1b94b5f4cc7238530601fad8ec96ece9fee68c3d7f"
 
 
+def test_get_files_hashes_keeps_paths_order(mocker, ui):
+    # Arrange
+    paths = [f"file{i}" for i in range(10)]
+    mocker.patch.object(config, "hash_workers", 4)
+    mocker.patch(patch_utils.format("get_file_hash"), side_effect=lambda path: path)
+
+    # Act
+    hashes = utils.get_files_hashes(paths)
+
+    # Assert
+    assert hashes == paths
+
+
+def test_get_files_hashes_reports_progress(mocker, ui):
+    # Arrange
+    paths = ["file1", "file2"]
+    mocker.patch.object(config, "hash_workers", 2)
+    mocker.patch(patch_utils.format("get_file_hash"), side_effect=lambda path: path)
+
+    # Act
+    utils.get_files_hashes(paths)
+
+    # Assert
+    assert ui.text == "Hashing files (2/2)"
+
+
+def test_get_folders_hash_is_independent_of_workers(mocker, fs):
+    # Arrange
+    for i in range(10):
+        fs.create_file(f"/data/{i}", contents=str(i))
+    mocker.patch.object(config, "hash_workers", 1)
+    serial_hash = utils.get_folders_hash(["/data"])
+    mocker.patch.object(config, "hash_workers", 4)
+
+    # Act
+    parallel_hash = utils.get_folders_hash(["/data"])
+
+    # Assert
+    assert parallel_hash == serial_hash
+
+
+class TestIndexedFoldersHash:
+    @pytest.fixture(autouse=True)
+    def set_common_attributes(self, fs):
+        fs.create_file("/data/a", contents="a")
+        fs.create_file("/data/sub/b", contents="b")
+        fs.create_file("/labels/c", contents="c")
+        self.paths = ["/data", "/labels"]
+        self.index_file = "/dset/.hash_index.json"
+        fs.create_dir("/dset")
+
+    def test_indexed_hash_matches_unindexed_hash(self):
+        # Act
+        indexed_hash = utils.get_folders_hash(self.paths, index_file=self.index_file)
+        reused_hash = utils.get_folders_hash(self.paths, index_file=self.index_file)
+
+        # Assert
+        assert indexed_hash == utils.get_folders_hash(self.paths)
+        assert reused_hash == indexed_hash
+
+    def test_unchanged_files_are_not_rehashed(self, mocker):
+        # Arrange
+        utils.get_folders_hash(self.paths, index_file=self.index_file)
+        spy = mocker.spy(utils, "get_file_hash")
+
+        # Act
+        utils.get_folders_hash(self.paths, index_file=self.index_file)
+
+        # Assert
+        spy.assert_not_called()
+
+    def test_modified_files_are_rehashed(self, mocker, fs):
+        # Arrange
+        utils.get_folders_hash(self.paths, index_file=self.index_file)
+        with open("/data/a", "w") as f:
+            f.write("modified")
+        spy = mocker.spy(utils, "get_file_hash")
+
+        # Act
+        hash = utils.get_folders_hash(self.paths, index_file=self.index_file)
+
+        # Assert
+        spy.assert_called_once_with(os.path.abspath("/data/a"))
+        assert hash == utils.get_folders_hash(self.paths)
+
+    def test_full_rehash_ignores_index(self, mocker):
+        # Arrange
+        utils.get_folders_hash(self.paths, index_file=self.index_file)
+        spy = mocker.spy(utils, "get_file_hash")
+
+        # Act
+        utils.get_folders_hash(
+            self.paths, index_file=self.index_file, full_rehash=True
+        )
+
+        # Assert
+        assert spy.call_count == 3
+
+    def test_deleted_files_are_dropped_from_index(self, fs):
+        # Arrange
+        utils.get_folders_hash(self.paths, index_file=self.index_file)
+        os.remove("/labels/c")
+
+        # Act
+        utils.get_folders_hash(self.paths, index_file=self.index_file)
+
+        # Assert
+        with open(self.index_file) as f:
+            index = json.load(f)
+        assert os.path.abspath("/labels/c") not in index
+        assert len(index) == 2
+
+    def test_overlapping_folders_match_unindexed_hash(self):
+        # Arrange
+        paths = ["/data", "/data/sub"]
+
+        # Act
+        hash = utils.get_folders_hash(paths, index_file=self.index_file)
+
+        # Assert
+        assert hash == utils.get_folders_hash(paths)
+
+    def test_corrupt_index_is_ignored(self, fs):
+        # Arrange
+        fs.create_file(self.index_file, contents="{not json")
+
+        # Act
+        hash = utils.get_folders_hash(self.paths, index_file=self.index_file)
+
+        # Assert
+        assert hash == utils.get_folders_hash(self.paths)
+
+
 @pytest.mark.parametrize(
     "encode_pair",
     [(float("nan"), "nan"), (float("inf"), "Infinity"), (float("-inf"), "-Infinity")],
@@ -396,3 +533,18 @@ def test_failing_validate_and_normalize_emails(emails):
     # Act & Assert
     with pytest.raises(InvalidArgumentError):
         utils.validate_and_normalize_emails(emails)
+
+
+def test_spawn_and_kill_tracks_concurrent_tasks_separately(mocker):
+    # Arrange
+    mocker.patch.object(config, "running_containers", {})
+    mocker.patch.object(utils.spawn_and_kill, "spawn")
+
+    # Act
+    with utils.spawn_and_kill("cmd", task="infer") as first:
+        with utils.spawn_and_kill("cmd", task="infer") as second:
+            running = dict(config.running_containers)
+
+    # Assert
+    assert running == {"infer": first, "infer (2)": second}
+    assert config.running_containers == {}
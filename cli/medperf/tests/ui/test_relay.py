@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+
+from medperf.ui.interface import UI
+from medperf.ui.relay import RelayUI
+
+
+@pytest.fixture
+def wrapped_ui(mocker):
+    return mocker.create_autospec(spec=UI)
+
+
+def run_in_thread(func):
+    thread = threading.Thread(target=func)
+    thread.start()
+    thread.join()
+
+
+def test_calls_from_owner_thread_are_not_queued(wrapped_ui):
+    # Arrange
+    relay = RelayUI(wrapped_ui)
+
+    # Act
+    relay.print("msg")
+    relay.text = "text"
+
+    # Assert
+    wrapped_ui.print.assert_called_once_with("msg")
+    assert wrapped_ui.text == "text"
+
+
+def test_calls_from_other_threads_run_when_processed(wrapped_ui):
+    # Arrange
+    relay = RelayUI(wrapped_ui)
+
+    def worker():
+        relay.print("msg")
+        relay.text = "text"
+
+    run_in_thread(worker)
+    wrapped_ui.print.assert_not_called()
+
+    # Act
+    relay.process_pending()
+
+    # Assert
+    wrapped_ui.print.assert_called_once_with("msg")
+    assert wrapped_ui.text == "text"
+
+
+def test_other_threads_dont_change_interactive_sessions(wrapped_ui):
+    # Arrange
+    relay = RelayUI(wrapped_ui)
+
+    def worker():
+        with relay.interactive():
+            relay.stop_interactive()
+
+    # Act
+    run_in_thread(worker)
+    relay.process_pending()
+
+    # Assert
+    wrapped_ui.interactive.assert_not_called()
+    wrapped_ui.stop_interactive.assert_not_called()
+
+
+def test_processing_runs_the_calls_queued_by_wrapped_relays(wrapped_ui):
+    # Arrange
+    inner = RelayUI(wrapped_ui)
+    outer = RelayUI(inner)
+    run_in_thread(lambda: inner.print("msg"))
+
+    # Act
+    run_in_thread(outer.process_pending)
+    wrapped_ui.print.assert_not_called()
+    outer.process_pending()
+
+    # Assert
+    wrapped_ui.print.assert_called_once_with("msg")
@@ -0,0 +1,74 @@
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from queue import Empty, Queue
+
+from .interface import UI
+
+PROMPTS = ["prompt", "hidden_prompt"]
+INTERACTIVE = ["start_interactive", "stop_interactive"]
+
+
+class RelayUI:
+    """Wraps a UI so that it can be used from worker threads. Calls made from other
+    threads are queued, and run by the thread that created the relay when it calls
+    process_pending. Prompts wait for their answer, other calls return immediately.
+    Worker threads can't start or stop interactive sessions, these are owned by the
+    creating thread.
+    """
+
+    def __init__(self, ui: UI):
+        object.__setattr__(self, "ui", ui)
+        object.__setattr__(self, "_owner", threading.get_ident())
+        object.__setattr__(self, "_calls", Queue())
+
+    def _is_owner(self) -> bool:
+        return threading.get_ident() == self._owner
+
+    def _relay(self, func, *args, **kwargs) -> Future:
+        future = Future()
+        self._calls.put((func, args, kwargs, future))
+        return future
+
+    @contextmanager
+    def _worker_interactive(self):
+        yield self
+
+    def __getattr__(self, name):
+        attr = getattr(self.ui, name)
+        if self._is_owner() or not callable(attr):
+            return attr
+        if name == "interactive":
+            return self._worker_interactive
+        if name in INTERACTIVE:
+            return lambda: None
+
+        def relayed(*args, **kwargs):
+            future = self._relay(attr, *args, **kwargs)
+            if name in PROMPTS:
+                return future.result()
+
+        return relayed
+
+    def __setattr__(self, name, value):
+        if self._is_owner():
+            setattr(self.ui, name, value)
+        else:
+            self._relay(setattr, self.ui, name, value)
+
+    def process_pending(self):
+        """Runs the calls queued by other threads, including the ones queued by the
+        relays this one wraps. Only the thread that created the relay runs them"""
+        if not self._is_owner():
+            return
+        if isinstance(self.ui, RelayUI):
+            self.ui.process_pending()
+        while True:
+            try:
+                func, args, kwargs, future = self._calls.get_nowait()
+            except Empty:
+                return
+            try:
+                future.set_result(func(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
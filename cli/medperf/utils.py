@@ -10,7 +10,10 @@ import random
 import hashlib
 import logging
 import tarfile
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from glob import glob
 import json
 from pathlib import Path
@@ -50,7 +53,7 @@ def get_file_hash(path: str) -> str:
         str: Calculated hash
     """
     logging.debug("Calculating hash for file {}".format(path))
-    BUF_SIZE = 65536
+    BUF_SIZE = config.hash_chunk_size
     sha = hashlib.sha256()
     with open(path, "rb") as f:
         while True:
@@ -64,6 +67,36 @@ def get_file_hash(path: str) -> str:
     return sha_val
 
 
+def get_files_hashes(paths: List[str]) -> List[str]:
+    """Calculates the sha256 hashes of several files, using up to config.hash_workers
+    threads. Hashing and file reads release the GIL, so files are hashed in parallel.
+    Progress is reported through config.ui.
+
+    Args:
+        paths (List[str]): Locations of the files of interest.
+
+    Returns:
+        List[str]: Calculated hashes, in the same order as the given paths
+    """
+    workers = min(config.hash_workers, len(paths))
+    if workers <= 1:
+        return [get_file_hash(path) for path in paths]
+
+    hashes = [None] * len(paths)
+    last_report = 0
+    with config.ui.interactive(), ThreadPoolExecutor(
+        workers, thread_name_prefix="medperf-hash"
+    ) as pool:
+        futures = {pool.submit(get_file_hash, path): i for i, path in enumerate(paths)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            hashes[futures[future]] = future.result()
+            # Throttle updates, as the UI may forward each of them as an event
+            if time.monotonic() - last_report >= 0.5 or done == len(paths):
+                config.ui.text = f"Hashing files ({done}/{len(paths)})"
+                last_report = time.monotonic()
+    return hashes
+
+
 def remove_path(path, sensitive=False):
     """Cleans up a clutter object. In case of failure, it is moved to `.trash`"""
 
@@ -362,25 +395,36 @@ def combine_proc_sp_text(proc: spawn) -> str:
     return proc_out
 
 
-def get_folders_hash(paths: List[str]) -> str:
+def get_folders_hash(
+    paths: List[str], index_file: str = None, full_rehash: bool = False
+) -> str:
     """Generates a hash for all the contents of the fiven folders. This procedure
     hashes all the files in all passed folders, sorts them and then hashes that list.
 
+    If an index file is given, the hash of each file is stored there along with the file's
+    size, modification time and inode. Files whose entry is unchanged are not read again
+    on later calls. The resulting hash is the same with or without an index.
+
     Args:
         paths List(str): Folders to hash.
+        index_file (str, optional): Path of the per-file hash index. Defaults to None.
+        full_rehash (bool, optional): Ignore the index and hash every file again. The index
+            is still updated. Defaults to False.
 
     Returns:
         str: sha256 hash that represents all the folders altogether
     """
-    hashes = []
-
+    filepaths = []
     # The hash doesn't depend on the order of paths or folders, as the hashes get sorted after the fact
     for path in paths:
         for root, _, files in os.walk(path, topdown=False):
             for file in files:
-                logging.debug(f"Hashing file {file}")
-                filepath = os.path.join(root, file)
-                hashes.append(get_file_hash(filepath))
+                filepaths.append(os.path.join(root, file))
+
+    if index_file is None:
+        hashes = get_files_hashes(filepaths)
+    else:
+        hashes = _get_indexed_files_hashes(filepaths, index_file, full_rehash)
 
     hashes = sorted(hashes)
     sha = hashlib.sha256()
@@ -391,6 +435,58 @@ def get_folders_hash(paths: List[str]) -> str:
     return hash_val
 
 
+def _get_indexed_files_hashes(
+    filepaths: List[str], index_file: str, full_rehash: bool
+) -> List[str]:
+    """Returns the hashes of the given files, reusing the ones stored in the index for
+    files whose size, modification time and inode didn't change. The index is then
+    replaced with the entries of the given files."""
+    index = {} if full_rehash else _load_hash_index(index_file)
+    filepaths = [os.path.abspath(filepath) for filepath in filepaths]
+    new_index = {}
+    to_hash = []
+    for filepath in filepaths:
+        if filepath in new_index:
+            # the same file may be reached through overlapping folders
+            continue
+        stat = os.stat(filepath)
+        key = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        entry = index.get(filepath)
+        if entry is not None and entry["key"] == key:
+            new_index[filepath] = entry
+        else:
+            new_index[filepath] = {"key": key, "hash": None}
+            to_hash.append(filepath)
+
+    for filepath, file_hash in zip(to_hash, get_files_hashes(to_hash)):
+        new_index[filepath]["hash"] = file_hash
+
+    _store_hash_index(index_file, new_index)
+    return [new_index[filepath]["hash"] for filepath in filepaths]
+
+
+def _load_hash_index(index_file: str) -> dict:
+    if not os.path.exists(index_file):
+        return {}
+    try:
+        with open(index_file) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable hash index {index_file}: {e}")
+        return {}
+
+
+def _store_hash_index(index_file: str, index: dict):
+    # Write to a temporary file first so that an interrupted write never leaves a corrupt index
+    tmp_index_file = index_file + ".tmp"
+    try:
+        with open(tmp_index_file, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_index_file, index_file)
+    except OSError as e:
+        logging.warning(f"Could not store hash index {index_file}: {e}")
+
+
 def list_files(startpath):
     tree_str = ""
     for root, dirs, files in os.walk(startpath):
@@ -506,6 +602,9 @@ def check_for_updates() -> None:
         logging.debug(e)
 
 
+_running_containers_lock = threading.Lock()
+
+
 class spawn_and_kill:
     def __init__(
         self,
@@ -524,6 +623,7 @@ class spawn_and_kill:
         self._kwargs = kwargs
         self.proc: spawn
         self.exception_occurred = False
+        self.task_key = None
 
     @staticmethod
     def spawn(*args, **kwargs):
@@ -561,13 +661,24 @@ class spawn_and_kill:
         self.pid = self.proc.pid
 
         if self.task:
-            config.running_containers[self.task] = self
+            self.__register()
 
         return self
 
+    def __register(self):
+        # Concurrent jobs may run the same task, each one is tracked under its own key
+        with _running_containers_lock:
+            key = self.task
+            count = 1
+            while key in config.running_containers:
+                count += 1
+                key = f"{self.task} ({count})"
+            config.running_containers[key] = self
+        self.task_key = key
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.task:
-            config.running_containers.pop(self.task, None)
+        if self.task_key:
+            config.running_containers.pop(self.task_key, None)
 
         if exc_type:
             self.exception_occurred = True
@@ -700,8 +811,11 @@ def _tmp_path_for_decryption(base_path: str):
 
 
 def tmp_path_for_file_decryption():
-    """Generates a temporary file path as the output path for file decryption"""
-    return _tmp_path_for_decryption(base_path=config.decrypted_files_folder)
+    """Generates a temporary file path as the output path for file decryption.
+    If config.decrypted_files_tmpfs is set, the path is in that (memory-backed) folder,
+    so that decrypted files are never written to disk."""
+    base_path = config.decrypted_files_tmpfs or config.decrypted_files_folder
+    return _tmp_path_for_decryption(base_path=base_path)
 
 
 def tmp_path_for_key_decryption():
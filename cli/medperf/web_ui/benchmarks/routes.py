@@ -117,16 +117,14 @@ def benchmark_detail_ui(
         datasets_associations = sort_associations_display(datasets_associations)
         models_associations = sort_associations_display(models_associations)
 
-        datasets = {
-            assoc["dataset"]: Dataset.get(assoc["dataset"])
-            for assoc in datasets_associations
-            if assoc["dataset"]
-        }
-        models = {
-            assoc["model"]: Model.get(assoc["model"])
-            for assoc in models_associations
-            if assoc["model"]
-        }
+        datasets_uids = list(
+            dict.fromkeys(a["dataset"] for a in datasets_associations if a["dataset"])
+        )
+        datasets = dict(zip(datasets_uids, Dataset.get_many(datasets_uids)))
+        models_uids = list(
+            dict.fromkeys(a["model"] for a in models_associations if a["model"])
+        )
+        models = dict(zip(models_uids, Model.get_many(models_uids)))
 
         # Results
         results = Execution.all(filters={"benchmark": benchmark_id})
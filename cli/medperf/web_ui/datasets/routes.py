@@ -160,7 +160,7 @@ def dataset_detail_ui(  # noqa
             models_uids = Benchmark.get_models_uids(benchmark_uid=assoc["benchmark"])
             reference_model_id = valid_benchmarks[assoc["benchmark"]].reference_model
             models_uids.insert(0, reference_model_id)
-            models = [Model.get(model_uid) for model_uid in models_uids]
+            models = Model.get_many(models_uids)
             # check if any model requires cc. if yes, remove the reference model
             for model in models:
                 if model.requires_cc():
@@ -5,6 +5,7 @@ from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema
+from utils.cache import cached_data
 
 from .models import Asset
 from .serializers import AssetSerializer, AssetDetailSerializer
@@ -21,11 +22,16 @@ class AssetList(GenericAPIView):
         """
         List all assets
         """
-        assets = Asset.objects.all()
-        assets = self.filter_queryset(assets)
-        assets = self.paginate_queryset(assets)
-        serializer = AssetSerializer(assets, many=True)
-        return self.get_paginated_response(serializer.data)
+
+        def build():
+            assets = Asset.objects.all()
+            assets = self.filter_queryset(assets)
+            assets = self.paginate_queryset(assets)
+            serializer = AssetSerializer(assets, many=True)
+            return self.get_paginated_response(serializer.data).data
+
+        data = cached_data(request.build_absolute_uri(), [(Asset, None)], build)
+        return Response(data)
 
     def post(self, request, format=None):
         """
@@ -60,8 +66,10 @@ class AssetDetail(GenericAPIView):
         Retrieve an asset instance.
         """
         asset = self.get_object(pk)
-        serializer = AssetDetailSerializer(asset)
-        return Response(serializer.data)
+        data = cached_data(
+            request.path, [(Asset, asset.pk)], lambda: AssetDetailSerializer(asset).data
+        )
+        return Response(data)
 
     def put(self, request, pk, format=None):
         """
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from utils import cache as response_cache
 
 User = get_user_model()
 
@@ -70,3 +71,6 @@ class Benchmark(models.Model):
 
     class Meta:
         ordering = ["modified_at"]
+
+
+response_cache.register(Benchmark)
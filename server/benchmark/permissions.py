@@ -1,8 +1,7 @@
 from rest_framework.permissions import BasePermission
 from .models import Benchmark
-from benchmarkdataset.models import BenchmarkDataset
-from benchmarkmodel.models import BenchmarkModel
-from django.db.models import OuterRef, Subquery
+from benchmarkdataset.models import BenchmarkDatasetStatus
+from benchmarkmodel.models import BenchmarkModelStatus
 
 
 class IsAdmin(BasePermission):
@@ -30,7 +29,6 @@ class IsBenchmarkOwner(BasePermission):
             return False
 
 
-# TODO: check effciency / database costs
 class IsAssociatedDatasetOwner(BasePermission):
     def has_permission(self, request, view):
         pk = view.kwargs.get("pk", None)
@@ -42,17 +40,8 @@ class IsAssociatedDatasetOwner(BasePermission):
             # since user.dataset_set is used below
             return False
 
-        latest_datasets_assocs_status = (
-            BenchmarkDataset.objects.all()
-            .filter(benchmark__id=pk, dataset__id=OuterRef("id"))
-            .order_by("-created_at")[:1]
-            .values("approval_status")
-        )
-
-        user_associated_datasets = (
-            request.user.dataset_set.all()
-            .annotate(assoc_status=Subquery(latest_datasets_assocs_status))
-            .filter(assoc_status="APPROVED")
+        user_associated_datasets = BenchmarkDatasetStatus.objects.filter(
+            benchmark__id=pk, dataset__owner=request.user, approval_status="APPROVED"
         )
 
         if user_associated_datasets.exists():
@@ -72,17 +61,8 @@ class IsAssociatedModelOwner(BasePermission):
             # since user.mlcube_set is used below
             return False
 
-        latest_models_assocs_status = (
-            BenchmarkModel.objects.all()
-            .filter(benchmark__id=pk, model__id=OuterRef("id"))
-            .order_by("-created_at")[:1]
-            .values("approval_status")
-        )
-
-        user_associated_models = (
-            request.user.model_set.all()
-            .annotate(assoc_status=Subquery(latest_models_assocs_status))
-            .filter(assoc_status="APPROVED")
+        user_associated_models = BenchmarkModelStatus.objects.filter(
+            benchmark__id=pk, model__owner=request.user, approval_status="APPROVED"
         )
 
         if user_associated_models.exists():
@@ -0,0 +1,127 @@
+from benchmarkdataset.models import BenchmarkDataset, BenchmarkDatasetStatus
+from benchmarkmodel.models import BenchmarkModelStatus
+from medperf.tests import MedPerfTest
+
+
+class AssociationStatusTest(MedPerfTest):
+    """Test module for keeping the status of the latest associations up to date"""
+
+    def setUp(self):
+        super(AssociationStatusTest, self).setUp()
+        bmk_owner = "bmk_owner"
+        data_owner = "data_owner"
+        model_owner = "model_owner"
+        self.create_user(bmk_owner)
+        self.create_user(data_owner)
+        self.create_user(model_owner)
+
+        prep, _, _, benchmark = self.shortcut_create_benchmark(
+            bmk_owner, bmk_owner, bmk_owner, bmk_owner
+        )
+
+        self.set_credentials(data_owner)
+        dataset = self.mock_dataset(prep["id"], state="OPERATION")
+        dataset = self.create_dataset(dataset).data
+
+        self.set_credentials(model_owner)
+        model = self.mock_model(state="OPERATION")
+        model = self.create_model(model).data
+
+        self.bmk_owner = bmk_owner
+        self.data_owner = data_owner
+        self.model_owner = model_owner
+        self.benchmark_id = benchmark["id"]
+        self.dataset_id = dataset["id"]
+        self.model_id = model["id"]
+        self.set_credentials(None)
+
+    def get_dataset_status(self):
+        return BenchmarkDatasetStatus.objects.filter(
+            benchmark__id=self.benchmark_id, dataset__id=self.dataset_id
+        ).first()
+
+    def get_latest_dataset_association(self):
+        return (
+            BenchmarkDataset.objects.filter(
+                benchmark__id=self.benchmark_id, dataset__id=self.dataset_id
+            )
+            .order_by("-created_at")
+            .first()
+        )
+
+    def associate_dataset(self, approval_status):
+        assoc = self.mock_dataset_association(
+            self.benchmark_id, self.dataset_id, approval_status=approval_status
+        )
+        self.create_dataset_association(assoc, self.data_owner, self.bmk_owner)
+
+    def test_creating_an_association_creates_its_status(self):
+        # Act
+        self.associate_dataset("PENDING")
+
+        # Assert
+        assoc_status = self.get_dataset_status()
+        self.assertEqual(assoc_status.approval_status, "PENDING")
+        self.assertEqual(
+            assoc_status.association, self.get_latest_dataset_association()
+        )
+
+    def test_approving_an_association_updates_its_status(self):
+        # Act
+        self.associate_dataset("APPROVED")
+
+        # Assert
+        self.assertEqual(self.get_dataset_status().approval_status, "APPROVED")
+
+    def test_status_follows_the_latest_association(self):
+        # Arrange
+        self.associate_dataset("REJECTED")
+
+        # Act
+        self.associate_dataset("PENDING")
+
+        # Assert
+        assoc_status = self.get_dataset_status()
+        self.assertEqual(assoc_status.approval_status, "PENDING")
+        self.assertEqual(
+            assoc_status.association, self.get_latest_dataset_association()
+        )
+        self.assertEqual(BenchmarkDatasetStatus.objects.count(), 1)
+
+    def test_deleting_the_latest_association_restores_the_previous_status(self):
+        # Arrange
+        self.associate_dataset("REJECTED")
+        self.associate_dataset("PENDING")
+
+        # Act
+        self.get_latest_dataset_association().delete()
+
+        # Assert
+        self.assertEqual(self.get_dataset_status().approval_status, "REJECTED")
+
+    def test_deleting_all_associations_deletes_the_status(self):
+        # Arrange
+        self.associate_dataset("APPROVED")
+
+        # Act
+        BenchmarkDataset.objects.filter(
+            benchmark__id=self.benchmark_id, dataset__id=self.dataset_id
+        ).delete()
+
+        # Assert
+        self.assertIsNone(self.get_dataset_status())
+
+    def test_model_association_status_follows_the_latest_association(self):
+        # Arrange
+        assoc = self.mock_model_association(
+            self.benchmark_id, self.model_id, approval_status="APPROVED"
+        )
+        self.create_model_association(assoc, self.model_owner, self.bmk_owner)
+
+        # Act
+        assoc_status = BenchmarkModelStatus.objects.get(
+            benchmark__id=self.benchmark_id, model__id=self.model_id
+        )
+
+        # Assert
+        self.assertEqual(assoc_status.approval_status, "APPROVED")
@@ -96,6 +96,30 @@ class BenchmarkGetTest(BenchmarkTest):
                     f"{key} shouldn't be visible to {self.actor}",
                 )
 
+    def test_get_benchmark_returns_not_modified_if_etag_matches(self):
+        # Arrange
+        url = self.url.format(self.testbenchmark["id"])
+        etag = self.client.get(url)["ETag"]
+
+        # Act
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_get_benchmark_etag_depends_on_visible_fields(self):
+        # Arrange
+        url = self.url.format(self.testbenchmark["id"])
+        etag = self.client.get(url)["ETag"]
+        other_actor = "other_user" if self.actor == "bmk_owner" else "bmk_owner"
+        self.set_credentials(other_actor)
+
+        # Act
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_benchmark_not_found(self):
         # Arrange
         invalid_id = 9999
@@ -0,0 +1,144 @@
+from rest_framework import status
+
+from medperf.tests import MedPerfTest
+
+from parameterized import parameterized
+
+
+class BenchmarkLeaderboardTest(MedPerfTest):
+    """Test module for GET /benchmarks/<pk>/leaderboard/ endpoint"""
+
+    def setUp(self):
+        super(BenchmarkLeaderboardTest, self).setUp()
+        bmk_owner = "bmk_owner"
+        data_owner = "data_owner"
+        model_owner = "model_owner"
+        other_user = "other_user"
+        self.create_user(bmk_owner)
+        self.create_user(data_owner)
+        self.create_user(model_owner)
+        self.create_user(other_user)
+
+        prep, ref_model, _, benchmark = self.shortcut_create_benchmark(
+            bmk_owner, bmk_owner, bmk_owner, bmk_owner
+        )
+
+        self.set_credentials(model_owner)
+        model = self.mock_model(state="OPERATION")
+        model = self.create_model(model).data
+        assoc = self.mock_model_association(
+            benchmark["id"], model["id"], approval_status="APPROVED"
+        )
+        self.create_model_association(assoc, model_owner, bmk_owner)
+
+        self.set_credentials(data_owner)
+        self.datasets_ids = []
+        for i in range(2):
+            dataset = self.mock_dataset(
+                prep["id"], generated_uid=f"dataset{i}", state="OPERATION"
+            )
+            dataset = self.create_dataset(dataset).data
+            assoc = self.mock_dataset_association(
+                benchmark["id"], dataset["id"], approval_status="APPROVED"
+            )
+            self.create_dataset_association(assoc, data_owner, bmk_owner)
+            self.datasets_ids.append(dataset["id"])
+
+        self.bmk_owner = bmk_owner
+        self.data_owner = data_owner
+        self.other_user = other_user
+        self.benchmark_id = benchmark["id"]
+        self.ref_model_id = ref_model["id"]
+        self.model_id = model["id"]
+        self.url = self.api_prefix + f"/benchmarks/{self.benchmark_id}/leaderboard/"
+        self.set_credentials(None)
+
+    def submit_result(self, model_id, dataset_id, results=None):
+        """Creates a result, and finalizes it if results are given"""
+        self.set_credentials(self.data_owner)
+        result = self.mock_result(self.benchmark_id, model_id, dataset_id)
+        result = self.create_result(result).data
+        if results is not None:
+            url = self.api_prefix + f"/results/{result['id']}/"
+            response = self.client.put(url, {"results": results}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.set_credentials(None)
+        return result
+
+    def get_leaderboard(self, params={}):
+        self.set_credentials(self.bmk_owner)
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_aggregates_latest_finalized_result_of_each_dataset(self):
+        # Arrange
+        data1, data2 = self.datasets_ids
+        self.submit_result(self.ref_model_id, data1, {"acc": 0.1, "dice": {"c1": 1}})
+        self.submit_result(self.ref_model_id, data1, {"acc": 0.5, "dice": {"c1": 3}})
+        self.submit_result(self.ref_model_id, data2, {"acc": 1, "label": "text"})
+        self.submit_result(self.ref_model_id, data2)  # not finalized
+        self.submit_result(self.model_id, data2, {"acc": 0.2})
+
+        # Act
+        leaderboard = self.get_leaderboard()
+
+        # Assert
+        self.assertEqual(
+            leaderboard["results"],
+            [
+                {
+                    "model": self.ref_model_id,
+                    "num_datasets": 2,
+                    "metrics": {
+                        "acc": {"count": 2, "mean": 0.75, "median": 0.75},
+                        "dice.c1": {"count": 1, "mean": 3, "median": 3},
+                    },
+                },
+                {
+                    "model": self.model_id,
+                    "num_datasets": 1,
+                    "metrics": {"acc": {"count": 1, "mean": 0.2, "median": 0.2}},
+                },
+            ],
+        )
+
+    def test_leaderboard_is_paginated(self):
+        # Arrange
+        data1 = self.datasets_ids[0]
+        self.submit_result(self.ref_model_id, data1, {"acc": 0.1})
+        self.submit_result(self.model_id, data1, {"acc": 0.2})
+
+        # Act
+        leaderboard = self.get_leaderboard({"limit": 1, "offset": 1})
+
+        # Assert
+        self.assertEqual(leaderboard["count"], 2)
+        self.assertEqual(
+            [row["model"] for row in leaderboard["results"]], [self.model_id]
+        )
+
+    def test_finalizing_a_result_updates_the_leaderboard(self):
+        # Arrange
+        data1, data2 = self.datasets_ids
+        self.submit_result(self.ref_model_id, data1, {"acc": 0.1})
+        self.get_leaderboard()
+        self.submit_result(self.ref_model_id, data2)  # doesn't invalidate
+
+        # Act
+        self.submit_result(self.ref_model_id, data2, {"acc": 0.3})
+
+        # Assert
+        leaderboard = self.get_leaderboard()
+        self.assertEqual(leaderboard["results"][0]["num_datasets"], 2)
+
+    @parameterized.expand([("data_owner",), ("other_user",)])
+    def test_other_users_cannot_get_the_leaderboard(self, user):
+        # Arrange
+        self.set_credentials(getattr(self, user))
+
+        # Act
+        response = self.client.get(self.url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,148 @@
+from django.db import connection
+from parameterized import parameterized
+from rest_framework import status
+
+from benchmarkdataset.models import BenchmarkDataset
+from benchmarkmodel.models import BenchmarkModel
+from dataset.models import Dataset
+from medperf.tests import MedPerfTest
+from result.models import ModelResult
+
+
+def explain(queryset):
+    """Returns the query plan of a queryset. Sequential scans are disabled on
+    PostgreSQL so that the plan reflects the available indexes even on the
+    small tables used in tests."""
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset.explain()
+
+
+class BenchmarkQueriesTest(MedPerfTest):
+    """Locks in the number of queries and the use of indexes by the endpoints
+    that resolve the latest association of datasets and models with a benchmark"""
+
+    num_participants = 3
+
+    def setUp(self):
+        super(BenchmarkQueriesTest, self).setUp()
+        bmk_owner = "bmk_owner"
+        self.create_user(bmk_owner)
+
+        prep, ref_model, _, benchmark = self.shortcut_create_benchmark(
+            bmk_owner, bmk_owner, bmk_owner, bmk_owner
+        )
+        self.set_credentials(bmk_owner)
+        ca = self.create_ca(self.mock_ca()).data
+
+        for i in range(self.num_participants):
+            model_owner = f"model_owner{i}"
+            self.create_user(model_owner)
+            self.set_credentials(model_owner)
+            model = self.mock_model(
+                name=f"model{i}",
+                container_config={f"model{i}": f"model{i}"},
+                state="OPERATION",
+            )
+            model = self.create_model(model).data
+            assoc = self.mock_model_association(
+                benchmark["id"], model["id"], approval_status="APPROVED"
+            )
+            self.create_model_association(assoc, model_owner, bmk_owner)
+
+            data_owner = f"data_owner{i}"
+            self.create_user(data_owner)
+            self.set_credentials(data_owner)
+            certificate = self.mock_certificate(ca["id"], name=f"certificate{i}")
+            self.create_certificate(certificate)
+            dataset = self.mock_dataset(
+                prep["id"], generated_uid=f"dataset{i}", state="OPERATION"
+            )
+            dataset = self.create_dataset(dataset).data
+            assoc = self.mock_dataset_association(
+                benchmark["id"], dataset["id"], approval_status="APPROVED"
+            )
+            self.create_dataset_association(assoc, data_owner, bmk_owner)
+            result = self.mock_result(benchmark["id"], ref_model["id"], dataset["id"])
+            self.create_result(result)
+
+        self.bmk_owner = bmk_owner
+        self.model_owner = model_owner
+        self.benchmark_id = benchmark["id"]
+        self.model_id = model["id"]
+        self.dataset_id = dataset["id"]
+        self.url = self.api_prefix + "/benchmarks/{0}/{1}/"
+        self.set_credentials(None)
+
+    def assertGetQueries(self, user, endpoint, num_queries):
+        self.set_credentials(user)
+        url = self.url.format(self.benchmark_id, endpoint)
+        with self.assertNumQueries(num_queries):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_datasets_list_query_budget(self):
+        self.assertGetQueries(self.bmk_owner, "datasets", 5)
+
+    def test_models_list_query_budget(self):
+        self.assertGetQueries(self.bmk_owner, "models", 5)
+
+    def test_results_list_query_budget(self):
+        self.assertGetQueries(self.bmk_owner, "results", 5)
+
+    def test_participants_info_query_budget(self):
+        self.assertGetQueries(self.bmk_owner, "participants_info", 5)
+
+    def test_datasets_certificates_query_budget(self):
+        self.assertGetQueries(self.model_owner, "datasets_certificates", 4)
+
+    @parameterized.expand(
+        [
+            ("datasets",),
+            ("models",),
+            ("results",),
+            ("participants_info",),
+        ]
+    )
+    def test_list_queries_are_independent_of_page_size(self, endpoint):
+        self.set_credentials(self.bmk_owner)
+        url = self.url.format(self.benchmark_id, endpoint)
+        self.assertListQueriesIndependentOfPageSize(url, self.num_participants)
+
+    def test_datasets_certificates_queries_are_independent_of_page_size(self):
+        self.set_credentials(self.model_owner)
+        url = self.url.format(self.benchmark_id, "datasets_certificates")
+        self.assertListQueriesIndependentOfPageSize(url, self.num_participants)
+
+    def test_latest_dataset_association_uses_index(self):
+        queryset = BenchmarkDataset.objects.filter(
+            benchmark__id=self.benchmark_id, dataset__id=self.dataset_id
+        ).order_by("-created_at")[:1]
+
+        self.assertIn("benchmarkdataset_latest_idx", explain(queryset))
+
+    def test_latest_model_association_uses_index(self):
+        queryset = BenchmarkModel.objects.filter(
+            benchmark__id=self.benchmark_id, model__id=self.model_id
+        ).order_by("-created_at")[:1]
+
+        self.assertIn("benchmarkmodel_latest_idx", explain(queryset))
+
+    def test_user_results_use_index(self):
+        queryset = ModelResult.objects.filter(owner__id=1).order_by("modified_at")
+
+        self.assertIn("modelresult_owner_idx", explain(queryset))
+
+    def test_benchmark_results_use_index(self):
+        queryset = ModelResult.objects.filter(
+            benchmark__id=self.benchmark_id
+        ).order_by("modified_at")
+
+        self.assertIn("modelresult_benchmark_idx", explain(queryset))
+
+    def test_user_datasets_use_index(self):
+        queryset = Dataset.objects.filter(owner__id=1).order_by("modified_at")
+
+        self.assertIn("dataset_owner_idx", explain(queryset))
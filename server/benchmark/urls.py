@@ -10,6 +10,7 @@ urlpatterns = [
     path("<int:pk>/models/", views.BenchmarkModelList.as_view()),
     path("<int:pk>/datasets/", views.BenchmarkDatasetList.as_view()),
     path("<int:pk>/results/", views.BenchmarkResultList.as_view()),
+    path("<int:pk>/leaderboard/", views.BenchmarkLeaderboard.as_view()),
     path("<int:pk>/participants_info/", views.ParticipantsInfo.as_view()),
     path(
         "<int:pk>/datasets_certificates/",
@@ -1,14 +1,17 @@
 from dataset.models import Dataset
-from django.db.models import OuterRef, Subquery
 from dataset.serializers import DatasetWithOwnerInfoSerializer
 from benchmarkmodel.serializers import BenchmarkListofModelsSerializer
 from benchmarkdataset.serializers import BenchmarkListofDatasetsSerializer
-from result.serializers import ModelResultSerializer
+from result.aggregates import aggregate_results
+from result.models import ModelResult
+from result.serializers import ModelResultSerializer, ModelResultAggregateSerializer
 from django.http import Http404
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema
+from utils.cache import CachedSerializer, cached_data
+from utils.http import conditional_response
 
 from .models import Benchmark
 from .serializers import (
@@ -42,11 +45,16 @@ class BenchmarkList(GenericAPIView):
         """
         List all benchmarks
         """
-        benchmarks = Benchmark.objects.all()
-        benchmarks = self.filter_queryset(benchmarks)
-        benchmarks = self.paginate_queryset(benchmarks)
-        serializer = BenchmarkPublicSerializer(benchmarks, many=True)
-        return self.get_paginated_response(serializer.data)
+
+        def build():
+            benchmarks = Benchmark.objects.all()
+            benchmarks = self.filter_queryset(benchmarks)
+            benchmarks = self.paginate_queryset(benchmarks)
+            serializer = BenchmarkPublicSerializer(benchmarks, many=True)
+            return self.get_paginated_response(serializer.data).data
+
+        data = cached_data(request.build_absolute_uri(), [(Benchmark, None)], build)
+        return Response(data)
 
     def post(self, request, format=None):
         """
@@ -130,6 +138,32 @@ class BenchmarkResultList(GenericAPIView):
         return self.get_paginated_response(serializer.data)
 
 
+class BenchmarkLeaderboard(GenericAPIView):
+    permission_classes = [IsAdmin | IsBenchmarkOwner]
+    serializer_class = ModelResultAggregateSerializer
+    queryset = ""
+
+    def get_object(self, pk):
+        try:
+            return Benchmark.objects.get(pk=pk)
+        except Benchmark.DoesNotExist:
+            raise Http404
+
+    def get(self, request, pk, format=None):
+        """
+        Retrieve the count, mean and median of each metric of each model of a
+        benchmark instance, over the latest finalized results on each dataset.
+        """
+        benchmark = self.get_object(pk)
+        aggregates = cached_data(
+            f"benchmark_leaderboard:{benchmark.id}",
+            [(ModelResult, None)],
+            lambda: aggregate_results(benchmark.id),
+        )
+        aggregates = self.paginate_queryset(aggregates)
+        return self.get_paginated_response(aggregates)
+
+
 class ParticipantsInfo(GenericAPIView):
     permission_classes = [IsAdmin | IsBenchmarkOwner]
     queryset = ""
@@ -145,17 +179,10 @@ class ParticipantsInfo(GenericAPIView):
         Retrieve datasets associated with a benchmark instance.
         """
         benchmark = self.get_object(pk)
-        latest_datasets_assocs_status = (
-            benchmark.benchmarkdataset_set.all()
-            .filter(dataset__id=OuterRef("id"))
-            .order_by("-created_at")[:1]
-            .values("approval_status")
-        )
-        datasets_with_users = (
-            Dataset.objects.all()
-            .annotate(assoc_status=Subquery(latest_datasets_assocs_status))
-            .filter(assoc_status="APPROVED")
-        )
+        datasets_with_users = Dataset.objects.filter(
+            benchmarkdatasetstatus__benchmark=benchmark,
+            benchmarkdatasetstatus__approval_status="APPROVED",
+        ).select_related("owner__userextension")
         datasets_with_users = self.paginate_queryset(datasets_with_users)
         serializer = DatasetWithOwnerInfoSerializer(datasets_with_users, many=True)
         return self.get_paginated_response(serializer.data)
@@ -187,9 +214,14 @@ class BenchmarkDetail(GenericAPIView):
         benchmark = self.get_object(pk)
         if benchmark.owner.id == request.user.id:
             serializer = BenchmarkSerializer(benchmark)
+            variant = "owner"
         else:
             serializer = BenchmarkPublicSerializer(benchmark)
-        return Response(serializer.data)
+            variant = "public"
+        serializer = CachedSerializer(
+            serializer, f"{request.path}:{variant}", [(Benchmark, benchmark.pk)]
+        )
+        return conditional_response(request, serializer, benchmark, variant=variant)
 
     def put(self, request, pk, format=None):
         """
@@ -14,5 +14,11 @@ class BenchmarkDatasetAdmin(admin.ModelAdmin):
         "modified_at",
     )
 
+    def delete_queryset(self, request, queryset):
+        # Delete the associations one by one so that the status of each pair
+        # is updated to its remaining latest association
+        for association in queryset:
+            association.delete()
+
 
 admin.site.register(BenchmarkDataset, BenchmarkDatasetAdmin)
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.26 on 2026-10-18 05:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('benchmarkdataset', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='benchmarkdataset',
+            index=models.Index(fields=['benchmark', 'dataset', '-created_at'], name='benchmarkdataset_latest_idx'),
+        ),
+    ]
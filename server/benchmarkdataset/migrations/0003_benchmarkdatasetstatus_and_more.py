@@ -0,0 +1,51 @@
+# Generated by Django 4.2.26 on 2026-10-18 05:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_statuses(apps, schema_editor):
+    BenchmarkDataset = apps.get_model("benchmarkdataset", "BenchmarkDataset")
+    BenchmarkDatasetStatus = apps.get_model("benchmarkdataset", "BenchmarkDatasetStatus")
+    latest = {}
+    for association in BenchmarkDataset.objects.order_by("created_at", "id").iterator():
+        latest[(association.benchmark_id, association.dataset_id)] = association
+    BenchmarkDatasetStatus.objects.bulk_create(
+        [
+            BenchmarkDatasetStatus(
+                benchmark_id=association.benchmark_id,
+                dataset_id=association.dataset_id,
+                association=association,
+                approval_status=association.approval_status,
+            )
+            for association in latest.values()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dataset', '0007_dataset_dataset_owner_idx'),
+        ('benchmark', '0007_remove_benchmark_reference_model_mlcube_and_more'),
+        ('benchmarkdataset', '0002_benchmarkdataset_benchmarkdataset_latest_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BenchmarkDatasetStatus',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('approval_status', models.CharField(choices=[('PENDING', 'PENDING'), ('APPROVED', 'APPROVED'), ('REJECTED', 'REJECTED')], max_length=100)),
+                ('association', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='benchmarkdataset.benchmarkdataset')),
+                ('benchmark', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='benchmark.benchmark')),
+                ('dataset', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dataset.dataset')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='benchmarkdatasetstatus',
+            constraint=models.UniqueConstraint(fields=('benchmark', 'dataset'), name='benchmarkdatasetstatus_unique'),
+        ),
+        migrations.RunPython(populate_statuses, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,8 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 
+from utils.associations import update_latest_association_status
+
 User = get_user_model()
 
 
@@ -23,3 +25,50 @@ class BenchmarkDataset(models.Model):
 
     class Meta:
         ordering = ["modified_at"]
+        indexes = [
+            # Latest association of a dataset with a benchmark
+            models.Index(
+                fields=["benchmark", "dataset", "-created_at"],
+                name="benchmarkdataset_latest_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.update_status()
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            deleted = super().delete(*args, **kwargs)
+            self.update_status()
+        return deleted
+
+    def update_status(self):
+        update_latest_association_status(
+            BenchmarkDataset,
+            BenchmarkDatasetStatus,
+            benchmark_id=self.benchmark_id,
+            dataset_id=self.dataset_id,
+        )
+
+
+class BenchmarkDatasetStatus(models.Model):
+    """Approval status of the latest association of each dataset with each benchmark.
+    It is kept up to date by BenchmarkDataset.save and BenchmarkDataset.delete, so that
+    permission checks and participant lists don't have to go through the history
+    of associations."""
+
+    dataset = models.ForeignKey("dataset.Dataset", on_delete=models.CASCADE)
+    benchmark = models.ForeignKey("benchmark.Benchmark", on_delete=models.CASCADE)
+    association = models.OneToOneField(BenchmarkDataset, on_delete=models.CASCADE)
+    approval_status = models.CharField(
+        choices=BenchmarkDataset.DATASET_STATUS, max_length=100
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["benchmark", "dataset"], name="benchmarkdatasetstatus_unique"
+            ),
+        ]
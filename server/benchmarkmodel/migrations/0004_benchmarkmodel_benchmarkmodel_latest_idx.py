@@ -0,0 +1,17 @@
+# Generated by Django 4.2.26 on 2026-10-18 05:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('benchmarkmodel', '0003_remove_benchmarkmodel_model_mlcube_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='benchmarkmodel',
+            index=models.Index(fields=['benchmark', 'model', '-created_at'], name='benchmarkmodel_latest_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.26 on 2026-10-18 05:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_statuses(apps, schema_editor):
+    BenchmarkModel = apps.get_model("benchmarkmodel", "BenchmarkModel")
+    BenchmarkModelStatus = apps.get_model("benchmarkmodel", "BenchmarkModelStatus")
+    latest = {}
+    for association in BenchmarkModel.objects.order_by("created_at", "id").iterator():
+        latest[(association.benchmark_id, association.model_id)] = association
+    BenchmarkModelStatus.objects.bulk_create(
+        [
+            BenchmarkModelStatus(
+                benchmark_id=association.benchmark_id,
+                model_id=association.model_id,
+                association=association,
+                approval_status=association.approval_status,
+            )
+            for association in latest.values()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('benchmark', '0007_remove_benchmark_reference_model_mlcube_and_more'),
+        ('model', '0002_createmodelsfromcontainers'),
+        ('benchmarkmodel', '0004_benchmarkmodel_benchmarkmodel_latest_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BenchmarkModelStatus',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('approval_status', models.CharField(choices=[('PENDING', 'PENDING'), ('APPROVED', 'APPROVED'), ('REJECTED', 'REJECTED')], max_length=100)),
+                ('association', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='benchmarkmodel.benchmarkmodel')),
+                ('benchmark', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='benchmark.benchmark')),
+                ('model', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='model.model')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='benchmarkmodelstatus',
+            constraint=models.UniqueConstraint(fields=('benchmark', 'model'), name='benchmarkmodelstatus_unique'),
+        ),
+        migrations.RunPython(populate_statuses, migrations.RunPython.noop),
+    ]
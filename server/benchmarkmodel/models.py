@@ -1,6 +1,8 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 
+from utils.associations import update_latest_association_status
+
 User = get_user_model()
 
 
@@ -24,3 +26,50 @@ class BenchmarkModel(models.Model):
 
     class Meta:
         ordering = ["-priority"]
+        indexes = [
+            # Latest association of a model with a benchmark
+            models.Index(
+                fields=["benchmark", "model", "-created_at"],
+                name="benchmarkmodel_latest_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.update_status()
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            deleted = super().delete(*args, **kwargs)
+            self.update_status()
+        return deleted
+
+    def update_status(self):
+        update_latest_association_status(
+            BenchmarkModel,
+            BenchmarkModelStatus,
+            benchmark_id=self.benchmark_id,
+            model_id=self.model_id,
+        )
+
+
+class BenchmarkModelStatus(models.Model):
+    """Approval status of the latest association of each model with each benchmark.
+    It is kept up to date by BenchmarkModel.save and BenchmarkModel.delete, so that
+    permission checks and participant lists don't have to go through the history
+    of associations."""
+
+    model = models.ForeignKey("model.Model", on_delete=models.CASCADE)
+    benchmark = models.ForeignKey("benchmark.Benchmark", on_delete=models.CASCADE)
+    association = models.OneToOneField(BenchmarkModel, on_delete=models.CASCADE)
+    approval_status = models.CharField(
+        choices=BenchmarkModel.MODEL_STATUS, max_length=100
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["benchmark", "model"], name="benchmarkmodelstatus_unique"
+            ),
+        ]
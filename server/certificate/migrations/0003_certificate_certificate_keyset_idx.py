@@ -0,0 +1,17 @@
+# Generated by Django 4.2.26 on 2026-10-18 06:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('certificate', '0002_remove_certificate_one_certificate_per_user_and_ca_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='certificate',
+            index=models.Index(fields=['modified_at', 'id'], name='certificate_keyset_idx'),
+        ),
+    ]
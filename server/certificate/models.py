@@ -27,3 +27,7 @@ class Certificate(models.Model):
                 name="One_Certificate_type_Per_User_And_CA",
             )
         ]
+        indexes = [
+            # Keyset pagination
+            models.Index(fields=["modified_at", "id"], name="certificate_keyset_idx"),
+        ]
@@ -1,9 +1,8 @@
 from __future__ import annotations
 from rest_framework.permissions import BasePermission
-from benchmarkmodel.models import BenchmarkModel
+from benchmarkmodel.models import BenchmarkModelStatus
 from benchmark.models import Benchmark
 from .models import Certificate
-from django.db.models import OuterRef, Subquery
 
 
 class IsAdmin(BasePermission):
@@ -52,7 +51,6 @@ class IsBenchmarkOwner(BasePermission):
             return False
 
 
-# TODO: check effciency / database costs
 class IsAssociatedModelOwner(BasePermission):
     def has_permission(self, request, view):
         pk = view.kwargs.get("pk", None)
@@ -64,17 +62,8 @@ class IsAssociatedModelOwner(BasePermission):
             # since user.mlcube_set is used below
             return False
 
-        latest_models_assocs_status = (
-            BenchmarkModel.objects.all()
-            .filter(benchmark__id=pk, model__id=OuterRef("id"))
-            .order_by("-created_at")[:1]
-            .values("approval_status")
-        )
-
-        user_associated_models = (
-            request.user.model_set.all()
-            .annotate(assoc_status=Subquery(latest_models_assocs_status))
-            .filter(assoc_status="APPROVED")
+        user_associated_models = BenchmarkModelStatus.objects.filter(
+            benchmark__id=pk, model__owner=request.user, approval_status="APPROVED"
         )
 
         if user_associated_models.exists():
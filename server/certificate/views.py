@@ -18,10 +18,10 @@ from .permissions import (
 )
 from training.permissions import IsExpOwner, IsAggregatorOwner
 from drf_spectacular.utils import extend_schema
-from dataset.models import Dataset
+from benchmarkdataset.models import BenchmarkDatasetStatus
+from traindataset_association.models import ExperimentDatasetStatus
 from benchmark.models import Benchmark
 from training.models import TrainingExperiment
-from django.db.models import OuterRef, Subquery
 from encrypted_key.serializers import EncryptedKeySerializer
 from encrypted_key.models import EncryptedKey
 
@@ -105,21 +105,15 @@ class CertificatesFromBenchmark(GenericAPIView):
         # benchmark -> latest approved dataset associations -> datasets -> owners -> certificates
         benchmark = self.get_object(pk)
 
-        latest_datasets_assocs_status = (
-            benchmark.benchmarkdataset_set.all()
-            .filter(dataset__id=OuterRef("id"))
-            .order_by("-created_at")[:1]
-            .values("approval_status")
+        approved_associations = BenchmarkDatasetStatus.objects.filter(
+            benchmark=benchmark, approval_status="APPROVED"
         )
-        datasets = (
-            Dataset.objects.all()
-            .annotate(assoc_status=Subquery(latest_datasets_assocs_status))
-            .filter(assoc_status="APPROVED")
-        )
-        owners_ids = datasets.values_list("owner", flat=True).distinct()
+        owners_ids = approved_associations.values_list(
+            "dataset__owner", flat=True
+        ).distinct()
         certificates = Certificate.objects.filter(
             owner__id__in=owners_ids, is_valid=True
-        )
+        ).select_related("owner__userextension")
 
         certificates = self.paginate_queryset(certificates)
         serializer = CertificateWithOwnerInfoSerializer(certificates, many=True)
@@ -164,21 +158,15 @@ class CertificatesFromTrainingExp(GenericAPIView):
         # training experiment -> latest approved dataset associations -> datasets -> owners -> certificates
         training_exp = self.get_object(pk)
 
-        latest_datasets_assocs_status = (
-            training_exp.experimentdataset_set.all()
-            .filter(dataset__id=OuterRef("id"))
-            .order_by("-created_at")[:1]
-            .values("approval_status")
+        approved_associations = ExperimentDatasetStatus.objects.filter(
+            training_exp=training_exp, approval_status="APPROVED"
         )
-        datasets = (
-            Dataset.objects.all()
-            .annotate(assoc_status=Subquery(latest_datasets_assocs_status))
-            .filter(assoc_status="APPROVED")
-        )
-        owners_ids = datasets.values_list("owner", flat=True).distinct()
+        owners_ids = approved_associations.values_list(
+            "dataset__owner", flat=True
+        ).distinct()
         certificates = Certificate.objects.filter(
             owner__id__in=owners_ids, is_valid=True
-        )
+        ).select_related("owner__userextension")
 
         certificates = self.paginate_queryset(certificates)
         serializer = CertificateWithOwnerInfoSerializer(certificates, many=True)
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.26 on 2026-10-18 05:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dataset', '0006_alter_dataset_description_alter_dataset_location_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dataset',
+            index=models.Index(fields=['owner', 'modified_at'], name='dataset_owner_idx'),
+        ),
+    ]
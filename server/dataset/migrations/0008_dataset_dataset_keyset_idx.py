@@ -0,0 +1,17 @@
+# Generated by Django 4.2.26 on 2026-10-18 06:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dataset', '0007_dataset_dataset_owner_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dataset',
+            index=models.Index(fields=['modified_at', 'id'], name='dataset_keyset_idx'),
+        ),
+    ]
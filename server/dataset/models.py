@@ -45,3 +45,8 @@ class Dataset(models.Model):
                 name="unique_operational_dataset_output_hash",
             )
         ]
+        indexes = [
+            models.Index(fields=["owner", "modified_at"], name="dataset_owner_idx"),
+            # Keyset pagination
+            models.Index(fields=["modified_at", "id"], name="dataset_keyset_idx"),
+        ]
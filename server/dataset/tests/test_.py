@@ -151,6 +151,26 @@ class DatasetGetListTest(DatasetTest):
         self.assertEqual(len(response.data["results"]), 1)
         self.assertEqual(response.data["results"][0]["id"], dataset_id)
 
+    def test_get_dataset_list_filtered_by_ids(self):
+        # Arrange
+        self.set_credentials(self.data_owner)
+        other_dataset = self.mock_dataset(
+            data_preparation_mlcube=self.data_preproc_mlcube_id,
+            name="otherdataset",
+            generated_uid="other",
+        )
+        self.create_dataset(other_dataset)
+        self.set_credentials(self.actor)
+        dataset_id = self.testdataset["id"]
+
+        # Act
+        response = self.client.get(self.url, {"id__in": str(dataset_id)})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["id"], dataset_id)
+
     def test_get_dataset_list_private_fields(self):
         # Act
         response = self.client.get(self.url)
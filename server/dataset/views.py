@@ -3,6 +3,7 @@ from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema
+from utils.filters import IdInFilterBackend, ModifiedSinceFilterBackend
 
 from .models import Dataset
 from .permissions import IsAdmin, IsDatasetOwner
@@ -14,6 +15,8 @@ from .serializers import (
 
 
 class DatasetList(GenericAPIView):
+    # The client retrieves many datasets at once by id
+    filter_backends = [ModifiedSinceFilterBackend, IdInFilterBackend]
     serializer_class = DatasetPublicSerializer
     queryset = ""
 
@@ -23,6 +26,7 @@ class DatasetList(GenericAPIView):
         List all datasets
         """
         datasets = Dataset.objects.all()
+        datasets = self.filter_queryset(datasets)
         datasets = self.paginate_queryset(datasets)
         serializer = DatasetPublicSerializer(datasets, many=True)
         return self.get_paginated_response(serializer.data)
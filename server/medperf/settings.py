@@ -191,6 +191,24 @@ if os.getenv("USE_CLOUD_SQL_AUTH_PROXY", None):
     DATABASES["default"]["PORT"] = 5432
 
 
+# Cache used for the responses of read-mostly endpoints (see utils/cache.py).
+# Defaults to a per-process in-memory cache, which disables response caching. Set
+# CACHE_URL to share it between processes, e.g. redis://host:6379/0 or
+# filecache:///var/tmp/medperf_cache
+CACHES = {"default": env.cache_url("CACHE_URL", default="locmemcache://")}
+
+# Responses are only cached when the cache is shared by all the server processes.
+# Otherwise a process can't invalidate the responses cached by the others.
+RESPONSE_CACHE_ENABLED = CACHES["default"]["BACKEND"] not in [
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+]
+
+# Maximum time (in seconds) a cached response is kept. Cached responses are
+# invalidated as soon as the objects they depend on change.
+RESPONSE_CACHE_TIMEOUT = env.int("RESPONSE_CACHE_TIMEOUT", default=300)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -246,11 +264,12 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": ["user.backends.JWTAuthenticateOrCreateUser"],
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.IsAuthenticated"],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
+    "DEFAULT_PAGINATION_CLASS": "utils.pagination.LimitOffsetOrKeysetPagination",
     "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.NamespaceVersioning",
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
         "rest_framework.filters.OrderingFilter",
+        "utils.filters.ModifiedSinceFilterBackend",
     ],
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
@@ -317,6 +336,14 @@ SIMPLE_JWT = {
 }
 TOKEN_USER_EMAIL_CLAIM = "https://medperf.org/email"
 
+# Validated tokens and their users are cached in each process for up to
+# AUTH_CACHE_TTL seconds (never beyond the token expiry). Set it to 0 to disable.
+AUTH_CACHE_TTL = env.int("AUTH_CACHE_TTL", default=60)
+AUTH_CACHE_SIZE = env.int("AUTH_CACHE_SIZE", default=1024)
+# How often (in seconds) the JWK set is refreshed in the background when
+# AUTH_JWK_URL is used. Set it to 0 to only fetch it when validating a token.
+AUTH_JWKS_REFRESH_INTERVAL = env.int("AUTH_JWKS_REFRESH_INTERVAL", default=240)
+
 # Comma-separated list of emails
 AUTO_APPROVE_BENCHMARKS_FROM = env("AUTO_APPROVE_BENCHMARKS_FROM", default="").split(
     ","
@@ -1,8 +1,12 @@
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.conf import settings
 from rest_framework.test import APIClient
 from rest_framework import status
+from user.backends import clear_caches as clear_auth_caches
 from .testing_utils import (
     PUBLIC_KEY,
     setup_api_admin,
@@ -47,6 +51,11 @@ class MedPerfTest(TestCase):
         settings_manager.enable()
         self.addCleanup(settings_manager.disable)
 
+        # Database changes are rolled back between tests, so cached responses
+        # and their versions shouldn't outlive a test either
+        cache.clear()
+        clear_auth_caches()
+
         self.tokens = {}
         self.current_user = None
 
@@ -81,6 +90,28 @@ class MedPerfTest(TestCase):
             token = self.tokens[username]
             self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
 
+    def assertListQueriesIndependentOfPageSize(self, url, num_elements):
+        """Asserts that listing the first num_elements elements of url takes
+        as many queries as listing only the first one
+
+        Returns:
+            int: the number of queries of each request
+        """
+        # Authenticate once so that the cached user isn't looked up by only one of
+        # the measured requests
+        self.client.get(self.api_prefix + "/me/")
+        with CaptureQueriesContext(connection) as single_page:
+            response = self.client.get(url, {"limit": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+
+        num_queries = len(single_page.captured_queries)
+        with self.assertNumQueries(num_queries):
+            response = self.client.get(url, {"limit": num_elements})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), num_elements)
+        return num_queries
+
     def __create_asset(self, data, url):
         response = self.client.post(url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -18,7 +18,7 @@ from django.urls import include, re_path, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
 from django.conf import settings
 
-from utils.views import ServerAPIVersion
+from utils.views import ServerAPIVersion, ResponseCacheStats
 
 API_VERSION = settings.SERVER_API_VERSION
 API_PREFIX = 'api/' + API_VERSION + '/'
@@ -42,6 +42,7 @@ urlpatterns = [
         path("aggregators/", include("aggregator.urls", namespace=API_VERSION), name="aggregator"),
         path("cas/", include("ca.urls", namespace=API_VERSION), name="ca"),
         path('certificates/', include('certificate.urls', namespace=API_VERSION), name="certificate"),
-        path("encrypted_keys/", include("encrypted_key.urls", namespace=API_VERSION), name='encrypted_keys')
+        path("encrypted_keys/", include("encrypted_key.urls", namespace=API_VERSION), name='encrypted_keys'),
+        path("cache_stats/", ResponseCacheStats.as_view(), name="cache-stats"),
     ])),
 ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from utils import cache as response_cache
 
 User = get_user_model()
 
@@ -40,3 +41,6 @@ class MlCube(models.Model):
         )
         verbose_name_plural = "MlCubes"
         ordering = ["modified_at"]
+
+
+response_cache.register(MlCube)
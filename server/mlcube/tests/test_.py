@@ -224,6 +224,44 @@ class MlCubeGetListTest(MlCubeTest):
         self.assertEqual(len(response.data["results"]), 2)
         self.assertEqual(response.data["results"][1]["id"], mlcube_id)
 
+    def test_get_mlcube_list_filtered_by_ids(self):
+        # Arrange
+        self.set_credentials(self.mlcube_owner)
+        other_mlcube = self.mock_mlcube(
+            name="othermlcube", image_hash="other", additional_files_tarball_hash="other"
+        )
+        other_mlcube = self.create_mlcube(other_mlcube).data
+        self.set_credentials(self.actor)
+        ids = [self.testmlcube["id"], other_mlcube["id"]]
+
+        # Act
+        response = self.client.get(self.url, {"id__in": ",".join(map(str, ids))})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual([res["id"] for res in response.data["results"]], ids)
+
+    def test_get_mlcube_list_ignores_unknown_ids(self):
+        # Arrange
+        mlcube_id = self.testmlcube["id"]
+
+        # Act
+        response = self.client.get(self.url, {"id__in": f"{mlcube_id},9999"})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["id"], mlcube_id)
+
+    @parameterized.expand([("a,b",), ("1,x",), ("1.5",)])
+    def test_get_mlcube_list_rejects_invalid_ids(self, ids):
+        # Act
+        response = self.client.get(self.url, {"id__in": ids})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 class PermissionTest(MlCubeTest):
     """Test module for permissions of /mlcubes/ endpoint
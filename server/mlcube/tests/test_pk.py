@@ -53,6 +53,46 @@ class MlCubeGetTest(MlCubeTest):
             if k in self.testmlcube:
                 self.assertEqual(self.testmlcube[k], v, f"Unexpected value for {k}")
 
+    def test_get_mlcube_returns_validators(self):
+        # Arrange
+        url = self.url.format(self.testmlcube["id"])
+
+        # Act
+        response = self.client.get(url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+
+    def test_get_mlcube_returns_not_modified_if_etag_matches(self):
+        # Arrange
+        url = self.url.format(self.testmlcube["id"])
+        etag = self.client.get(url)["ETag"]
+
+        # Act
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_get_mlcube_returns_content_if_modified_after_etag(self):
+        # Arrange
+        url = self.url.format(self.testmlcube["id"])
+        etag = self.client.get(url)["ETag"]
+        self.set_credentials(self.mlcube_owner)
+        self.client.put(url, {"user_metadata": {"new": "value"}}, format="json")
+        self.set_credentials(self.actor)
+
+        # Act
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["user_metadata"], {"new": "value"})
+
     def test_mlcube_not_found(self):
         # Arrange
         invalid_id = 9999
@@ -1,8 +1,13 @@
 from django.http import Http404
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.filters import OrderingFilter
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema
+from utils.cache import CachedSerializer, cached_data
+from utils.filters import IdInFilterBackend, ModifiedSinceFilterBackend
+from utils.http import conditional_response
 
 from .models import MlCube
 from .serializers import MlCubeSerializer, MlCubeDetailSerializer
@@ -14,6 +19,13 @@ from model.models import Model
 
 
 class MlCubeList(GenericAPIView):
+    # The client retrieves many containers at once by id
+    filter_backends = [
+        DjangoFilterBackend,
+        OrderingFilter,
+        ModifiedSinceFilterBackend,
+        IdInFilterBackend,
+    ]
     serializer_class = MlCubeSerializer
     queryset = ""
     filterset_fields = ("name", "owner", "state", "is_valid")
@@ -23,11 +35,16 @@ class MlCubeList(GenericAPIView):
         """
         List all mlcubes
         """
-        mlcubes = MlCube.objects.all()
-        mlcubes = self.filter_queryset(mlcubes)
-        mlcubes = self.paginate_queryset(mlcubes)
-        serializer = MlCubeSerializer(mlcubes, many=True)
-        return self.get_paginated_response(serializer.data)
+
+        def build():
+            mlcubes = MlCube.objects.all()
+            mlcubes = self.filter_queryset(mlcubes)
+            mlcubes = self.paginate_queryset(mlcubes)
+            serializer = MlCubeSerializer(mlcubes, many=True)
+            return self.get_paginated_response(serializer.data).data
+
+        data = cached_data(request.build_absolute_uri(), [(MlCube, None)], build)
+        return Response(data)
 
     def post(self, request, format=None):
         """
@@ -63,7 +80,8 @@ class MlCubeDetail(GenericAPIView):
         """
         mlcube = self.get_object(pk)
         serializer = MlCubeDetailSerializer(mlcube)
-        return Response(serializer.data)
+        serializer = CachedSerializer(serializer, request.path, [(MlCube, mlcube.pk)])
+        return conditional_response(request, serializer, mlcube)
 
     def put(self, request, pk, format=None):
         """
@@ -1,6 +1,7 @@
 from django.db import models
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
+from utils import cache as response_cache
 
 User = get_user_model()
 
@@ -54,3 +55,6 @@ class Model(models.Model):
 
     class Meta:
         ordering = ["modified_at"]
+
+
+response_cache.register(Model)
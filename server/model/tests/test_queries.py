@@ -0,0 +1,27 @@
+from medperf.tests import MedPerfTest
+
+
+class ModelListQueriesTest(MedPerfTest):
+    """Test module for the number of queries of model lists"""
+
+    def setUp(self):
+        super(ModelListQueriesTest, self).setUp()
+        model_owner = "model_owner"
+        self.create_user(model_owner)
+        self.set_credentials(model_owner)
+        for i in range(2):
+            model = self.mock_model(
+                name=f"model{i}", container_config={f"model{i}": f"model{i}"}
+            )
+            self.create_model(model)
+            model = self.mock_asset_model(name=f"asset{i}", asset_hash=f"asset{i}")
+            self.create_model(model)
+        self.num_models = 4
+
+    def test_models_list_queries_are_independent_of_page_size(self):
+        url = self.api_prefix + "/models/"
+        self.assertListQueriesIndependentOfPageSize(url, self.num_models)
+
+    def test_user_models_list_queries_are_independent_of_page_size(self):
+        url = self.api_prefix + "/me/models/"
+        self.assertListQueriesIndependentOfPageSize(url, self.num_models)
@@ -1,8 +1,15 @@
 from django.http import Http404
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.filters import OrderingFilter
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema
+from utils.cache import CachedSerializer, cached_data
+from utils.filters import IdInFilterBackend, ModifiedSinceFilterBackend
+from utils.http import conditional_response
+from mlcube.models import MlCube
+from asset.models import Asset
 
 from .models import Model
 from .serializers import ModelSerializer, ModelDetailSerializer
@@ -10,6 +17,13 @@ from .permissions import IsAdmin, IsModelOwner
 
 
 class ModelList(GenericAPIView):
+    # The client retrieves many models at once by id
+    filter_backends = [
+        DjangoFilterBackend,
+        OrderingFilter,
+        ModifiedSinceFilterBackend,
+        IdInFilterBackend,
+    ]
     serializer_class = ModelSerializer
     queryset = ""
     filterset_fields = ("type",)
@@ -19,11 +33,18 @@ class ModelList(GenericAPIView):
         """
         List all models
         """
-        models = Model.objects.all()
-        models = self.filter_queryset(models)
-        models = self.paginate_queryset(models)
-        serializer = ModelSerializer(models, many=True)
-        return self.get_paginated_response(serializer.data)
+
+        def build():
+            models = Model.objects.select_related("container", "asset")
+            models = self.filter_queryset(models)
+            models = self.paginate_queryset(models)
+            serializer = ModelSerializer(models, many=True)
+            return self.get_paginated_response(serializer.data).data
+
+        # Models embed their container or asset
+        dependencies = [(Model, None), (MlCube, None), (Asset, None)]
+        data = cached_data(request.build_absolute_uri(), dependencies, build)
+        return Response(data)
 
     def post(self, request, format=None):
         """
@@ -57,8 +78,16 @@ class ModelDetail(GenericAPIView):
         Retrieve a model instance.
         """
         model = self.get_object(pk)
+        dependencies = [(Model, model.pk)]
+        if model.container_id is not None:
+            dependencies.append((MlCube, model.container_id))
+        if model.asset_id is not None:
+            dependencies.append((Asset, model.asset_id))
         serializer = ModelSerializer(model)
-        return Response(serializer.data)
+        serializer = CachedSerializer(serializer, request.path, dependencies)
+        return conditional_response(
+            request, serializer, model, model.container, model.asset
+        )
 
     def put(self, request, pk, format=None):
         """
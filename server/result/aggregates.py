@@ -0,0 +1,71 @@
+import statistics
+from collections import defaultdict
+
+from django.db.models import Exists, OuterRef, Q
+
+from .models import ModelResult
+
+
+def latest_finalized_results(benchmark_id):
+    """Returns the latest valid and finalized result of each model and dataset
+    of a benchmark. Older results of the same model and dataset are excluded by
+    the database, so they are never loaded."""
+    finalized = ModelResult.objects.filter(
+        benchmark__id=benchmark_id, finalized=True, is_valid=True
+    )
+    newer = finalized.filter(
+        model=OuterRef("model"), dataset=OuterRef("dataset")
+    ).filter(
+        Q(created_at__gt=OuterRef("created_at"))
+        | Q(created_at=OuterRef("created_at"), id__gt=OuterRef("id"))
+    )
+    return finalized.filter(~Exists(newer))
+
+
+def flatten_metrics(results, prefix=""):
+    """Yields the (key, value) pairs of the numeric values of a results dictionary.
+    Keys of nested dictionaries are joined with dots."""
+    for key, value in results.items():
+        key = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from flatten_metrics(value, prefix=f"{key}.")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield key, value
+
+
+def aggregate_results(benchmark_id):
+    """Computes the count, mean and median of each metric of each model of a
+    benchmark, over the latest finalized results of the model on each dataset.
+    Only the model id and the metrics of the results are loaded, one chunk at a time.
+
+    Returns:
+        list: one dictionary per model, ordered by model id
+    """
+    results = latest_finalized_results(benchmark_id).values_list("model", "results")
+    num_datasets = defaultdict(int)
+    values = defaultdict(lambda: defaultdict(list))
+    for model_id, model_results in results.order_by().iterator(chunk_size=1000):
+        num_datasets[model_id] += 1
+        if not isinstance(model_results, dict):
+            continue
+        for key, value in flatten_metrics(model_results):
+            values[model_id][key].append(value)
+
+    aggregates = []
+    for model_id in sorted(num_datasets):
+        metrics = {
+            key: {
+                "count": len(metric_values),
+                "mean": statistics.fmean(metric_values),
+                "median": statistics.median(metric_values),
+            }
+            for key, metric_values in sorted(values[model_id].items())
+        }
+        aggregates.append(
+            {
+                "model": model_id,
+                "num_datasets": num_datasets[model_id],
+                "metrics": metrics,
+            }
+        )
+    return aggregates
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.26 on 2026-10-18 05:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('result', '0008_rename_the_model_modelresult_model'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='modelresult',
+            index=models.Index(fields=['owner', 'modified_at'], name='modelresult_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='modelresult',
+            index=models.Index(fields=['benchmark', 'modified_at'], name='modelresult_benchmark_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.26 on 2026-10-18 06:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('result', '0009_modelresult_modelresult_owner_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='modelresult',
+            index=models.Index(fields=['modified_at', 'id'], name='modelresult_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.26 on 2026-10-18 06:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('result', '0010_modelresult_modelresult_keyset_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='modelresult',
+            index=models.Index(fields=['benchmark', 'model', 'dataset', 'created_at'], name='modelresult_latest_idx'),
+        ),
+    ]
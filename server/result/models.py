@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from utils import cache as response_cache
 
 User = get_user_model()
 
@@ -36,3 +37,20 @@ class ModelResult(models.Model):
 
     class Meta:
         ordering = ["modified_at"]
+        indexes = [
+            models.Index(fields=["owner", "modified_at"], name="modelresult_owner_idx"),
+            models.Index(
+                fields=["benchmark", "modified_at"], name="modelresult_benchmark_idx"
+            ),
+            # Keyset pagination
+            models.Index(fields=["modified_at", "id"], name="modelresult_keyset_idx"),
+            # Latest result of each model and dataset of a benchmark
+            models.Index(
+                fields=["benchmark", "model", "dataset", "created_at"],
+                name="modelresult_latest_idx",
+            ),
+        ]
+
+
+# Only finalized results are aggregated
+response_cache.register(ModelResult, condition=lambda result: result.finalized)
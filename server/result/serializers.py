@@ -1,7 +1,7 @@
 from django.utils import timezone
 from rest_framework import serializers
-from benchmarkdataset.models import BenchmarkDataset
-from benchmarkmodel.models import BenchmarkModel
+from benchmarkdataset.models import BenchmarkDatasetStatus
+from benchmarkmodel.models import BenchmarkModelStatus
 
 from .models import ModelResult
 
@@ -28,13 +28,9 @@ class ModelResultSerializer(serializers.ModelSerializer):
             # any dataset can create a result with the reference model
             return data
 
-        last_benchmarkmodel = (
-            BenchmarkModel.objects.filter(
-                benchmark__id=benchmark.id, model__id=model.id
-            )
-            .order_by("-created_at")
-            .first()
-        )
+        last_benchmarkmodel = BenchmarkModelStatus.objects.filter(
+            benchmark__id=benchmark.id, model__id=model.id
+        ).first()
         if not last_benchmarkmodel:
             raise serializers.ValidationError(
                 "Model must be associated to the benchmark"
@@ -45,13 +41,9 @@ class ModelResultSerializer(serializers.ModelSerializer):
                     "Model-Benchmark association must be approved"
                 )
 
-        last_benchmarkdataset = (
-            BenchmarkDataset.objects.filter(
-                benchmark__id=benchmark.id, dataset__id=dataset.id
-            )
-            .order_by("-created_at")
-            .first()
-        )
+        last_benchmarkdataset = BenchmarkDatasetStatus.objects.filter(
+            benchmark__id=benchmark.id, dataset__id=dataset.id
+        ).first()
         if not last_benchmarkdataset:
             raise serializers.ValidationError(
                 "Dataset must be associated to the benchmark"
@@ -90,3 +82,11 @@ class ModelResultDetailSerializer(serializers.ModelSerializer):
             validated_data["finalized"] = True
             validated_data["finalized_at"] = timezone.now()
         return super().update(instance, validated_data)
+
+
+class ModelResultAggregateSerializer(serializers.Serializer):
+    model = serializers.IntegerField()
+    num_datasets = serializers.IntegerField()
+    metrics = serializers.DictField(
+        child=serializers.DictField(child=serializers.FloatField())
+    )
@@ -5,3 +5,9 @@ from .models import ExperimentDataset
 @admin.register(ExperimentDataset)
 class ExperimentDatasetAdmin(admin.ModelAdmin):
     list_display = [field.name for field in ExperimentDataset._meta.fields]
+
+    def delete_queryset(self, request, queryset):
+        # Delete the associations one by one so that the status of each pair
+        # is updated to its remaining latest association
+        for association in queryset:
+            association.delete()
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.26 on 2026-10-18 05:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('traindataset_association', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='experimentdataset',
+            index=models.Index(fields=['training_exp', 'dataset', '-created_at'], name='experimentdataset_latest_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.26 on 2026-10-18 05:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_statuses(apps, schema_editor):
+    ExperimentDataset = apps.get_model("traindataset_association", "ExperimentDataset")
+    ExperimentDatasetStatus = apps.get_model("traindataset_association", "ExperimentDatasetStatus")
+    latest = {}
+    for association in ExperimentDataset.objects.order_by("created_at", "id").iterator():
+        latest[(association.training_exp_id, association.dataset_id)] = association
+    ExperimentDatasetStatus.objects.bulk_create(
+        [
+            ExperimentDatasetStatus(
+                training_exp_id=association.training_exp_id,
+                dataset_id=association.dataset_id,
+                association=association,
+                approval_status=association.approval_status,
+            )
+            for association in latest.values()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dataset', '0007_dataset_dataset_owner_idx'),
+        ('training', '0004_trainingexperiment_aggregator'),
+        ('traindataset_association', '0003_experimentdataset_experimentdataset_latest_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExperimentDatasetStatus',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('approval_status', models.CharField(choices=[('PENDING', 'PENDING'), ('APPROVED', 'APPROVED'), ('REJECTED', 'REJECTED')], max_length=100)),
+                ('association', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='traindataset_association.experimentdataset')),
+                ('dataset', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dataset.dataset')),
+                ('training_exp', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='training.trainingexperiment')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='experimentdatasetstatus',
+            constraint=models.UniqueConstraint(fields=('training_exp', 'dataset'), name='experimentdatasetstatus_unique'),
+        ),
+        migrations.RunPython(populate_statuses, migrations.RunPython.noop),
+    ]
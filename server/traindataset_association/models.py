@@ -1,6 +1,8 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 
+from utils.associations import update_latest_association_status
+
 User = get_user_model()
 
 
@@ -25,3 +27,53 @@ class ExperimentDataset(models.Model):
 
     class Meta:
         ordering = ["modified_at"]
+        indexes = [
+            # Latest association of a dataset with a training experiment
+            models.Index(
+                fields=["training_exp", "dataset", "-created_at"],
+                name="experimentdataset_latest_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.update_status()
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            deleted = super().delete(*args, **kwargs)
+            self.update_status()
+        return deleted
+
+    def update_status(self):
+        update_latest_association_status(
+            ExperimentDataset,
+            ExperimentDatasetStatus,
+            training_exp_id=self.training_exp_id,
+            dataset_id=self.dataset_id,
+        )
+
+
+class ExperimentDatasetStatus(models.Model):
+    """Approval status of the latest association of each dataset with each training
+    experiment. It is kept up to date by ExperimentDataset.save and
+    ExperimentDataset.delete, so that permission checks and participant lists don't
+    have to go through the history of associations."""
+
+    dataset = models.ForeignKey("dataset.Dataset", on_delete=models.CASCADE)
+    training_exp = models.ForeignKey(
+        "training.TrainingExperiment", on_delete=models.CASCADE
+    )
+    association = models.OneToOneField(ExperimentDataset, on_delete=models.CASCADE)
+    approval_status = models.CharField(
+        choices=ExperimentDataset.MODEL_STATUS, max_length=100
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["training_exp", "dataset"],
+                name="experimentdatasetstatus_unique",
+            ),
+        ]
@@ -1,7 +1,6 @@
 from rest_framework.permissions import BasePermission
 from .models import TrainingExperiment
-from traindataset_association.models import ExperimentDataset
-from django.db.models import OuterRef, Subquery
+from traindataset_association.models import ExperimentDatasetStatus
 
 
 class IsAdmin(BasePermission):
@@ -29,7 +28,6 @@ class IsExpOwner(BasePermission):
             return False
 
 
-# TODO: check effciency / database costs
 class IsAssociatedDatasetOwner(BasePermission):
     def has_permission(self, request, view):
         pk = view.kwargs.get("pk", None)
@@ -41,17 +39,10 @@ class IsAssociatedDatasetOwner(BasePermission):
             # since user.dataset_set is used below
             return False
 
-        latest_datasets_assocs_status = (
-            ExperimentDataset.objects.all()
-            .filter(training_exp__id=pk, dataset__id=OuterRef("id"))
-            .order_by("-created_at")[:1]
-            .values("approval_status")
-        )
-
-        user_associated_datasets = (
-            request.user.dataset_set.all()
-            .annotate(assoc_status=Subquery(latest_datasets_assocs_status))
-            .filter(assoc_status="APPROVED")
+        user_associated_datasets = ExperimentDatasetStatus.objects.filter(
+            training_exp__id=pk,
+            dataset__owner=request.user,
+            approval_status="APPROVED",
         )
 
         if user_associated_datasets.exists():
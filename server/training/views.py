@@ -12,7 +12,6 @@ from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema
 
-from django.db.models import OuterRef, Subquery
 from django.contrib.auth import get_user_model
 from dataset.models import Dataset
 from .models import TrainingExperiment
@@ -198,17 +197,10 @@ class ParticipantsInfo(GenericAPIView):
         Retrieve datasets associated with a training experiment instance.
         """
         training_exp = self.get_object(pk)
-        latest_datasets_assocs_status = (
-            training_exp.experimentdataset_set.all()
-            .filter(dataset__id=OuterRef("id"))
-            .order_by("-created_at")[:1]
-            .values("approval_status")
-        )
-        datasets_with_users = (
-            Dataset.objects.all()
-            .annotate(assoc_status=Subquery(latest_datasets_assocs_status))
-            .filter(assoc_status="APPROVED")
-        )
+        datasets_with_users = Dataset.objects.filter(
+            experimentdatasetstatus__training_exp=training_exp,
+            experimentdatasetstatus__approval_status="APPROVED",
+        ).select_related("owner__userextension")
         datasets_with_users = self.paginate_queryset(datasets_with_users)
         serializer = DatasetWithOwnerInfoSerializer(datasets_with_users, many=True)
         return self.get_paginated_response(serializer.data)
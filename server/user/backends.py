@@ -1,7 +1,16 @@
+import copy
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
 from rest_framework_simplejwt.settings import api_settings
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.extensions import OpenApiAuthenticationExtension
 from drf_spectacular.plumbing import build_bearer_security_scheme_object
@@ -14,25 +23,144 @@ def get_email_from_token(validated_token):
         raise InvalidToken(_("Token must contain the user email address"))
 
 
+class ExpiringLRUCache:
+    """A thread-safe, size-bounded mapping whose entries expire at a given time.
+    The least recently used entries are dropped when the cache is full."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at):
+        if self.maxsize <= 0 or expires_at <= time.time():
+            return
+        with self.lock:
+            self.entries[key] = (value, expires_at)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+# Tokens whose signature and claims were already verified, by token hash. Entries
+# expire with the token, or after AUTH_CACHE_TTL seconds, whichever comes first.
+validated_tokens = ExpiringLRUCache(settings.AUTH_CACHE_SIZE)
+# Authenticated users by user id (username). Entries are dropped when the user is
+# saved or deleted by this process, and expire after AUTH_CACHE_TTL seconds so
+# that changes made by other processes are eventually seen.
+users = ExpiringLRUCache(settings.AUTH_CACHE_SIZE)
+
+
+def clear_caches():
+    validated_tokens.clear()
+    users.clear()
+
+
+def forget_user(sender, instance, **kwargs):
+    users.delete(getattr(instance, api_settings.USER_ID_FIELD))
+
+
+post_save.connect(forget_user, sender=get_user_model())
+post_delete.connect(forget_user, sender=get_user_model())
+
+
+class JWKSRefresher:
+    """Refreshes the JWK set of a JWKS client in the background, before its cached
+    copy expires, so that validating a token never waits for the JWKS endpoint."""
+
+    started = False
+    lock = threading.Lock()
+
+    @classmethod
+    def start(cls, jwks_client):
+        with cls.lock:
+            if cls.started:
+                return
+            cls.started = True
+        thread = threading.Thread(
+            target=cls.run, args=(jwks_client,), name="jwks-refresh", daemon=True
+        )
+        thread.start()
+
+    @staticmethod
+    def run(jwks_client):
+        interval = settings.AUTH_JWKS_REFRESH_INTERVAL
+        while True:
+            try:
+                jwks_client.get_jwk_set(refresh=True)
+            except Exception:
+                # The cached set, if any, is kept and requests will fetch it if needed
+                logging.exception("Failed to refresh the JWK set")
+            time.sleep(interval)
+
+
 class JWTAuthenticateOrCreateUser(JWTAuthentication):
+    def authenticate(self, request):
+        if settings.AUTH_JWKS_REFRESH_INTERVAL > 0:
+            # Imported here since importing it creates the token backend from
+            # the current SIMPLE_JWT settings
+            from rest_framework_simplejwt.state import token_backend
+
+            if token_backend.jwks_client is not None:
+                JWKSRefresher.start(token_backend.jwks_client)
+        return super().authenticate(request)
+
+    def get_validated_token(self, raw_token):
+        key = hashlib.sha256(raw_token).hexdigest()
+        validated_token = validated_tokens.get(key)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            expires_at = min(
+                validated_token.get("exp", 0), time.time() + settings.AUTH_CACHE_TTL
+            )
+            validated_tokens.set(key, validated_token, expires_at)
+        return validated_token
+
     def get_user(self, validated_token):
         try:
             user_id = validated_token[api_settings.USER_ID_CLAIM]
         except KeyError:
             raise InvalidToken(_("Token contained no recognizable user identification"))
 
-        try:
-            user = self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
-        except self.user_model.DoesNotExist:
-            user_email = get_email_from_token(validated_token)
-            user = self.user_model.objects.create_user(
-                **{api_settings.USER_ID_FIELD: user_id}, email=user_email
-            )
+        user = users.get(user_id)
+        if user is None:
+            try:
+                user = self.user_model.objects.get(
+                    **{api_settings.USER_ID_FIELD: user_id}
+                )
+            except self.user_model.DoesNotExist:
+                user_email = get_email_from_token(validated_token)
+                user = self.user_model.objects.create_user(
+                    **{api_settings.USER_ID_FIELD: user_id}, email=user_email
+                )
+            users.set(user_id, user, time.time() + settings.AUTH_CACHE_TTL)
 
         if not user.is_active:
             raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
 
-        return user
+        # Each request gets its own copy, so that related objects loaded while
+        # handling a request are not shared with the following ones
+        return copy.copy(user)
 
 
 class JWTScheme(OpenApiAuthenticationExtension):
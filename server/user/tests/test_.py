@@ -1,9 +1,14 @@
+from django.contrib.auth import get_user_model
 from rest_framework import status
 
 from medperf.tests import MedPerfTest
 
 from parameterized import parameterized
 
+from user.models import UserExtension
+
+User = get_user_model()
+
 
 class UserTest(MedPerfTest):
     def generic_setup(self):
@@ -45,3 +50,20 @@ class PermissionTest(UserTest):
 
         # Assert
         self.assertEqual(response.status_code, expected_status)
+
+
+class UserListQueriesTest(UserTest):
+    """Test module for the number of queries of GET /users/"""
+
+    def setUp(self):
+        super(UserListQueriesTest, self).setUp()
+        self.generic_setup()
+        self.set_credentials(self.api_admin)
+
+    def test_queries_are_independent_of_page_size(self):
+        # Arrange
+        user = User.objects.get(username="user1")
+        UserExtension.objects.create(user=user, metadata={"key": "value"})
+
+        # Act & Assert
+        self.assertListQueriesIndependentOfPageSize(self.url, 3)
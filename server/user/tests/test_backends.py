@@ -0,0 +1,99 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from medperf.tests import MedPerfTest
+from user.backends import ExpiringLRUCache, clear_caches
+
+User = get_user_model()
+
+
+class AuthenticationCacheTest(MedPerfTest):
+    """Test module for the caches of the JWT authentication backend"""
+
+    def setUp(self):
+        super(AuthenticationCacheTest, self).setUp()
+        self.user = "user"
+        self.create_user(self.user)
+        self.set_credentials(self.user)
+        self.url = self.api_prefix + "/me/"
+
+    def test_tokens_are_validated_once(self):
+        # Arrange
+        clear_caches()
+        spy = patch.object(
+            JWTAuthentication,
+            "get_validated_token",
+            autospec=True,
+            side_effect=JWTAuthentication.get_validated_token,
+        )
+
+        # Act
+        with spy as validate:
+            self.client.get(self.url)
+            self.client.get(self.url)
+
+        # Assert
+        validate.assert_called_once()
+
+    def test_users_are_not_looked_up_on_each_request(self):
+        # Arrange
+        clear_caches()
+        with CaptureQueriesContext(connection) as first:
+            self.client.get(self.url)
+
+        # Act
+        with CaptureQueriesContext(connection) as second:
+            response = self.client.get(self.url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLess(len(second.captured_queries), len(first.captured_queries))
+
+    def test_deactivated_users_are_rejected(self):
+        # Arrange
+        self.client.get(self.url)
+        user = User.objects.get(username=self.user)
+        user.is_active = False
+        user.save()
+
+        # Act
+        response = self.client.get(self.url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ExpiringLRUCacheTest(MedPerfTest):
+    def test_expired_entries_are_not_returned(self):
+        # Arrange
+        cache = ExpiringLRUCache(maxsize=2)
+        with patch("user.backends.time.time", return_value=100):
+            cache.set("key", "value", expires_at=110)
+
+        # Act
+        with patch("user.backends.time.time", return_value=110):
+            value = cache.get("key")
+
+        # Assert
+        self.assertIsNone(value)
+
+    def test_least_recently_used_entries_are_dropped(self):
+        # Arrange
+        cache = ExpiringLRUCache(maxsize=2)
+        expires_at = float("inf")
+        cache.set("first", 1, expires_at)
+        cache.set("second", 2, expires_at)
+        cache.get("first")
+
+        # Act
+        cache.set("third", 3, expires_at)
+
+        # Assert
+        self.assertEqual(cache.get("first"), 1)
+        self.assertIsNone(cache.get("second"))
+        self.assertEqual(cache.get("third"), 3)
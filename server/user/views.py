@@ -21,7 +21,7 @@ class UserList(GenericAPIView):
         """
         List all users
         """
-        users = User.objects.all()
+        users = User.objects.select_related("userextension")
         users = self.paginate_queryset(users)
         serializer = UserSerializer(users, many=True)
         return self.get_paginated_response(serializer.data)
@@ -78,3 +78,20 @@ def should_auto_approve_model(benchmark, model, initiating_user):
         benchmark.model_auto_approval_mode,
         benchmark.model_auto_approval_allow_list,
     )
+
+
+def update_latest_association_status(association_model, status_model, **pair):
+    """Points the status row of an association pair (e.g. a benchmark and a dataset)
+    to the latest association of the pair, or deletes it if the pair has no
+    associations left. Must be called inside a transaction."""
+    # Lock the current status row so that concurrent updates of the same pair are
+    # serialized, and each one sees the associations committed before it.
+    status_model.objects.select_for_update().filter(**pair).first()
+    latest = association_model.objects.filter(**pair).order_by("-created_at").first()
+    if latest is None:
+        status_model.objects.filter(**pair).delete()
+        return
+    status_model.objects.update_or_create(
+        **pair,
+        defaults={"association": latest, "approval_status": latest.approval_status},
+    )
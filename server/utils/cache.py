@@ -0,0 +1,136 @@
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+KEY_PREFIX = "response_cache"
+HITS_KEY = f"{KEY_PREFIX}:hits"
+MISSES_KEY = f"{KEY_PREFIX}:misses"
+
+
+def __version_key(model, pk=None):
+    key = f"{KEY_PREFIX}:version:{model._meta.label_lower}"
+    if pk is not None:
+        key += f":{pk}"
+    return key
+
+
+def get_versions(dependencies):
+    """Returns the current version tokens of the given objects or collections.
+    Missing tokens (never set, or evicted) are replaced by new random ones, so that
+    data cached under a previous token can never be served again.
+
+    Args:
+        dependencies: list of (model, pk) tuples. A None pk refers to all the
+            objects of the model (e.g. for lists).
+
+    Returns:
+        list: the version tokens, in the order of the dependencies
+    """
+    keys = [__version_key(model, pk) for model, pk in dependencies]
+    versions = cache.get_many(keys)
+    missing = {key: uuid.uuid4().hex for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def invalidate(model, pk):
+    """Invalidates the cached responses that depend on an object of a model,
+    including the lists of that model."""
+    new_versions = {
+        __version_key(model, pk): uuid.uuid4().hex,
+        __version_key(model): uuid.uuid4().hex,
+    }
+    cache.set_many(new_versions, timeout=None)
+
+
+def register(model, condition=None):
+    """Invalidates the cached responses depending on instances of the model whenever
+    they are saved or deleted. If a condition is given, only the instances for which
+    it returns True invalidate the cached responses.
+
+    Responses are invalidated once the transaction is committed. Invalidating them
+    earlier would let concurrent requests cache the data from before the change under
+    the new versions."""
+
+    def invalidate_instance(sender, instance, **kwargs):
+        if condition is None or condition(instance):
+            pk = instance.pk
+            transaction.on_commit(lambda: invalidate(sender, pk))
+
+    uid = f"{KEY_PREFIX}:{model._meta.label_lower}"
+    post_save.connect(invalidate_instance, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(invalidate_instance, sender=model, weak=False, dispatch_uid=uid)
+
+
+def __count(key):
+    if cache.add(key, 1, timeout=None):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The counter was evicted in between
+        cache.set(key, 1, timeout=None)
+
+
+def cached_data(key, dependencies, build):
+    """Returns the data cached under the given key for the current versions of its
+    dependencies. On a miss, the data is built and cached.
+
+    Args:
+        key (str): identifies the response (e.g. the request url and serializer variant)
+        dependencies: list of (model, pk) tuples the data depends on. See get_versions.
+        build (callable): returns the data to cache
+
+    Returns:
+        the cached or built data
+    """
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return build()
+    versions = get_versions(dependencies)
+    digest = hashlib.sha256("|".join([key] + versions).encode()).hexdigest()
+    data_key = f"{KEY_PREFIX}:data:{digest}"
+    data = cache.get(data_key)
+    if data is not None:
+        __count(HITS_KEY)
+        return data
+    __count(MISSES_KEY)
+    data = build()
+    cache.set(data_key, data, timeout=settings.RESPONSE_CACHE_TIMEOUT)
+    return data
+
+
+class CachedSerializer:
+    """Wraps a serializer so that its data is read from the response cache.
+    The data is only evaluated (and looked up) when accessed."""
+
+    def __init__(self, serializer, key, dependencies):
+        self.serializer = serializer
+        self.key = key
+        self.dependencies = dependencies
+
+    @property
+    def data(self):
+        return cached_data(self.key, self.dependencies, lambda: self.serializer.data)
+
+
+def get_stats():
+    """Returns the number of hits and misses of the response cache"""
+    counters = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits = counters.get(HITS_KEY, 0)
+    misses = counters.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": hits / total if total else None,
+    }
+
+
+def reset_stats():
+    cache.delete_many([HITS_KEY, MISSES_KEY])
@@ -0,0 +1,52 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+
+def get_entity_etag(*instances, variant=""):
+    """Builds an ETag that changes whenever any of the given instances is modified.
+
+    Args:
+        instances: model instances whose content is part of the response. None values are skipped.
+        variant (str): distinguishes different representations of the same instances
+            (e.g. owner vs public serializers)
+
+    Returns:
+        str: the quoted ETag
+    """
+    parts = [variant] + [
+        f"{type(instance).__name__}:{instance.pk}:{instance.modified_at.isoformat()}"
+        for instance in instances
+        if instance is not None
+    ]
+    digest = hashlib.sha256("|".join(parts).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def conditional_response(request, serializer, *instances, variant=""):
+    """Returns 304 Not Modified if the client's copy (If-None-Match / If-Modified-Since)
+    is still current, otherwise the serialized data. Validators are attached to the response.
+
+    Args:
+        request: the incoming request
+        serializer: serializer of the instance. Its data is only evaluated if needed
+        instances: model instances whose content is part of the response
+        variant (str): distinguishes different representations of the same instances
+
+    Returns:
+        Response: the response to send
+    """
+    etag = get_entity_etag(*instances, variant=variant)
+    last_modified = max(
+        instance.modified_at.timestamp() for instance in instances if instance
+    )
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(last_modified)
+    )
+    if response is None:
+        response = Response(serializer.data)
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    return response
@@ -0,0 +1,147 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class LimitOffsetOrKeysetPagination(LimitOffsetPagination):
+    """Limit/offset pagination, with an opt-in keyset mode (`?pagination=keyset`).
+
+    In keyset mode, objects are ordered by (modified_at, id) and each page starts
+    right after the last object of the previous one, which is encoded in the
+    `cursor` of the `next` link. Retrieving a page doesn't need to scan the
+    previous ones, and concurrent writes don't shift the pages: an object modified
+    during the traversal is moved to its end, so it is returned again instead of
+    being skipped. Keyset pages have no `count` nor `previous` link, and the
+    `ordering` parameter is ignored.
+    """
+
+    mode_query_param = "pagination"
+    keyset_mode = "keyset"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        mode = request.query_params.get(self.mode_query_param)
+        # Lists computed in memory (e.g. aggregates) are always paginated by offset
+        self.keyset = mode == self.keyset_mode and isinstance(queryset, QuerySet)
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.limit = self.get_limit(request)
+        self.request = request
+        self.fields = self.get_keyset_fields(queryset)
+        queryset = queryset.order_by(*self.fields)
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.get_after_position_filter(position))
+
+        results = list(queryset[: self.limit + 1])
+        self.has_next = len(results) > self.limit
+        results = results[: self.limit]
+        self.last_position = None
+        if results:
+            last = results[-1]
+            self.last_position = [getattr(last, field) for field in self.fields]
+        return results
+
+    @staticmethod
+    def has_modified_at(queryset):
+        model_fields = {field.name for field in queryset.model._meta.get_fields()}
+        return "modified_at" in model_fields
+
+    def get_keyset_fields(self, queryset):
+        if self.has_modified_at(queryset):
+            return ["modified_at", "id"]
+        return ["id"]
+
+    def get_after_position_filter(self, position):
+        # (f1, f2) > (v1, v2)  <=>  f1 > v1 or (f1 = v1 and f2 > v2)
+        condition = Q(**{f"{self.fields[-1]}__gt": position[-1]})
+        for field, value in reversed(list(zip(self.fields[:-1], position[:-1]))):
+            condition = Q(**{f"{field}__gt": value}) | (Q(**{field: value}) & condition)
+        return condition
+
+    def encode_cursor(self, position):
+        values = [
+            value.isoformat() if hasattr(value, "isoformat") else value
+            for value in position
+        ]
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def decode_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if not isinstance(values, list) or len(values) != len(self.fields):
+                raise ValueError
+            position = []
+            for field, value in zip(self.fields, values):
+                if field == "modified_at":
+                    value = parse_datetime(value)
+                    if value is None:
+                        raise ValueError
+                elif not isinstance(value, int):
+                    raise ValueError
+                position.append(value)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        url = remove_query_param(url, self.offset_query_param)
+        cursor = self.encode_cursor(self.last_position)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", None),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        # Keyset pages don't include the count
+        response_schema["required"] = ["next", "previous", "results"]
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters += [
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Set to 'keyset' to paginate by (modified_at, id)",
+                "schema": {"type": "string", "enum": [self.keyset_mode]},
+            },
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Position of a keyset page, taken from the next link",
+                "schema": {"type": "string"},
+            },
+        ]
+        return parameters
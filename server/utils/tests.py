@@ -1,7 +1,10 @@
+from django.test import override_settings
 from rest_framework import status
 
 from medperf.tests import MedPerfTest
 
+from parameterized import parameterized
+
 
 class UserTest(MedPerfTest):
     def test_me_returns_current_user(self):
@@ -441,3 +444,336 @@ class EncryptedKeysTest(MedPerfTest):
         self.assertEqual(len(resp2), 1)
         self.assertEqual(resp1[0]["id"], key1["id"])
         self.assertEqual(resp2[0]["id"], key2["id"])
+
+
+class UserListsQueriesTest(MedPerfTest):
+    """Test module for the number of queries of the current user's lists"""
+
+    num_elements = 3
+
+    def setUp(self):
+        super(UserListsQueriesTest, self).setUp()
+        user = "user"
+        self.create_user(user)
+        prep, refmodel, _, benchmark = self.shortcut_create_benchmark(
+            user, user, user, user
+        )
+        self.set_credentials(user)
+        for i in range(self.num_elements):
+            model = self.mock_model(
+                name=f"model{i}",
+                container_config={f"model{i}": f"model{i}"},
+                state="OPERATION",
+            )
+            model = self.create_model(model).data
+            assoc = self.mock_model_association(benchmark["id"], model["id"])
+            self.create_model_association(assoc, user, user)
+
+            dataset = self.mock_dataset(
+                prep["id"], generated_uid=f"dataset{i}", state="OPERATION"
+            )
+            dataset = self.create_dataset(dataset).data
+            assoc = self.mock_dataset_association(benchmark["id"], dataset["id"])
+            self.create_dataset_association(assoc, user, user)
+            result = self.mock_result(benchmark["id"], refmodel["id"], dataset["id"])
+            self.create_result(result)
+
+    @parameterized.expand(
+        [
+            ("mlcubes/",),
+            ("models/",),
+            ("datasets/",),
+            ("results/",),
+            ("datasets/associations/",),
+            ("models/associations/",),
+        ]
+    )
+    def test_queries_are_independent_of_page_size(self, endpoint):
+        url = self.api_prefix + "/me/" + endpoint
+        self.assertListQueriesIndependentOfPageSize(url, self.num_elements)
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=True)
+class ResponseCacheTest(MedPerfTest):
+    """Test module for the cache of read-mostly endpoints"""
+
+    def setUp(self):
+        super(ResponseCacheTest, self).setUp()
+        bmk_owner = "bmk_owner"
+        other_user = "other_user"
+        self.create_user(bmk_owner)
+        self.create_user(other_user)
+        _, ref_model, _, benchmark = self.shortcut_create_benchmark(
+            bmk_owner, bmk_owner, bmk_owner, bmk_owner
+        )
+        self.bmk_owner = bmk_owner
+        self.other_user = other_user
+        self.benchmark = benchmark
+        self.ref_model = ref_model
+        self.stats_url = self.api_prefix + "/cache_stats/"
+        self.set_credentials(self.api_admin)
+        self.client.delete(self.stats_url)
+        self.set_credentials(None)
+
+    def get_stats(self):
+        backup_user = self.current_user
+        self.set_credentials(self.api_admin)
+        response = self.client.get(self.stats_url)
+        self.set_credentials(backup_user)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_repeated_detail_requests_are_served_from_cache(self):
+        # Arrange
+        self.set_credentials(self.other_user)
+        url = self.api_prefix + f"/benchmarks/{self.benchmark['id']}/"
+        first = self.client.get(url)
+
+        # Act
+        second = self.client.get(url)
+
+        # Assert
+        self.assertEqual(first.data, second.data)
+        stats = self.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_ratio"], 0.5)
+
+    def test_updates_invalidate_cached_details_and_lists(self):
+        # Arrange
+        self.set_credentials(self.bmk_owner)
+        url = self.api_prefix + f"/benchmarks/{self.benchmark['id']}/"
+        list_url = self.api_prefix + "/benchmarks/"
+        self.client.get(url)
+        self.client.get(list_url)
+
+        # Act
+        self.set_credentials(self.api_admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(url, {"is_valid": False}, format="json")
+        self.set_credentials(self.bmk_owner)
+        detail = self.client.get(url)
+        benchmarks = self.client.get(list_url)
+
+        # Assert
+        self.assertFalse(detail.data["is_valid"])
+        self.assertFalse(benchmarks.data["results"][0]["is_valid"])
+        self.assertEqual(self.get_stats()["hits"], 0)
+
+    def test_owner_and_public_views_are_cached_separately(self):
+        # Arrange
+        url = self.api_prefix + f"/benchmarks/{self.benchmark['id']}/"
+        self.set_credentials(self.other_user)
+        public = self.client.get(url)
+
+        # Act
+        self.set_credentials(self.bmk_owner)
+        owner = self.client.get(url)
+
+        # Assert
+        self.assertNotEqual(set(public.data.keys()), set(owner.data.keys()))
+        self.assertEqual(self.get_stats()["hits"], 0)
+
+    def test_container_updates_invalidate_cached_models(self):
+        # Arrange
+        self.set_credentials(self.bmk_owner)
+        url = self.api_prefix + f"/models/{self.ref_model['id']}/"
+        container_id = self.ref_model["container"]["id"]
+        container_url = self.api_prefix + f"/mlcubes/{container_id}/"
+        self.client.get(url)
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(container_url, {"is_valid": False}, format="json")
+        response = self.client.get(url)
+
+        # Assert
+        self.assertFalse(response.data["container"]["is_valid"])
+
+    def test_cached_responses_are_invalidated_only_after_commit(self):
+        # Arrange
+        self.set_credentials(self.bmk_owner)
+        url = self.api_prefix + f"/benchmarks/{self.benchmark['id']}/"
+        self.client.get(url)
+
+        # Act
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.set_credentials(self.api_admin)
+            self.client.put(url, {"is_valid": False}, format="json")
+            self.set_credentials(self.bmk_owner)
+            self.client.get(url)
+
+        # Assert
+        self.assertEqual(self.get_stats()["hits"], 1)
+        self.assertTrue(callbacks)
+
+    @override_settings(RESPONSE_CACHE_ENABLED=False)
+    def test_responses_are_not_cached_without_a_shared_cache(self):
+        # Arrange
+        self.set_credentials(self.other_user)
+        url = self.api_prefix + f"/benchmarks/{self.benchmark['id']}/"
+
+        # Act
+        self.client.get(url)
+        self.client.get(url)
+
+        # Assert
+        stats = self.get_stats()
+        self.assertEqual(stats["hits"], 0)
+        self.assertEqual(stats["misses"], 0)
+
+    def test_cache_stats_are_only_available_to_admins(self):
+        # Arrange
+        self.set_credentials(self.bmk_owner)
+
+        # Act
+        response = self.client.get(self.stats_url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class KeysetPaginationTest(MedPerfTest):
+    """Test module for the keyset pagination mode of list endpoints"""
+
+    num_mlcubes = 5
+
+    def setUp(self):
+        super(KeysetPaginationTest, self).setUp()
+        user = "user"
+        self.create_user(user)
+        self.set_credentials(user)
+        self.mlcubes = []
+        for i in range(self.num_mlcubes):
+            mlcube = self.mock_mlcube(
+                name=f"mlcube{i}", container_config={f"mlcube{i}": f"mlcube{i}"}
+            )
+            self.mlcubes.append(self.create_mlcube(mlcube).data)
+        self.url = self.api_prefix + "/me/mlcubes/"
+
+    def traverse(self, limit, between_pages=None):
+        ids = []
+        response = self.client.get(
+            self.url, {"pagination": "keyset", "limit": limit}
+        )
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            ids += [mlcube["id"] for mlcube in response.data["results"]]
+            if response.data["next"] is None:
+                return ids
+            if between_pages is not None:
+                between_pages()
+                between_pages = None
+            response = self.client.get(response.data["next"])
+
+    def test_keyset_pages_cover_all_objects_once(self):
+        # Act
+        ids = self.traverse(limit=2)
+
+        # Assert
+        self.assertEqual(ids, [mlcube["id"] for mlcube in self.mlcubes])
+
+    def test_objects_modified_during_traversal_are_not_skipped(self):
+        # Arrange
+        first_id = self.mlcubes[0]["id"]
+        last_id = self.mlcubes[-1]["id"]
+
+        def modify_objects():
+            for uid in [first_id, last_id]:
+                url = self.api_prefix + f"/mlcubes/{uid}/"
+                self.client.put(url, {"is_valid": False}, format="json")
+
+        # Act
+        ids = self.traverse(limit=2, between_pages=modify_objects)
+
+        # Assert
+        expected = [mlcube["id"] for mlcube in self.mlcubes[1:-1]]
+        self.assertEqual(ids, [first_id] + expected + [first_id, last_id])
+
+    def test_invalid_cursor_is_rejected(self):
+        # Act
+        response = self.client.get(
+            self.url, {"pagination": "keyset", "cursor": "invalid"}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_limit_offset_pagination_is_the_default(self):
+        # Act
+        response = self.client.get(self.url, {"limit": 2, "offset": 2})
+
+        # Assert
+        self.assertEqual(response.data["count"], self.num_mlcubes)
+        self.assertEqual(
+            [mlcube["id"] for mlcube in response.data["results"]],
+            [mlcube["id"] for mlcube in self.mlcubes[2:4]],
+        )
+
+
+class ModifiedSinceFilterTest(MedPerfTest):
+    """Test module for retrieving only the objects modified since a given time"""
+
+    num_mlcubes = 4
+
+    def setUp(self):
+        super(ModifiedSinceFilterTest, self).setUp()
+        user = "user"
+        self.create_user(user)
+        self.set_credentials(user)
+        self.mlcubes = []
+        for i in range(self.num_mlcubes):
+            mlcube = self.mock_mlcube(
+                name=f"mlcube{i}", container_config={f"mlcube{i}": f"mlcube{i}"}
+            )
+            self.mlcubes.append(self.create_mlcube(mlcube).data)
+
+    def get_ids(self, url, params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [mlcube["id"] for mlcube in response.data["results"]]
+
+    @parameterized.expand(
+        [
+            ("/mlcubes/", {}),
+            ("/mlcubes/", {"pagination": "keyset"}),
+            ("/mlcubes/", {"ordering": "-id"}),
+        ]
+    )
+    def test_only_objects_modified_after_the_given_time_are_returned(
+        self, endpoint, params
+    ):
+        # Arrange
+        since = self.mlcubes[1]["modified_at"]
+        url = self.api_prefix + endpoint
+
+        # Act
+        ids = self.get_ids(url, {**params, "modified_at__gt": since})
+
+        # Assert
+        self.assertEqual(
+            sorted(ids), sorted(mlcube["id"] for mlcube in self.mlcubes[2:])
+        )
+
+    def test_modified_objects_are_returned_again(self):
+        # Arrange
+        since = self.mlcubes[-1]["modified_at"]
+        modified_id = self.mlcubes[0]["id"]
+        url = self.api_prefix + f"/mlcubes/{modified_id}/"
+        self.client.put(url, {"is_valid": False}, format="json")
+
+        # Act
+        ids = self.get_ids(self.api_prefix + "/mlcubes/", {"modified_at__gt": since})
+
+        # Assert
+        self.assertEqual(ids, [modified_id])
+
+    def test_invalid_datetime_is_rejected(self):
+        # Act
+        response = self.client.get(
+            self.api_prefix + "/mlcubes/", {"modified_at__gt": "yesterday"}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -21,6 +21,7 @@ from django.db.models import Q
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework import status
 from drf_spectacular.utils import extend_schema, inline_serializer
 from rest_framework import serializers
 from training.models import TrainingExperiment
@@ -37,6 +38,8 @@ from certificate.models import Certificate
 from certificate.serializers import CertificateDetailSerializer
 from encrypted_key.models import EncryptedKey
 from encrypted_key.serializers import EncryptedKeyDetailSerializer
+from benchmark.permissions import IsAdmin
+from utils import cache as response_cache
 
 
 class User(GenericAPIView):
@@ -198,7 +201,9 @@ class ModelList(GenericAPIView):
 
     def get_object(self, pk):
         try:
-            return Model.objects.filter(owner__id=pk)
+            return Model.objects.filter(owner__id=pk).select_related(
+                "container", "asset"
+            )
         except Model.DoesNotExist:
             raise Http404
 
@@ -383,3 +388,33 @@ class ServerAPIVersion(GenericAPIView):
         """
         result = {"version": settings.SERVER_API_VERSION}
         return Response(result)
+
+
+class ResponseCacheStats(GenericAPIView):
+    permission_classes = [IsAdmin]
+    queryset = ""
+
+    @extend_schema(
+        responses={
+            200: inline_serializer(
+                name="ResponseCacheStatsResponse",
+                fields={
+                    "hits": serializers.IntegerField(),
+                    "misses": serializers.IntegerField(),
+                    "hit_ratio": serializers.FloatField(allow_null=True),
+                },
+            )
+        }
+    )
+    def get(self, request, format=None):
+        """
+        Retrieve hit and miss counts of the response cache
+        """
+        return Response(response_cache.get_stats())
+
+    def delete(self, request, format=None):
+        """
+        Reset hit and miss counts of the response cache
+        """
+        response_cache.reset_stats()
+        return Response(status=status.HTTP_204_NO_CONTENT)